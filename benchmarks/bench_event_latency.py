@@ -0,0 +1,129 @@
+"""
+WebSocket event-to-callback latency benchmark.
+
+Starts a local TLS WebSocket stand-in server in a separate process, with a throwaway
+self-signed certificate (generated with the `openssl` command line tool), and connects
+a TradeXWebSocketClient to it with certificate checks turned off. The server sends
+order events with a quiet gap between them; each event carries the wall-clock time it
+was written to the socket and the registered callback records how long it took to be
+called.
+
+Usage:
+    python benchmarks/bench_event_latency.py [events] [gap_ms]
+"""
+import base64
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import socket
+import ssl
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import fields
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradex_client import TradeXWebSocketClient
+from tradex_client.models import OrderBookData
+
+MAGIC = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+def make_certificate(directory):
+    certificate = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-keyout", key, "-out", certificate,
+         "-days", "1", "-subj", "/CN=localhost"],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return certificate, key
+
+def order_event(sent_at):
+    row = {}
+    for field in fields(OrderBookData):
+        if field.type is int:
+            row[field.name] = 1
+        elif field.type is float:
+            row[field.name] = 2500.5
+        else:
+            row[field.name] = "X"
+    row.update(exchange="NseCm", side="Buy", book="RL", product="CNC", validity="Day", reason=repr(sent_at))
+    for name in ("client_entry_time", "entry_at", "last_modified"):
+        row[name] = "2025-01-02T09:15:00.123456Z"
+    payload = json.dumps({"eventType": "order", "data": row}).encode()
+    return struct.pack("!BBH", 0x81, 126, len(payload)) + payload
+
+def serve(certificate, key, ports, count, gap):
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(certificate, key)
+    listener = socket.create_server(("127.0.0.1", 0))
+    ports.put(listener.getsockname()[1])
+    connection, _ = listener.accept()
+    # Without this, Nagle's algorithm on the server holds small events for the client's delayed ACK.
+    connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    with context.wrap_socket(connection, server_side=True) as tls:
+        request = b""
+        while b"\r\n\r\n" not in request:
+            request += tls.recv(4096)
+        key = [line.split(":", 1)[1].strip() for line in request.decode().split("\r\n") if line.lower().startswith("sec-websocket-key")][0]
+        accept = base64.b64encode(hashlib.sha1((key + MAGIC).encode()).digest()).decode()
+        tls.sendall(f"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n".encode())
+        time.sleep(0.2)
+        for _ in range(count):
+            time.sleep(gap)
+            tls.sendall(order_event(time.time()))
+        time.sleep(0.5)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    gap = (float(sys.argv[2]) if len(sys.argv) > 2 else 5) / 1000
+
+    with tempfile.TemporaryDirectory() as directory:
+        certificate, key = make_certificate(directory)
+        original_context = ssl.create_default_context
+        def unverified_context(*args, **kwargs):
+            context = original_context(*args, **kwargs)
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            return context
+        ssl.create_default_context = unverified_context
+
+        ports = multiprocessing.Queue()
+        server = multiprocessing.Process(target=serve, args=(certificate, key, ports, count, gap), daemon=True)
+        server.start()
+        port = ports.get(timeout=30)
+
+        latencies = []
+        done = threading.Event()
+        def on_order(order):
+            latencies.append(time.time() - float(order.reason))
+            if len(latencies) == count:
+                done.set()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            client = TradeXWebSocketClient("127.0.0.1", port, "token", "CLIENT", 1, 1)
+            client.register_callback("order", on_order)
+            client.start()
+            done.wait(count * gap + 30)
+            client.stop()
+            time.sleep(0.1)
+        ssl.create_default_context = original_context
+        server.join()
+
+    latencies.sort()
+    micros = [latency * 1e6 for latency in latencies]
+    print(f"Events: {len(micros)}/{count}  gap: {gap * 1000:.1f} ms")
+    print(f"{'p50 us':>10}{'p90 us':>10}{'p99 us':>10}{'max us':>10}{'mean us':>10}")
+    print(f"{micros[len(micros) // 2]:>10.0f}{micros[int(len(micros) * 0.9)]:>10.0f}{micros[int(len(micros) * 0.99)]:>10.0f}"
+          f"{micros[-1]:>10.0f}{statistics.mean(micros):>10.0f}")
+
+if __name__ == "__main__":
+    main()
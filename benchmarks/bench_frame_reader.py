@@ -0,0 +1,122 @@
+"""
+WebSocket frame reading benchmark over a local TLS connection.
+
+Starts a TLS server on localhost with a throwaway self-signed certificate (generated
+with the `openssl` command line tool) that streams unmasked text frames the size of an
+order event. The client reads them back, once with the previous per-field
+`recv(remaining)` loop and once with `recv_into` the buffer of a WebSocketProtocol, and
+reports frames per second.
+
+Usage:
+    python benchmarks/bench_frame_reader.py [frames] [payload_bytes]
+"""
+import os
+import socket
+import ssl
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradex_client import websocket_protocol
+from tradex_client.websocket_protocol import WebSocketProtocol
+
+def make_certificate(directory):
+    certificate = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-keyout", key, "-out", certificate,
+         "-days", "1", "-subj", "/CN=localhost"],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return certificate, key
+
+def text_frame(payload):
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x81, length)
+    elif length < 65536:
+        header = struct.pack("!BBH", 0x81, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x81, 127, length)
+    return header + payload
+
+def serve(listener, context, stream, frames_per_write):
+    connection, _ = listener.accept()
+    with context.wrap_socket(connection, server_side=True) as tls:
+        chunk = stream * frames_per_write
+        tls.sendall(chunk)
+        tls.recv(1)
+
+def read_exactly(sock, n):
+    # The reader used before recv_into: one recv loop per header field and payload.
+    data = bytearray()
+    remaining = n
+    start_time = time.time()
+    timeout = sock.gettimeout() or 30
+    while remaining > 0 and (time.time() - start_time) < timeout:
+        chunk = sock.recv(remaining)
+        if not chunk:
+            return None
+        data.extend(chunk)
+        remaining -= len(chunk)
+    return data
+
+def read_legacy(sock, count):
+    for _ in range(count):
+        header = read_exactly(sock, 2)
+        length = header[1] & 0x7F
+        if length == 126:
+            length = struct.unpack(">H", read_exactly(sock, 2))[0]
+        elif length == 127:
+            length = struct.unpack(">Q", read_exactly(sock, 8))[0]
+        read_exactly(sock, length)
+
+def read_buffered(sock, count):
+    protocol = WebSocketProtocol("localhost", 443)
+    # The stream starts with frames, so the handshake is taken as done.
+    protocol.state = websocket_protocol.OPEN
+    received = 0
+    while received < count:
+        nbytes = sock.recv_into(protocol.get_buffer())
+        if not nbytes:
+            return
+        received += len(protocol.buffer_updated(nbytes))
+
+def run(read, count, payload, certificate, key):
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(certificate, key)
+    client_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    client_context.check_hostname = False
+    client_context.verify_mode = ssl.CERT_NONE
+
+    listener = socket.create_server(("127.0.0.1", 0))
+    server = threading.Thread(target=serve, args=(listener, server_context, text_frame(payload), count), daemon=True)
+    server.start()
+    with client_context.wrap_socket(socket.create_connection(listener.getsockname()), server_hostname="localhost") as tls:
+        tls.settimeout(30)
+        started = time.perf_counter()
+        read(tls, count)
+        elapsed = time.perf_counter() - started
+        tls.send(b"x")
+    server.join()
+    listener.close()
+    return count / elapsed
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 600
+    payload = b'{"eventType":"order","data":{' + b"x" * max(size - 31, 0) + b"}}"
+    with tempfile.TemporaryDirectory() as directory:
+        certificate, key = make_certificate(directory)
+        print(f"Frames: {count}  payload: {len(payload)} B")
+        print(f"{'Reader':<24}{'frames/s':>14}")
+        for name, read in (("recv per field", read_legacy), ("recv_into protocol", read_buffered)):
+            print(f"{name:<24}{run(read, count, payload, certificate, key):>14,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Import-time benchmark for tradex_client.
+
+Runs `import tradex_client` in fresh interpreters and reports the wall time and how
+many times a .env file was parsed during the import and on first use of a request
+model default.
+
+Usage:
+    python benchmarks/bench_import.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r"""
+import sys, time
+sys.path.insert(0, sys.argv[1])
+import dotenv
+import dotenv.main
+
+env_loads = 0
+original_load_dotenv = dotenv.main.load_dotenv
+
+def counting_load_dotenv(*args, **kwargs):
+    global env_loads
+    env_loads += 1
+    return original_load_dotenv(*args, **kwargs)
+
+dotenv.load_dotenv = counting_load_dotenv
+dotenv.main.load_dotenv = counting_load_dotenv
+
+start = time.perf_counter()
+import tradex_client
+import_ms = (time.perf_counter() - start) * 1000
+import_loads = env_loads
+
+from tradex_client.models import NewOrderRequest
+for _ in range(1000):
+    NewOrderRequest(algol_id=0, book="RL", code="1", disclosed_qty=0, exchange="NseCm", gtd="", price=1,
+                    product="CNC", quantity=1, sender_order_no=1, side="Buy", trigger_price=0,
+                    validity="Day", order_flag=0)
+print(import_ms, import_loads, env_loads)
+"""
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    import_times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", PROBE, REPO_ROOT], capture_output=True, text=True, check=True).stdout
+        import_ms, import_loads, total_loads = output.split()
+        import_times.append(float(import_ms))
+
+    print(f"Runs                          : {runs}")
+    print(f"Import time median (ms)       : {statistics.median(import_times):.1f}")
+    print(f"Import time min (ms)          : {min(import_times):.1f}")
+    print(f".env parses during import     : {import_loads}")
+    print(f".env parses after 1000 models : {total_loads}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Instrumentation overhead benchmark.
+
+Feeds decoded order event messages straight to TradeXWebSocketClient's message
+handler, without a connection, with instrumentation disabled and enabled, and reports
+the cost per event and per recorded value. Prints the recorded decode and model
+percentiles at the end.
+
+Usage:
+    python benchmarks/bench_instrumentation.py [events]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradex_client import Instrumentation, TradeXWebSocketClient
+from bench_subscription_filter import order_message
+
+def run(client, messages):
+    started = time.perf_counter()
+    for message in messages:
+        client._handle_message(message)
+    elapsed = time.perf_counter() - started
+    client.dispatcher.stop()
+    client.dispatcher.start()
+    return elapsed / len(messages) * 1e6
+
+def record_cost(count):
+    instrumentation = Instrumentation(enabled=True)
+    started = time.perf_counter()
+    for value in range(count):
+        instrumentation.record("http", "bench", "network", value * 1000)
+    return (time.perf_counter() - started) / count * 1e6
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    messages = [order_message(str(number)) for number in range(count)]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        client = TradeXWebSocketClient("127.0.0.1", 0, "token", "CLIENT", callback_queue_size=count)
+        client.dispatcher.start()
+        client.subscribe("order", lambda order: None, overflow="block")
+        cases = [("disabled", run(client, messages))]
+        client.instrumentation.enable()
+        cases.append(("enabled", run(client, messages)))
+        client.dispatcher.stop()
+    cases.append(("record() alone", record_cost(count)))
+
+    print(f"Events: {count}")
+    print(f"{'Case':<24}{'us/event':>10}")
+    for name, micros in cases:
+        print(f"{name:<24}{micros:>10.2f}")
+
+    print()
+    print(f"{'Phase':<24}{'count':>8}{'p50 us':>10}{'p99 us':>10}{'max us':>10}")
+    for phase, stats in client.instrumentation.snapshot()["websocket"]["order"].items():
+        print(f"{phase:<24}{stats['count']:>8}{stats['p50'] * 1e6:>10.2f}{stats['p99'] * 1e6:>10.2f}{stats['max'] * 1e6:>10.2f}")
+
+if __name__ == "__main__":
+    main()
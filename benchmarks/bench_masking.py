@@ -0,0 +1,60 @@
+"""
+WebSocket masking throughput benchmark.
+
+Compares the byte-by-byte generator the client used before with mask_payload, with and
+without NumPy, for payloads from 100 B to 1 MB, and reports MB/s.
+
+Usage:
+    python benchmarks/bench_masking.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradex_client import websocket_mask
+from tradex_client.websocket_mask import mask_payload
+
+SIZES = (100, 1000, 10000, 100000, 1000000)
+
+def mask_bytewise(payload, mask):
+    return bytearray(b ^ mask[i % 4] for i, b in enumerate(payload))
+
+def mask_without_numpy(payload, mask):
+    numpy_module, checked = websocket_mask.np, websocket_mask._numpy_checked
+    websocket_mask.np, websocket_mask._numpy_checked = None, True
+    try:
+        return mask_payload(payload, mask)
+    finally:
+        websocket_mask.np, websocket_mask._numpy_checked = numpy_module, checked
+
+def throughput(function, payload, mask):
+    # Repeat each size for roughly the same number of bytes.
+    runs = max(1, 2000000 // len(payload))
+    best = None
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(runs):
+            function(payload, mask)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return len(payload) * runs / best / 1e6
+
+def main():
+    mask = os.urandom(4)
+    cases = [("bytewise", mask_bytewise), ("mask_payload (int)", mask_without_numpy)]
+    if websocket_mask._import_numpy() is not None:
+        cases.append(("mask_payload", mask_payload))
+
+    print("MB/s by payload size")
+    print(f"{'Implementation':<22}" + "".join(f"{size:>12,}" for size in SIZES))
+    for name, function in cases:
+        row = []
+        for size in SIZES:
+            payload = os.urandom(size)
+            row.append(throughput(function, payload, mask))
+        print(f"{name:<22}" + "".join(f"{value:>12,.1f}" for value in row))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Memory benchmark for the slot-based response models.
+
+Builds the same rows with each slot-based model and with a plain dataclass twin that
+keeps a per-instance __dict__, and reports bytes per row measured with tracemalloc.
+Field values are shared between rows so only the per-row object cost is measured.
+
+Usage:
+    python benchmarks/bench_model_memory.py [rows]
+"""
+import os
+import sys
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradex_client.models import HoldingsData, NetPositionData, OrderBookData, OrderHistoryData, TradesBookData
+
+TIMESTAMP = datetime(2025, 1, 2, 9, 15, 1, tzinfo=timezone.utc)
+
+OVERRIDES = {
+    "exchange": "NseCm",
+    "side": "Buy",
+    "book": "RL",
+    "product": "CNC",
+    "validity": "Day",
+}
+
+def sample_row(model):
+    row = {}
+    for field in fields(model):
+        if field.name in OVERRIDES:
+            row[field.name] = OVERRIDES[field.name]
+        elif field.type is datetime:
+            row[field.name] = TIMESTAMP
+        elif field.type is int:
+            row[field.name] = 10
+        elif field.type is float:
+            row[field.name] = 2500.5
+        elif field.type is Decimal:
+            row[field.name] = Decimal("2500.50")
+        else:
+            row[field.name] = "X"
+    return row
+
+def bytes_per_row(model, row, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rows = [model(**row) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rows
+    return (after - before) / count
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    print(f"Rows per model: {count}")
+    print(f"{'Model':<18}{'Fields':>8}{'__dict__ B/row':>16}{'slots B/row':>14}{'Saved':>8}")
+    for model in (OrderBookData, TradesBookData, OrderHistoryData, NetPositionData, HoldingsData):
+        row = sample_row(model)
+        dict_model = make_dataclass(model.__name__ + "Dict", [(field.name, field.type) for field in fields(model)])
+        with_dict = bytes_per_row(dict_model, row, count)
+        with_slots = bytes_per_row(model, row, count)
+        saved = 1 - with_slots / with_dict
+        print(f"{model.__name__:<18}{len(fields(model)):>8}{with_dict:>16.0f}{with_slots:>14.0f}{saved:>8.0%}")
+
+if __name__ == "__main__":
+    main()
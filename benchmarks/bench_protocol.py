@@ -0,0 +1,59 @@
+"""
+WebSocket protocol parsing benchmark, without sockets.
+
+Builds a stream of synthetic unmasked text frames the size of an order event and feeds
+it to WebSocketProtocol in chunks of different sizes, from a few bytes (frames split
+across many reads) to whole megabytes, and reports frames per second. Every chunk size
+must yield every frame.
+
+Usage:
+    python benchmarks/bench_protocol.py [frames] [payload_bytes]
+"""
+import os
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradex_client import websocket_protocol
+from tradex_client.websocket_protocol import WebSocketProtocol
+
+CHUNK_SIZES = (7, 256, 4096, 65536, 1048576)
+
+def text_frame(payload):
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x81, length)
+    elif length < 65536:
+        header = struct.pack("!BBH", 0x81, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x81, 127, length)
+    return header + payload
+
+def parse(stream, chunk_size):
+    protocol = WebSocketProtocol("localhost", 443)
+    protocol.state = websocket_protocol.OPEN
+    view = memoryview(stream)
+    frames = 0
+    started = time.perf_counter()
+    for offset in range(0, len(stream), chunk_size):
+        frames += len(protocol.feed(view[offset:offset + chunk_size]))
+    return frames, time.perf_counter() - started
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 600
+    payload = b'{"eventType":"order","data":{' + b"x" * max(size - 31, 0) + b"}}"
+    stream = text_frame(payload) * count
+
+    print(f"Frames: {count:,}  payload: {len(payload)} B  stream: {len(stream) / 1e6:,.1f} MB")
+    print(f"{'Chunk bytes':>12}{'frames/s':>14}{'MB/s':>10}")
+    for chunk_size in CHUNK_SIZES:
+        frames, elapsed = parse(stream, chunk_size)
+        if frames != count:
+            raise SystemExit(f"chunk size {chunk_size}: parsed {frames} of {count} frames")
+        print(f"{chunk_size:>12,}{frames / elapsed:>14,.0f}{len(stream) / elapsed / 1e6:>10,.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+WebSocket event routing benchmark.
+
+Feeds decoded order event messages straight to TradeXWebSocketClient's message
+handler, without a connection, and reports the cost per event when a subscriber wants
+it, when every subscriber filters it out before the model is built, and when nobody
+subscribes to the event type. Callbacks are no-ops on the dispatcher workers.
+
+Usage:
+    python benchmarks/bench_subscription_filter.py [events]
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from dataclasses import fields
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradex_client import TradeXWebSocketClient
+from tradex_client.models import OrderBookData
+
+def order_message(exchange_order_no):
+    row = {}
+    for field in fields(OrderBookData):
+        if field.type is int:
+            row[field.name] = 1
+        elif field.type is float:
+            row[field.name] = 2500.5
+        else:
+            row[field.name] = "X"
+    row.update(exchange="NseCm", side="Buy", book="RL", product="CNC", validity="Day", status="Pending",
+               exchange_order_no=exchange_order_no)
+    for name in ("client_entry_time", "entry_at", "last_modified"):
+        row[name] = "2025-01-02T09:15:00.123456Z"
+    return json.dumps({"eventType": "order", "data": row}).encode()
+
+def run(client, messages):
+    started = time.perf_counter()
+    for message in messages:
+        client._handle_message(message)
+    elapsed = time.perf_counter() - started
+    client.dispatcher.stop()
+    client.dispatcher.start()
+    return elapsed / len(messages) * 1e6
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    messages = [order_message(str(number)) for number in range(count)]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        client = TradeXWebSocketClient("127.0.0.1", 0, "token", "CLIENT", callback_queue_size=count)
+        client.dispatcher.start()
+        cases = []
+        subscription = client.subscribe("order", lambda order: None, exchange="NseCm", overflow="block")
+        cases.append(("subscriber wants it", run(client, messages)))
+        client.unsubscribe(subscription)
+        subscription = client.subscribe("order", lambda order: None, exchange="NseFO", overflow="block")
+        cases.append(("filtered out", run(client, messages)))
+        client.unsubscribe(subscription)
+        cases.append(("no subscriber", run(client, messages)))
+        client.dispatcher.stop()
+
+    print(f"Events: {count}")
+    print(f"{'Case':<24}{'us/event':>10}")
+    for name, micros in cases:
+        print(f"{name:<24}{micros:>10.2f}")
+
+if __name__ == "__main__":
+    main()
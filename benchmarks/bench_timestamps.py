@@ -0,0 +1,105 @@
+"""
+Timestamp decoding benchmark for order book responses.
+
+Builds a synthetic order book and times, per run:
+  - decoding every timestamp the way parse_list used to (replace "Z", fromisoformat)
+  - parse_timestamp, on this interpreter's path and on the normalising path used
+    before Python 3.11
+  - timestamp_ns, as used by the frames
+  - OrderBookData.parse_list on the whole book
+
+Each row carries the same timestamp in its three time fields, as an order that has not
+been modified does.
+
+Usage:
+    python benchmarks/bench_timestamps.py [rows]
+"""
+import os
+import random
+import sys
+import time
+from dataclasses import fields
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradex_client.models import OrderBookData
+from tradex_client.models import timestamps
+from tradex_client.models.timestamps import parse_timestamp, timestamp_ns
+
+TIME_FIELDS = ("client_entry_time", "entry_at", "last_modified")
+
+OVERRIDES = {
+    "exchange": "NseCm",
+    "side": "Buy",
+    "book": "RL",
+    "product": "CNC",
+    "validity": "Day",
+}
+
+def sample_book(count):
+    random.seed(1)
+    rows = []
+    for index in range(count):
+        row = {}
+        for field in fields(OrderBookData):
+            if field.name in OVERRIDES:
+                row[field.name] = OVERRIDES[field.name]
+            elif field.type is int:
+                row[field.name] = index
+            elif field.type is float:
+                row[field.name] = 2500.5
+            else:
+                row[field.name] = "X"
+        # A trading session: one order every few milliseconds from 09:15.
+        second = 33300 + index * 6 // 1000
+        stamp = f"2025-01-02T{second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}.{random.randint(0, 999999):06d}Z"
+        for name in TIME_FIELDS:
+            row[name] = stamp
+        rows.append(row)
+    return {"status": 200, "message": "OK", "data": rows}
+
+def clear_caches():
+    timestamps._last_datetime = (None, None)
+    timestamps._last_nanoseconds = (None, 0)
+
+def best_of(function, runs=5):
+    best = None
+    for _ in range(runs):
+        clear_caches()
+        started = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    response = sample_book(count)
+    values = [row[name] for row in response["data"] for name in TIME_FIELDS]
+
+    def normalising_path():
+        native = timestamps.NATIVE_ISO
+        timestamps.NATIVE_ISO = False
+        try:
+            return [parse_timestamp(value) for value in values]
+        finally:
+            timestamps.NATIVE_ISO = native
+
+    cases = [
+        ("fromisoformat + replace", lambda: [datetime.fromisoformat(value.replace("Z", "+00:00")) for value in values]),
+        ("parse_timestamp", lambda: [parse_timestamp(value) for value in values]),
+        ("parse_timestamp (pre-3.11)", normalising_path),
+        ("timestamp_ns", lambda: [timestamp_ns(value) for value in values]),
+        ("OrderBookData.parse_list", lambda: OrderBookData.parse_list(response)),
+    ]
+
+    print(f"Rows: {count}  timestamps: {len(values)}  Python: {sys.version.split()[0]}")
+    print(f"{'Case':<32}{'ms':>10}{'ns/value':>12}")
+    for name, function in cases:
+        elapsed = best_of(function)
+        per_value = elapsed / (count if name.endswith("parse_list") else len(values)) * 1e9
+        print(f"{name:<32}{elapsed * 1000:>10.1f}{per_value:>12.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,21 @@ from . import constants
 from . import exceptions
 
 from .tradex_api_client import TradeXClient
+from .tradex_async_api_client import AsyncTradeXClient
 from .tradex_websocket_client import TradeXWebSocketClient
+from .tradex_async_websocket_client import AsyncTradeXWebSocketClient
+from .order_gateway import OrderGateway, AsyncOrderGateway
+from .callback_dispatcher import CallbackDispatcher
+from .order_store import OrderStore
+from .position_engine import PositionEngine, AsyncPositionEngine
+from .event_resync import EventResync
+from .subscription_bus import SubscriptionBus, Subscription
+from .subscriber_queue import SubscriberQueue
+from .instrumentation import Instrumentation, LatencyHistogram
+from .log import enable_logging, disable_logging
+from .rate_limiter import RateLimiter, TokenBucket
+from .singleflight import SingleFlight, fresh_reads
+from .response_cache import ResponseCache
 
 from . import models
 
@@ -10,6 +24,27 @@ __all__ = [
     "constants",
     "exceptions",
     "TradeXClient",
+    "AsyncTradeXClient",
     "TradeXWebSocketClient",
+    "AsyncTradeXWebSocketClient",
+    "OrderGateway",
+    "AsyncOrderGateway",
+    "CallbackDispatcher",
+    "OrderStore",
+    "PositionEngine",
+    "AsyncPositionEngine",
+    "EventResync",
+    "SubscriptionBus",
+    "Subscription",
+    "SubscriberQueue",
+    "Instrumentation",
+    "LatencyHistogram",
+    "enable_logging",
+    "disable_logging",
+    "RateLimiter",
+    "TokenBucket",
+    "SingleFlight",
+    "fresh_reads",
+    "ResponseCache",
     "models"
 ]
\ No newline at end of file
@@ -0,0 +1,169 @@
+import logging
+import queue
+import threading
+import time
+
+from .instrumentation import WEBSOCKET
+
+logger = logging.getLogger(__name__)
+
+class CallbackDispatcher:
+    """
+    Fixed pool of worker threads that run WebSocket callbacks.
+
+    Each worker owns a bounded queue. Events are routed by their `user_order_no`, falling
+    back to `exchange_order_no`, so all events for one order (its order updates and its
+    trades) run one after another on the same worker, in the order they were received,
+    while different orders run in parallel. Events without an order number are routed by
+    their message type.
+
+    When a worker's queue is full, `dispatch` blocks until the worker catches up, which
+    in turn stops the receiver from reading further frames.
+
+    Attributes:
+        workers (int): Number of worker threads
+        queue_size (int): Maximum number of waiting events per worker
+        is_running (bool): Whether the workers are accepting events
+    """
+    def __init__(self, workers: int=4, queue_size: int=1000):
+        if workers <= 0:
+            raise ValueError("Number of callback workers must be greater than zero.")
+        if queue_size <= 0:
+            raise ValueError("Callback queue size must be greater than zero.")
+
+        self.workers = workers
+        self.queue_size = queue_size
+        self.is_running = False
+        self.queues = []
+        self.worker_threads = []
+        self.instrumentation = None
+        self.metrics_lock = threading.Lock()
+        self.reset_metrics()
+
+    def start(self):
+        if self.is_running:
+            return
+        self.is_running = True
+        self.queues = [queue.Queue(maxsize=self.queue_size) for _ in range(self.workers)]
+        self.worker_threads = [
+            threading.Thread(target=self._worker_loop, args=(events,), name=f"tradex-callback-{index}", daemon=True)
+            for index, events in enumerate(self.queues)
+        ]
+        for worker_thread in self.worker_threads:
+            worker_thread.start()
+
+    def stop(self, wait: bool=True):
+        """
+        Stop the workers after the events already queued have run.
+
+        Args:
+            wait (bool, optional): Block until the workers have finished. Defaults to True.
+        """
+        if not self.is_running:
+            return
+        self.is_running = False
+        for events in self.queues:
+            events.put(None)
+        if wait:
+            current = threading.current_thread()
+            for worker_thread in self.worker_threads:
+                if worker_thread is not current:
+                    worker_thread.join()
+        self.worker_threads = []
+
+    def dispatch(self, message_type: str, callback, data):
+        """
+        Queue `callback(data)` on the worker that owns the event's order.
+
+        Args:
+            message_type (str): Event type, used for routing when the event has no order number
+            callback (callable): Function to call with `data`
+            data: Event payload, a model instance or the decoded message dictionary
+
+        Raises:
+            RuntimeError: If the dispatcher is not running
+        """
+        if not self.is_running:
+            raise RuntimeError("Callback dispatcher is not running.")
+        # The user order number is set from the first event of an order, while the exchange
+        # order number stays empty until the exchange acknowledges it
+        if isinstance(data, dict):
+            key = data.get("user_order_no") or data.get("exchange_order_no")
+        else:
+            key = getattr(data, "user_order_no", None) or getattr(data, "exchange_order_no", None)
+        if not key:
+            key = message_type
+
+        events = self.queues[hash(key) % self.workers]
+        events.put((message_type, callback, data, time.monotonic()))
+
+        # Only the queue just filled can have grown, so the others need not be counted
+        depth = events.qsize()
+        with self.metrics_lock:
+            self.dispatched += 1
+            if depth > self.max_queue_depth:
+                self.max_queue_depth = depth
+
+    def queue_depth(self):
+        """
+        Return the number of events waiting across all workers.
+        """
+        return sum(events.qsize() for events in self.queues)
+
+    def get_metrics(self):
+        """
+        Return a snapshot of the dispatcher metrics.
+
+        Dispatch latency is the time an event waited between `dispatch` and the start of
+        its callback.
+
+        Returns:
+            dict: `queue_depth` (across all workers), `max_queue_depth` (of the deepest
+                worker queue), `dispatched`, `completed`, `failed`,
+                `mean_dispatch_latency` and `max_dispatch_latency` (seconds)
+        """
+        with self.metrics_lock:
+            return {
+                "queue_depth": self.queue_depth(),
+                "max_queue_depth": self.max_queue_depth,
+                "dispatched": self.dispatched,
+                "completed": self.completed,
+                "failed": self.failed,
+                "mean_dispatch_latency": self.total_dispatch_latency / self.completed if self.completed else 0.0,
+                "max_dispatch_latency": self.max_dispatch_latency
+            }
+
+    def reset_metrics(self):
+        with self.metrics_lock:
+            self.dispatched = 0
+            self.completed = 0
+            self.failed = 0
+            self.max_queue_depth = 0
+            self.total_dispatch_latency = 0.0
+            self.max_dispatch_latency = 0.0
+
+    def _worker_loop(self, events):
+        while True:
+            event = events.get()
+            if event is None:
+                return
+            message_type, callback, data, queued_at = event
+            latency = time.monotonic() - queued_at
+            failed = False
+            instrumentation = self.instrumentation
+            started = time.perf_counter_ns() if instrumentation is not None and instrumentation.enabled else 0
+            try:
+                callback(data)
+            except Exception as e:
+                failed = True
+                logger.error("Callback execution failed for %s: %s", message_type, e, exc_info=True)
+            if started:
+                instrumentation.record(WEBSOCKET, str(message_type), "callback", time.perf_counter_ns() - started)
+
+            with self.metrics_lock:
+                self.completed += 1
+                if failed:
+                    self.failed += 1
+                self.total_dispatch_latency += latency
+                if latency > self.max_dispatch_latency:
+                    self.max_dispatch_latency = latency
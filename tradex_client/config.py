@@ -0,0 +1,59 @@
+import os
+import threading
+
+_loaded_env_files = set()
+_load_lock = threading.Lock()
+
+def load_env(env_file: str='.env'):
+    """
+    Load an environment file into `os.environ` once per process.
+
+    Repeated calls for the same path are free, so every component can call this before
+    reading its settings without hitting the disk again.
+
+    Args:
+        env_file (str, optional): Path to the .env file. Defaults to '.env'.
+    """
+    path = os.path.abspath(env_file)
+    if path in _loaded_env_files:
+        return
+    with _load_lock:
+        if path in _loaded_env_files:
+            return
+        from dotenv import load_dotenv
+        load_dotenv(dotenv_path=path)
+        _loaded_env_files.add(path)
+
+def invalidate_env(env_file: str='.env'):
+    """
+    Mark an environment file as changed so the next `load_env` reads it again.
+
+    Args:
+        env_file (str, optional): Path to the .env file. Defaults to '.env'.
+    """
+    with _load_lock:
+        _loaded_env_files.discard(os.path.abspath(env_file))
+
+def get_setting(key: str, default: str=None, env_file: str='.env'):
+    """
+    Read a setting from the environment, loading the .env file on first use.
+
+    Args:
+        key (str): Name of the environment variable
+        default (str, optional): Value returned when the variable is not set. Defaults to None.
+        env_file (str, optional): Path to the .env file. Defaults to '.env'.
+
+    Returns:
+        str: The setting value, or `default`
+    """
+    load_env(env_file)
+    return os.environ.get(key, default)
+
+def default_client():
+    """
+    Default `client` for request models that are built without one.
+
+    Returns:
+        str: The CLIENT_ID setting, or None if it is not set
+    """
+    return get_setting("CLIENT_ID")
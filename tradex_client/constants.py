@@ -2,4 +2,64 @@ valid_exchanges = {"NseCm", "NseFO", "Bse", "BseFO", "NseCD", "MCX", "Ncdex", "B
 valid_sides = {"Buy", "Sell"}
 valid_products = {"Normal", "Intraday", "CNC", "MTF"}
 valid_books = {"RL", "SL", "PO", "CA2"}
-valid_validity = {"Day", "IOC", "GTD", "GTC", "EOD", "EOSES"}
\ No newline at end of file
+valid_validity = {"Day", "IOC", "GTD", "GTC", "EOD", "EOSES"}
+validation_policies = {"strict", "sampled", "trusted"}
+
+# (connect, read) timeouts in seconds. Order entry fails fast; book and portfolio downloads can be large.
+endpoint_timeouts = {
+    "NewOrder": (2, 3),
+    "ModifyOrder": (2, 3),
+    "CancelOrder": (2, 3),
+    "CancelAllOrders": (2, 5),
+    "NewGTTOrder": (2, 5),
+    "ModifyGTTOrder": (2, 5),
+    "CancelGTTOrder": (2, 5),
+    "ExecuteBasket": (2, 5),
+    "OrderStatus": (2, 5),
+    "OrderBook": (3, 15),
+    "TradeBook": (3, 15),
+    "GttOrdersBook": (3, 15),
+    "OrderHistory": (3, 15),
+    "Holdings": (3, 15),
+    "NetPositions": (3, 15),
+}
+
+# Rate limiter priorities in "priority" mode, lower first. Endpoints not listed are reads and go last.
+endpoint_priorities = {
+    "CancelOrder": 0,
+    "CancelAllOrders": 0,
+    "CancelGTTOrder": 0,
+    "NewOrder": 1,
+    "ModifyOrder": 1,
+    "NewGTTOrder": 1,
+    "ModifyGTTOrder": 1,
+    "ExecuteBasket": 1,
+    "ModifyProduct": 1,
+}
+
+# Seconds a response may be served from the response cache, by endpoint. Endpoints not listed are not cached.
+cache_ttls = {
+    "ExchangeStatus": 30,
+    "UserProfile": 300,
+    "Holdings": 60,
+    "FundsReport": 5,
+}
+
+# Cached endpoints whose responses a WebSocket event makes stale
+event_cache_invalidations = {
+    "order": ("OrderBook", "GttOrdersBook", "FundsReport"),
+    "trade": ("OrderBook", "TradeBook", "NetPositions", "Holdings", "FundsReport"),
+}
+
+# Cached endpoints whose responses a request to the endpoint makes stale
+endpoint_cache_invalidations = {
+    "NewOrder": ("OrderBook", "FundsReport"),
+    "ModifyOrder": ("OrderBook", "FundsReport"),
+    "CancelOrder": ("OrderBook", "FundsReport"),
+    "CancelAllOrders": ("OrderBook", "FundsReport"),
+    "ExecuteBasket": ("OrderBook", "FundsReport"),
+    "NewGTTOrder": ("GttOrdersBook",),
+    "ModifyGTTOrder": ("GttOrdersBook",),
+    "CancelGTTOrder": ("GttOrdersBook",),
+    "ModifyProduct": ("NetPositions", "Holdings", "FundsReport"),
+}
@@ -0,0 +1,173 @@
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .models.timestamps import parse_timestamp
+from .singleflight import fresh_reads
+
+logger = logging.getLogger(__name__)
+
+def order_key(order):
+    """
+    Return the key an order's state is tracked under: its `exchange_order_no`, or its
+    `user_order_no` until the exchange has acknowledged it.
+    """
+    return order.exchange_order_no or order.user_order_no
+
+def order_event_key(order):
+    return ("order", order_key(order), order.status, order.qty_traded, order.last_modified)
+
+def trade_event_key(trade):
+    return ("trade", trade.exchange, trade.trade_no)
+
+class EventResync:
+    """
+    Recovers the order and trade events missed while the WebSocket was disconnected.
+
+    Every event received is recorded by `observe`. Event keys go into a bounded LRU,
+    so an event the server delivers twice is suppressed, and the last state of each
+    order (by `exchange_order_no`) is kept.
+
+    After the first connection the order book and trades book are fetched once as a
+    baseline. After every reconnection they are fetched again, concurrently, and
+    diffed against what was seen: order rows whose state differs from the last state
+    seen, and is not older, are replayed as `order` events, and trades not seen before
+    as `trade` events, through the same path as live events. Replays are sorted by
+    `last_modified` and `trade_time`.
+
+    The LRU should hold more keys than a day's events, or trades evicted from it are
+    replayed again by the next resync.
+
+    Attributes:
+        client (TradeXClient): Client used to fetch the books
+        websocket_client (TradeXWebSocketClient): Client whose callbacks receive the replays
+        capacity (int): Maximum number of event keys remembered
+        duplicates (int): Number of received events suppressed as duplicates
+        replayed (int): Number of events replayed by resyncs
+        resyncs (int): Number of completed resyncs, the baseline included
+    """
+    def __init__(self, client, websocket_client, capacity: int=100000):
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than zero.")
+        self.client = client
+        self.websocket_client = websocket_client
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.seen = OrderedDict()
+        self.order_states = {}
+        self.duplicates = 0
+        self.replayed = 0
+        self.resyncs = 0
+        self.resync_thread = None
+
+    def observe(self, message_type, data: dict):
+        """
+        Record a received event from its decoded `data` dictionary, before any model is built.
+
+        Returns:
+            bool: False if the event was seen before and should be dropped, True otherwise
+        """
+        if message_type == "order":
+            tracked_as = data.get("exchange_order_no") or data.get("user_order_no")
+            state = (data.get("status"), data.get("qty_traded"), parse_timestamp(data.get("last_modified")))
+            key = ("order", tracked_as) + state
+        elif message_type == "trade":
+            key = ("trade", data.get("exchange"), data.get("trade_no"))
+        else:
+            return True
+        with self.lock:
+            if not self._remember(key):
+                self.duplicates += 1
+                return False
+            if message_type == "order":
+                self.order_states[tracked_as] = state
+            return True
+
+    def schedule(self, replay: bool):
+        """
+        Run a resync on a background thread; a baseline only when `replay` is False.
+        """
+        self.resync_thread = threading.Thread(target=self._run, args=(replay,), name="tradex-resync", daemon=True)
+        self.resync_thread.start()
+
+    def resync(self, replay: bool=True, deadline: float=None):
+        """
+        Fetch the order book and trades book concurrently and replay what was missed.
+
+        Args:
+            replay (bool, optional): Replay missed events; False only records the books
+                as seen. Defaults to True.
+            deadline (float, optional): Latency budget in seconds for each request. Defaults to None.
+
+        Returns:
+            int: Number of events replayed
+        """
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="tradex-resync") as executor:
+            orders = executor.submit(self._fetch, self.client._fetch_order_book, 'All', deadline=deadline)
+            trades = executor.submit(self._fetch, self.client.get_trades_book, deadline=deadline)
+            orders = orders.result().data
+            trades = trades.result().data
+
+        missed = []
+        with self.lock:
+            for order in orders:
+                if self._is_new_state(order) and self._remember(order_event_key(order)):
+                    self._update_order_state(order)
+                    missed.append(("order", order))
+            for trade in trades:
+                if self._remember(trade_event_key(trade)):
+                    missed.append(("trade", trade))
+            self.resyncs += 1
+
+        if not replay:
+            return 0
+        missed.sort(key=lambda event: self._event_time(*event))
+        for message_type, data in missed:
+            self.websocket_client._dispatch_event(message_type, data)
+        self.replayed += len(missed)
+        return len(missed)
+
+    def _run(self, replay):
+        try:
+            replayed = self.resync(replay)
+            if replay:
+                logger.info("Replayed %d missed events", replayed)
+        except Exception as e:
+            logger.warning("Event resync failed: %s", e)
+
+    def _fetch(self, fetch, *args, **kwargs):
+        # A request already in flight may predate the reconnection, so send a new one
+        with fresh_reads():
+            return fetch(*args, **kwargs)
+
+    def _remember(self, key):
+        """Add a key to the LRU. Returns False if it was already there. Called with lock held."""
+        if key in self.seen:
+            self.seen.move_to_end(key)
+            return False
+        self.seen[key] = None
+        if len(self.seen) > self.capacity:
+            self.seen.popitem(last=False)
+        return True
+
+    def _is_new_state(self, order):
+        previous = self.order_states.get(order_key(order))
+        if previous is None:
+            return True
+        if (order.status, order.qty_traded, order.last_modified) == previous:
+            return False
+        last_modified = previous[2]
+        if order.last_modified is None or last_modified is None:
+            return True
+        try:
+            return order.last_modified >= last_modified
+        except TypeError:
+            return True
+
+    def _update_order_state(self, order):
+        self.order_states[order_key(order)] = (order.status, order.qty_traded, order.last_modified)
+
+    def _event_time(self, message_type, data):
+        timestamp = data.last_modified if message_type == "order" else data.trade_time
+        return timestamp.timestamp() if timestamp is not None else 0.0
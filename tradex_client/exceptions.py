@@ -32,3 +32,13 @@ class TradeXDataFetchError(TradeXAPIError):
 class TradeXInvalidResponseError(TradeXAPIError):
     """Raised when API returns an invalid or unexpected response."""
     pass
+
+
+class TradeXTimeoutError(TradeXAPIError):
+    """Raised when a request times out or its deadline is spent before a response arrives."""
+    pass
+
+
+class TradeXRateLimitError(TradeXAPIError):
+    """Raised when the client-side rate limiter rejects a request in non-blocking mode."""
+    pass
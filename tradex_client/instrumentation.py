@@ -0,0 +1,337 @@
+import contextvars
+import functools
+import inspect
+import threading
+import time
+
+# Log-linear buckets: exact below 2**SUB_BUCKET_BITS nanoseconds, then 16 buckets per
+# power of two, so any recorded value is off by at most about 3%.
+SUB_BUCKET_BITS = 5
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+HALF_SUB_BUCKET_COUNT = SUB_BUCKET_COUNT >> 1
+BUCKET_COUNT = SUB_BUCKET_COUNT + (64 - SUB_BUCKET_BITS) * HALF_SUB_BUCKET_COUNT
+
+HTTP = "http"
+WEBSOCKET = "websocket"
+
+def bucket_index(value: int):
+    if value < SUB_BUCKET_COUNT:
+        return value if value > 0 else 0
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return SUB_BUCKET_COUNT + (shift - 1) * HALF_SUB_BUCKET_COUNT + (value >> shift) - HALF_SUB_BUCKET_COUNT
+
+def bucket_upper_bound(index: int):
+    if index < SUB_BUCKET_COUNT:
+        return index
+    shift, sub_bucket = divmod(index - SUB_BUCKET_COUNT, HALF_SUB_BUCKET_COUNT)
+    return ((sub_bucket + HALF_SUB_BUCKET_COUNT + 1) << (shift + 1)) - 1
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of durations in nanoseconds.
+
+    Values are counted in log-linear buckets, so recording is a bucket increment and
+    the memory used does not grow with the number of values. Percentiles are reported
+    as the upper bound of their bucket.
+
+    Attributes:
+        count (int): Number of recorded values
+        total (int): Sum of the recorded values
+        min (int): Smallest recorded value, or None
+        max (int): Largest recorded value, or None
+    """
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.clear()
+
+    def clear(self):
+        for index in range(BUCKET_COUNT):
+            self.counts[index] = 0
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def record(self, value: int):
+        self.counts[bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def percentile(self, percentile: float):
+        """
+        Return the value at or below which `percentile` percent of the values fall, in nanoseconds.
+        """
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * percentile // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(bucket_upper_bound(index), self.max)
+        return self.max
+
+    def get_dict(self):
+        """
+        Return the summary statistics in seconds.
+        """
+        return {
+            "count": self.count,
+            "mean": self.total / self.count / 1e9 if self.count else 0.0,
+            "min": (self.min or 0) / 1e9,
+            "p50": self.percentile(50) / 1e9,
+            "p90": self.percentile(90) / 1e9,
+            "p99": self.percentile(99) / 1e9,
+            "p999": self.percentile(99.9) / 1e9,
+            "max": (self.max or 0) / 1e9
+        }
+
+class CallTiming:
+    """Marks taken during one endpoint call, shared between `timed_endpoint` and `_post`."""
+    __slots__ = ("started", "endpoint", "post_entered", "serialize", "post_returned")
+
+    def __init__(self, started: int):
+        self.started = started
+        self.endpoint = None
+        self.post_entered = 0
+        self.serialize = 0
+        self.post_returned = 0
+
+current_call = contextvars.ContextVar("tradex_current_call", default=None)
+
+class RequestTiming:
+    """
+    Marks taken by `_post` for one request: call `serialized`, `received` and `decoded` in turn,
+    after `throttled` if the request went through the rate limiter.
+    """
+    __slots__ = ("instrumentation", "endpoint", "call", "mark", "network")
+
+    def __init__(self, instrumentation, endpoint: str):
+        self.instrumentation = instrumentation
+        self.endpoint = endpoint
+        self.call = current_call.get()
+        self.mark = time.perf_counter_ns()
+        self.network = 0
+        if self.call is not None:
+            self.call.endpoint = endpoint
+            self.call.post_entered = self.mark
+
+    def serialized(self):
+        now = time.perf_counter_ns()
+        if self.call is not None:
+            self.call.serialize = now - self.mark
+        else:
+            self.instrumentation.record(HTTP, self.endpoint, "serialize", now - self.mark)
+        self.mark = now
+
+    def throttled(self):
+        now = time.perf_counter_ns()
+        self.instrumentation.record(HTTP, self.endpoint, "throttle", now - self.mark)
+        self.mark = now
+
+    def received(self):
+        now = time.perf_counter_ns()
+        self.network = now - self.mark
+        self.mark = now
+
+    def decoded(self):
+        now = time.perf_counter_ns()
+        self.instrumentation.record(HTTP, self.endpoint, "network", self.network)
+        self.instrumentation.record(HTTP, self.endpoint, "decode", now - self.mark)
+        if self.call is not None:
+            self.call.post_returned = time.perf_counter_ns()
+
+class Instrumentation:
+    """
+    Latency histograms for the REST and WebSocket hot paths.
+
+    REST calls are recorded per endpoint in four phases: "serialize" (request model to
+    JSON body), "network" (sending the request until the body is received), "decode"
+    (JSON parsing) and "model" (building the response models), plus "throttle" (waiting
+    for the client-side rate limiter) when one is enabled. The WebSocket client
+    records "read" (receiving and framing), "decode", "model" and "callback" per event
+    type.
+
+    Each thread records into its own histograms, so recording takes no lock; `snapshot`
+    merges them. The histograms of threads that have exited, such as the workers of a
+    short-lived thread pool, are folded into one histogram per key whenever a histogram
+    is added and on `snapshot` and `reset`, so their number does not grow with the
+    number of threads. Hooks added with `add_hook` are called as
+    `hook(category, name, phase, duration_ns)` for every value recorded, on the
+    recording thread, and must be quick.
+
+    Instrumentation starts disabled. While disabled every measuring site costs one
+    attribute check and nothing is recorded.
+
+    Attributes:
+        enabled (bool): Whether timings are recorded
+    """
+    def __init__(self, enabled: bool=False):
+        self.enabled = enabled
+        self.hooks = ()
+        self.local = threading.local()
+        self.registry_lock = threading.Lock()
+        self.registry = []
+        self.retired = {}
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def add_hook(self, hook):
+        """
+        Call `hook(category, name, phase, duration_ns)` for every recorded value.
+        """
+        with self.registry_lock:
+            self.hooks = self.hooks + (hook,)
+
+    def remove_hook(self, hook):
+        with self.registry_lock:
+            self.hooks = tuple(item for item in self.hooks if item is not hook)
+
+    def record(self, category: str, name: str, phase: str, duration_ns: int):
+        """
+        Record one duration.
+
+        Args:
+            category (str): "http" or "websocket"
+            name (str): Endpoint or event type
+            phase (str): Phase of the call, e.g. "network" or "callback"
+            duration_ns (int): Duration in nanoseconds
+        """
+        histograms = getattr(self.local, "histograms", None)
+        if histograms is None:
+            histograms = self.local.histograms = {}
+        key = (category, name, phase)
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = LatencyHistogram()
+            with self.registry_lock:
+                self._retire_finished_threads()
+                self.registry.append((threading.current_thread(), key, histogram))
+        histogram.record(duration_ns)
+        for hook in self.hooks:
+            hook(category, name, phase, duration_ns)
+
+    def snapshot(self):
+        """
+        Return the merged statistics of every histogram.
+
+        Returns:
+            dict: {category: {name: {phase: statistics}}}, where statistics holds
+                `count`, `mean`, `min`, `p50`, `p90`, `p99`, `p999` and `max` in seconds
+        """
+        merged = {}
+        with self.registry_lock:
+            self._retire_finished_threads()
+            registry = [(key, histogram) for _, key, histogram in self.registry]
+            registry.extend(self.retired.items())
+        for key, histogram in registry:
+            if key not in merged:
+                merged[key] = LatencyHistogram()
+            merged[key].merge(histogram)
+
+        result = {}
+        for (category, name, phase), histogram in sorted(merged.items()):
+            result.setdefault(category, {}).setdefault(name, {})[phase] = histogram.get_dict()
+        return result
+
+    def reset(self):
+        """
+        Clear every histogram and drop those of threads that have exited. Values recorded
+        while the reset runs may survive it.
+        """
+        with self.registry_lock:
+            self.registry = [entry for entry in self.registry if entry[0].is_alive()]
+            self.retired = {}
+            registry = list(self.registry)
+        for _, _, histogram in registry:
+            histogram.clear()
+
+    def _retire_finished_threads(self):
+        """Merge the histograms of exited threads into `retired`. Called with registry_lock held."""
+        live = []
+        for entry in self.registry:
+            thread, key, histogram = entry
+            if thread.is_alive():
+                live.append(entry)
+                continue
+            retired = self.retired.get(key)
+            if retired is None:
+                retired = self.retired[key] = LatencyHistogram()
+            retired.merge(histogram)
+        self.registry = live
+
+    def begin_request(self, endpoint: str):
+        """
+        Start timing a request to `endpoint`; see RequestTiming.
+        """
+        return RequestTiming(self, endpoint)
+
+    def finish_call(self, call: CallTiming):
+        """
+        Record the serialize and model phases of a finished endpoint call.
+        """
+        if call.endpoint is None:
+            return
+        finished = time.perf_counter_ns()
+        self.record(HTTP, call.endpoint, "serialize", call.post_entered - call.started + call.serialize)
+        self.record(HTTP, call.endpoint, "model", finished - call.post_returned)
+
+def timed_endpoint(method):
+    """
+    Decorate a client endpoint method so that its time outside `_post` is recorded.
+
+    The time before the request is sent counts as serialization and the time after the
+    response is decoded as model construction. Works for plain and coroutine methods.
+    """
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            instrumentation = self.instrumentation
+            if not instrumentation.enabled:
+                return await method(self, *args, **kwargs)
+            call = CallTiming(time.perf_counter_ns())
+            token = current_call.set(call)
+            try:
+                result = await method(self, *args, **kwargs)
+            finally:
+                current_call.reset(token)
+            instrumentation.finish_call(call)
+            return result
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        instrumentation = self.instrumentation
+        if not instrumentation.enabled:
+            return method(self, *args, **kwargs)
+        call = CallTiming(time.perf_counter_ns())
+        token = current_call.set(call)
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            current_call.reset(token)
+        instrumentation.finish_call(call)
+        return result
+    return wrapper
@@ -0,0 +1,36 @@
+import logging
+import sys
+
+# Every module logs to a child of this logger, e.g. "tradex_client.tradex_websocket_client"
+logger = logging.getLogger("tradex_client")
+
+log_format = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+def enable_logging(level=logging.INFO, stream=None):
+    """
+    Send the client's log records to a stream, for applications that do not configure logging.
+
+    Messages are formatted lazily by the logging module, so records below `level` cost
+    one level check and no string work. Applications that configure logging themselves
+    (e.g. with `logging.basicConfig`) do not need this; the records are then handled like
+    any other library's.
+
+    Args:
+        level (int, optional): Lowest level to emit, e.g. logging.DEBUG for every
+            received event and response body. Defaults to logging.INFO.
+        stream (file, optional): Stream to write to. Defaults to sys.stderr.
+
+    Returns:
+        logging.Handler: The handler added, for `disable_logging`
+    """
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(logging.Formatter(log_format))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    return handler
+
+def disable_logging(handler):
+    """
+    Remove a handler added by `enable_logging`.
+    """
+    logger.removeHandler(handler)
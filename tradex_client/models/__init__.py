@@ -4,6 +4,7 @@ from .cancel_order import CancelOrderRequest, CancelOrderData, CancelOrderRespon
 from .convert_position import ConvertPositionRequest,ConvertPositionData, ConvertPositionResponse
 from .exchange_status import ExchangeStatusData, ExchangeStatusResponse
 from .execute_basket_orders import ExecuteBasketOrderRequest, ExecuteBasketData, ExecuteBasketResponse
+from .frames import ColumnFrame, OrderBookFrame, TradesFrame, NetPositionFrame, HoldingsFrame
 from .funds_report import FundsReportData, FundsReportResponse
 from .gtt_order_book import GTTOrderBookData, GTTOrdersBookResponse
 from .holdings import HoldingsData, HoldingsResponse
@@ -16,6 +17,7 @@ from .new_order import NewOrderRequest, NewOrderData, NewOrderResponse
 from .order_history import OrderHistoryRequest, OrderHistoryData, OrderHistoryResponse
 from .order_status import OrderStatusRequest, OrderStatusData, OrderStatusResponse
 from .orders_book import OrderBookData, OrderBookResponse
+from .portfolio_snapshot import PortfolioSnapshot
 from .positions import NetPositionData, NetPositionResponse
 from .trades_book import TradesBookData, TradesBookResponse
 from .user_profile import UserProfileData, UserProfileResponse
@@ -27,6 +29,7 @@ __all__ = [
     "ConvertPositionRequest", "ConvertPositionData", "ConvertPositionResponse",
     "ExchangeStatusData", "ExchangeStatusResponse",
     "ExecuteBasketOrderRequest", "ExecuteBasketData", "ExecuteBasketResponse",
+    "ColumnFrame", "OrderBookFrame", "TradesFrame", "NetPositionFrame", "HoldingsFrame",
     "FundsReportData", "FundsReportResponse",
     "GTTOrderBookData", "GTTOrdersBookResponse",
     "HoldingsData", "HoldingsResponse",
@@ -39,6 +42,7 @@ __all__ = [
     "OrderHistoryRequest", "OrderHistoryData", "OrderHistoryResponse",
     "OrderStatusRequest", "OrderStatusData", "OrderStatusResponse",
     "OrderBookData", "OrderBookResponse",
+    "PortfolioSnapshot",
     "NetPositionData", "NetPositionResponse",
     "TradesBookData", "TradesBookResponse",
     "UserProfileData", "UserProfileResponse",
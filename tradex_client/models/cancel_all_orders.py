@@ -1,18 +1,14 @@
 from ..constants import valid_exchanges
 
 from dataclasses import dataclass, asdict, field
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-DEFAULT_CLIENT = os.getenv("CLIENT_ID")
+from .slots import with_slots
+from ..config import default_client
 
 @dataclass
 class CancelAllOrderRequest:
     code: int
     exchange: str
-    client: str = field(default_factory=lambda: DEFAULT_CLIENT)
+    client: str = field(default_factory=default_client)
     
     def __post_init__(self):
         if self.exchange not in valid_exchanges:
@@ -21,6 +17,7 @@ class CancelAllOrderRequest:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class CancelAllOrderResponse:
     status: int
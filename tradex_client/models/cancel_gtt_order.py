@@ -1,7 +1,9 @@
 from dataclasses import dataclass, asdict
+from .slots import with_slots
 from datetime import datetime
 from typing import Optional
 
+@with_slots
 @dataclass
 class CancelGTTOrderData:
     client: str
@@ -44,6 +46,7 @@ class CancelGTTOrderData:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class CancelGTTOrderResponse:
     status: int
@@ -1,13 +1,9 @@
 from ..constants import valid_exchanges
 
 from dataclasses import dataclass, asdict, field
+from .slots import with_slots
 from typing import Optional
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-DEFAULT_CLIENT = os.getenv("CLIENT_ID")
+from ..config import default_client
 
 @dataclass
 class CancelOrderRequest:
@@ -16,7 +12,7 @@ class CancelOrderRequest:
     exchange_order_no: str
     user_order_no: int
     sender_order_no: int
-    client: str = field(default_factory=lambda: DEFAULT_CLIENT)
+    client: str = field(default_factory=default_client)
     
     def __post_init__(self):
         if self.exchange not in valid_exchanges:
@@ -25,6 +21,7 @@ class CancelOrderRequest:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class CancelOrderData:
     client: str
@@ -35,6 +32,7 @@ class CancelOrderData:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class CancelOrderResponse:
     status: str
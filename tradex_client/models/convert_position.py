@@ -1,13 +1,9 @@
 from ..constants import valid_exchanges, valid_products, valid_sides
 
 from dataclasses import dataclass, asdict, field
+from .slots import with_slots
 from typing import Optional, Any
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-DEFAULT_CLIENT = os.getenv("CLIENT_ID")
+from ..config import default_client
 
 @dataclass
 class ConvertPositionRequest:
@@ -17,7 +13,7 @@ class ConvertPositionRequest:
     old_product: str
     qty: int
     side: str
-    client: str = field(default_factory=lambda: DEFAULT_CLIENT)
+    client: str = field(default_factory=default_client)
     
     def __post_init__(self):
         if self.exchange not in valid_exchanges:
@@ -38,6 +34,7 @@ class ConvertPositionRequest:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class ConvertPositionData:
     status: str
@@ -47,6 +44,7 @@ class ConvertPositionData:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class ConvertPositionResponse:
     status: int
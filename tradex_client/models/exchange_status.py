@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field, asdict
+from .slots import with_slots
+from .validation import STRICT, validation_policy
 from typing import List
 
+@with_slots
 @dataclass
 class ExchangeStatusData:
     exchange: str
@@ -11,15 +14,17 @@ class ExchangeStatusData:
         return asdict(self)
     
     @staticmethod
-    def parse_list(response):
-        return [
-            ExchangeStatusData(
-                exchange=item["exchange"],
-                isConnected=item["isConnected"],
-                session=item["session"]
-            ) for item in response.get("data", [])
-        ]
+    def parse_list(response, validation: str=STRICT):
+        with validation_policy(validation):
+            return [
+                ExchangeStatusData(
+                    exchange=item["exchange"],
+                    isConnected=item["isConnected"],
+                    session=item["session"]
+                ) for item in response.get("data", [])
+            ]
 
+@with_slots
 @dataclass
 class ExchangeStatusResponse:
     status: int
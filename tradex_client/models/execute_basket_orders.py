@@ -1,12 +1,9 @@
 from dataclasses import dataclass, field, asdict
+from .slots import with_slots
 from typing import List, Optional
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-DEFAULT_CLIENT = os.getenv("CLIENT_ID")
+from ..config import default_client
 
+@with_slots
 @dataclass
 class ExecuteBasketData:
     client: str
@@ -31,11 +28,12 @@ class ExecuteBasketData:
 @dataclass
 class ExecuteBasketOrderRequest:
     orders: List[ExecuteBasketData] = field(default_factory=list)
-    client: str = field(default_factory=lambda: DEFAULT_CLIENT)
+    client: str = field(default_factory=default_client)
     
     def get_dict(self):
         return asdict(self)
     
+@with_slots
 @dataclass
 class ExecuteBasketResponse:
     status: int
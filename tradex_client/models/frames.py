@@ -0,0 +1,182 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from .timestamps import timestamp_ns
+
+np = None
+
+def _import_numpy():
+    """
+    Import NumPy on first use so that it stays an optional dependency.
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    global np
+    if np is None:
+        try:
+            import numpy as numpy_module
+        except ImportError:
+            raise ImportError("Frames require numpy. Install it with: pip install numpy")
+        np = numpy_module
+
+@dataclass
+class ColumnFrame:
+    """
+    Column-oriented view of a list response.
+
+    Each column is a NumPy array with one entry per row. Prices and values are float64
+    (NaN when missing), quantities and numbers are int64 (0 when missing) and timestamps are int64 nanoseconds since the Unix
+    epoch (0 when missing). Low-cardinality strings are stored as int32 codes into
+    `categories[column]`; other strings are object arrays.
+
+    Subclasses declare their columns in `float_columns`, `int_columns`, `time_columns`,
+    `category_columns` and `str_columns`.
+    """
+    status: int
+    message: str
+    columns: Dict[str, Any] = field(default_factory=dict)
+    categories: Dict[str, List[str]] = field(default_factory=dict)
+
+    float_columns = ()
+    int_columns = ()
+    time_columns = ()
+    category_columns = ()
+    str_columns = ()
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    def code(self, column: str, value: str):
+        """
+        Return the code of `value` in a categorical column, or -1 if it does not occur.
+        """
+        try:
+            return self.categories[column].index(value)
+        except ValueError:
+            return -1
+
+    def equals(self, column: str, value):
+        """
+        Return a boolean mask of the rows where `column` equals `value`.
+
+        Categorical columns are compared on their integer codes.
+        """
+        if column in self.categories:
+            return self.columns[column] == self.code(column, value)
+        return self.columns[column] == value
+
+    def decode(self, column: str):
+        """
+        Return a categorical column as an object array of its string values.
+        """
+        _import_numpy()
+        return np.array(self.categories[column], dtype=object)[self.columns[column]]
+
+    def take(self, rows):
+        """
+        Return a new frame holding the selected rows.
+
+        Args:
+            rows: Boolean mask or integer index array
+
+        Returns:
+            ColumnFrame: Frame of the same type sharing this frame's categories
+        """
+        return type(self)(
+            status=self.status,
+            message=self.message,
+            columns={name: values[rows] for name, values in self.columns.items()},
+            categories=self.categories
+        )
+
+    def to_rows(self):
+        """
+        Return the frame as a list of row dictionaries with categorical values decoded.
+        """
+        decoded = {name: self.decode(name) if name in self.categories else values for name, values in self.columns.items()}
+        return [
+            {name: values[index].item() if hasattr(values[index], "item") else values[index] for name, values in decoded.items()}
+            for index in range(len(self))
+        ]
+
+    def get_dict(self):
+        return {
+            "status": self.status,
+            "message": self.message,
+            "data": self.to_rows()
+        }
+
+    @classmethod
+    def from_response(cls, response: dict):
+        """
+        Build a frame straight from the `data` array of a decoded API response.
+
+        Args:
+            response (dict): Decoded JSON response
+
+        Returns:
+            ColumnFrame: Frame holding one column per declared field
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        _import_numpy()
+        rows = response.get("data") or []
+        count = len(rows)
+        columns = {}
+        categories = {}
+
+        for name in cls.float_columns:
+            columns[name] = np.fromiter((np.nan if item[name] is None else item[name] for item in rows), dtype=np.float64, count=count)
+        for name in cls.int_columns:
+            columns[name] = np.fromiter((item[name] or 0 for item in rows), dtype=np.int64, count=count)
+        for name in cls.time_columns:
+            values = [item[name] for item in rows]
+            lookup = {value: timestamp_ns(value) for value in dict.fromkeys(values)}
+            columns[name] = np.fromiter(map(lookup.__getitem__, values), dtype=np.int64, count=count)
+        for name in cls.category_columns:
+            values = [item[name] for item in rows]
+            lookup = {value: code for code, value in enumerate(dict.fromkeys(values))}
+            columns[name] = np.fromiter(map(lookup.__getitem__, values), dtype=np.int32, count=count)
+            categories[name] = list(lookup)
+        for name in cls.str_columns:
+            values = np.empty(count, dtype=object)
+            values[:] = [item[name] for item in rows]
+            columns[name] = values
+
+        return cls(status=response.get("status"), message=response.get("message"), columns=columns, categories=categories)
+
+@dataclass
+class OrderBookFrame(ColumnFrame):
+    float_columns = ("strike_price", "price", "trigger", "average_fill_price")
+    int_columns = ("qty_remaining", "qty_traded", "disc_qty", "user_order_no", "sender_order_no", "auction_number", "algol_id")
+    time_columns = ("client_entry_time", "entry_at", "last_modified")
+    category_columns = ("client", "exchange", "side", "product", "status", "book", "validity", "series", "instrument", "option_type", "order_category")
+    str_columns = ("code", "symbol", "user", "settlor", "api_source", "executing_id", "generated_by", "flags", "reason", "gtd", "exchange_order_no")
+
+@dataclass
+class TradesFrame(ColumnFrame):
+    float_columns = ("strike_price", "traded_price", "traded_value", "order_price", "order_trigger", "average_fill_price")
+    int_columns = ("traded_qty", "qty_remaining", "qty_cumulative", "order_qty", "order_disc_qty", "sender_order_no", "user_order_no", "algol_id")
+    time_columns = ("trade_time", "order_entry_at", "order_last_modified")
+    category_columns = ("client", "exchange", "side", "product", "order_status", "order_book", "order_validity", "series", "instrument", "option_type", "order_category")
+    str_columns = ("code", "symbol", "user", "generated_by", "api_source", "trade_no", "exchange_order_no")
+
+@dataclass
+class NetPositionFrame(ColumnFrame):
+    float_columns = ("strike_price", "buy_avg", "buy_value", "sell_avg", "sell_value", "net_price", "net_value", "mtm", "unrealized_mtm",
+                     "realized_mtm", "market_price", "close_price", "breakeven_point", "intrinsic_value", "extrinsic_value")
+    int_columns = ("lot_size", "multiplier", "buy_qty", "sell_qty", "net_qty")
+    category_columns = ("client", "exchange", "product", "instrument", "series", "option_type")
+    str_columns = ("code", "symbol")
+
+@dataclass
+class HoldingsFrame(ColumnFrame):
+    float_columns = ("nse_ltp", "bse_ltp", "value", "collateral_value", "buy_price", "close_price")
+    int_columns = ("position", "free_qty", "collateral_qty", "pledged_qty", "btst_qty", "blocked_qty", "non_poa_qty")
+    category_columns = ("client",)
+    str_columns = ("isin", "nse_name", "bse_name", "bse_code", "nse_code")
@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field, asdict
+from .slots import with_slots
+from .validation import STRICT, validation_policy
 from typing import List
 
+@with_slots
 @dataclass
 class FundsReportData:
     client_id: str
@@ -20,24 +23,26 @@ class FundsReportData:
         return asdict(self)
     
     @staticmethod
-    def parse_list(response):
-        return [
-            FundsReportData(
-                client_id=item["client_id"],
-                limit_id=item["limit_id"],
-                cash=item["cash"],
-                adhoc=item["adhoc"],
-                payin=item["payin"],
-                collateral=item["collateral"],
-                cnc_sell_benefit=item["cnc_sell_benefit"],
-                payout=item["payout"],
-                costs=item["costs"],
-                margin_used=item["margin_used"],
-                margin_available=item["margin_available"],
-                cash_available=item["cash_available"]
-            ) for item in response.get("data", [])
-        ]
+    def parse_list(response, validation: str=STRICT):
+        with validation_policy(validation):
+            return [
+                FundsReportData(
+                    client_id=item["client_id"],
+                    limit_id=item["limit_id"],
+                    cash=item["cash"],
+                    adhoc=item["adhoc"],
+                    payin=item["payin"],
+                    collateral=item["collateral"],
+                    cnc_sell_benefit=item["cnc_sell_benefit"],
+                    payout=item["payout"],
+                    costs=item["costs"],
+                    margin_used=item["margin_used"],
+                    margin_available=item["margin_available"],
+                    cash_available=item["cash_available"]
+                ) for item in response.get("data", [])
+            ]
 
+@with_slots
 @dataclass
 class FundsReportResponse:
     status: int
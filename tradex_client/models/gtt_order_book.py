@@ -1,9 +1,13 @@
 from ..constants import valid_exchanges, valid_sides
 
 from dataclasses import dataclass, field, asdict
+from .slots import with_slots
+from .timestamps import parse_timestamp
+from .validation import STRICT, should_validate, validation_policy
 from typing import List
 from datetime import datetime
 
+@with_slots
 @dataclass
 class GTTOrderBookData:
     client: str
@@ -49,6 +53,11 @@ class GTTOrderBookData:
         self.stop_order_price = float(self.stop_order_price) if isinstance(self.stop_order_price, str) and self.stop_order_price else 0.0
         self.target_order_price = float(self.target_order_price) if isinstance(self.target_order_price, str) and self.target_order_price else 0.0
         
+        if should_validate():
+            self.validate()
+
+    def validate(self):
+        """Check the row against the allowed sides and exchanges."""
         if self.side not in valid_sides:
             raise ValueError(f"Invalid order side: {self.side}. Allowed Sides: {valid_sides}")
 
@@ -59,48 +68,50 @@ class GTTOrderBookData:
         return asdict(self)
     
     @staticmethod
-    def parse_list(response):
-        return [
-            GTTOrderBookData(
-                client=item["client"],
-                modified_by=item["modified_by"],
-                created_by=item["created_by"],
-                exchange=item["exchange"],
-                code=item["code"],
-                symbol=item["symbol"],
-                series=item["series"],
-                strike=item["strike"],
-                option_type=item["option_type"],
-                side=item["side"],
-                product=item["product"],
-                qty=item["qty"],
-                main_trigger_price=item["main_trigger_price"],
-                main_order_price=item["main_order_price"],
-                main_state=item["main_state"],
-                price_condition=item["price_condition"],
-                stop_state=item["stop_state"],
-                stop_trigger_price=item["stop_trigger_price"],
-                stop_order_price=item["stop_order_price"],
-                trail_gap=item["trail_gap"],
-                target_state=item["target_state"],
-                target_trigger_price=item["target_trigger_price"],
-                target_order_price=item["target_order_price"], 
-                trail_distance=item["trail_distance"],
-                created_at=datetime.fromisoformat(item["created_at"].replace("Z", "+00:00")),
-                last_modified=datetime.fromisoformat(item["last_modified"].replace("Z", "+00:00")),
-                gtt_order_no=item["gtt_order_no"],
-                module=item["module"],
-                filled_qty=item["filled_qty"],
-                filled_value=item["filled_value"],
-                exit_qty=item["exit_qty"],
-                exit_value=item["exit_value"],
-                reason=item["reason"],
-                flags=item["flags"],
-                api_source=item["api_source"],
-                sender_order_no=item["sender_order_no"]
-            ) for item in response.get("data", [])
-        ]
+    def parse_list(response, validation: str=STRICT):
+        with validation_policy(validation):
+            return [
+                GTTOrderBookData(
+                    client=item["client"],
+                    modified_by=item["modified_by"],
+                    created_by=item["created_by"],
+                    exchange=item["exchange"],
+                    code=item["code"],
+                    symbol=item["symbol"],
+                    series=item["series"],
+                    strike=item["strike"],
+                    option_type=item["option_type"],
+                    side=item["side"],
+                    product=item["product"],
+                    qty=item["qty"],
+                    main_trigger_price=item["main_trigger_price"],
+                    main_order_price=item["main_order_price"],
+                    main_state=item["main_state"],
+                    price_condition=item["price_condition"],
+                    stop_state=item["stop_state"],
+                    stop_trigger_price=item["stop_trigger_price"],
+                    stop_order_price=item["stop_order_price"],
+                    trail_gap=item["trail_gap"],
+                    target_state=item["target_state"],
+                    target_trigger_price=item["target_trigger_price"],
+                    target_order_price=item["target_order_price"], 
+                    trail_distance=item["trail_distance"],
+                    created_at=parse_timestamp(item["created_at"]),
+                    last_modified=parse_timestamp(item["last_modified"]),
+                    gtt_order_no=item["gtt_order_no"],
+                    module=item["module"],
+                    filled_qty=item["filled_qty"],
+                    filled_value=item["filled_value"],
+                    exit_qty=item["exit_qty"],
+                    exit_value=item["exit_value"],
+                    reason=item["reason"],
+                    flags=item["flags"],
+                    api_source=item["api_source"],
+                    sender_order_no=item["sender_order_no"]
+                ) for item in response.get("data", [])
+            ]
 
+@with_slots
 @dataclass
 class GTTOrdersBookResponse:
     status: int
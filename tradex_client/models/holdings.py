@@ -1,7 +1,10 @@
 from dataclasses import dataclass, field, asdict
+from .slots import with_slots
+from .validation import STRICT, validation_policy
 from typing import List
 from decimal import Decimal
 
+@with_slots
 @dataclass
 class HoldingsData:
     client: str
@@ -28,31 +31,33 @@ class HoldingsData:
         return asdict(self)
     
     @staticmethod
-    def parse_list(response):
-        return [
-            HoldingsData(
-                client=item["client"],
-                isin=item["isin"],
-                nse_name=item["nse_name"],
-                bse_name=item["bse_name"],
-                bse_code=item["bse_code"],
-                nse_code=item["nse_code"],
-                nse_ltp=item["nse_ltp"],
-                bse_ltp=item["bse_ltp"],
-                position=item["position"],
-                free_qty=item["free_qty"],
-                collateral_qty=item["collateral_qty"],
-                pledged_qty=item["pledged_qty"],
-                btst_qty=item["btst_qty"],
-                blocked_qty=item["blocked_qty"],
-                non_poa_qty=item["non_poa_qty"],
-                value=item["value"],
-                collateral_value=item["collateral_value"],
-                buy_price=item["buy_price"],
-                close_price=item["close_price"]
-            ) for item in response.get("data", [])
-        ]
+    def parse_list(response, validation: str=STRICT):
+        with validation_policy(validation):
+            return [
+                HoldingsData(
+                    client=item["client"],
+                    isin=item["isin"],
+                    nse_name=item["nse_name"],
+                    bse_name=item["bse_name"],
+                    bse_code=item["bse_code"],
+                    nse_code=item["nse_code"],
+                    nse_ltp=item["nse_ltp"],
+                    bse_ltp=item["bse_ltp"],
+                    position=item["position"],
+                    free_qty=item["free_qty"],
+                    collateral_qty=item["collateral_qty"],
+                    pledged_qty=item["pledged_qty"],
+                    btst_qty=item["btst_qty"],
+                    blocked_qty=item["blocked_qty"],
+                    non_poa_qty=item["non_poa_qty"],
+                    value=item["value"],
+                    collateral_value=item["collateral_value"],
+                    buy_price=item["buy_price"],
+                    close_price=item["close_price"]
+                ) for item in response.get("data", [])
+            ]
 
+@with_slots
 @dataclass
 class HoldingsResponse:
     status: int
@@ -1,22 +1,19 @@
 from typing import Optional, Union
 from dataclasses import dataclass, asdict, field
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-DEFAULT_CLIENT = os.getenv("CLIENT_ID")
+from .slots import with_slots
+from ..config import default_client
 
 @dataclass
 class LoginRequest:
     app_key: str
     secret_key: str
     source: str
-    client: str = field(default_factory=lambda: DEFAULT_CLIENT)
+    client: str = field(default_factory=default_client)
     
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class LoginData:
     user_id: str
@@ -27,6 +24,7 @@ class LoginData:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class LoginResponse:
     status: Union[str, int]
@@ -1,5 +1,7 @@
 from dataclasses import dataclass, asdict
+from .slots import with_slots
 
+@with_slots
 @dataclass
 class LogoutData:
     status: int
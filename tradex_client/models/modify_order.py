@@ -2,12 +2,8 @@ from ..constants import *
 
 from typing import Optional
 from dataclasses import dataclass, asdict, field
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-DEFAULT_CLIENT = os.getenv("CLIENT_ID")
+from .slots import with_slots
+from ..config import default_client
 
 @dataclass
 class ModifyOrderRequest:
@@ -27,7 +23,7 @@ class ModifyOrderRequest:
     side: str
     trigger_price: float
     validity: str
-    client: str = field(default_factory=lambda: DEFAULT_CLIENT)
+    client: str = field(default_factory=default_client)
     
     def __post_init__(self):
         if self.exchange not in valid_exchanges:
@@ -60,6 +56,7 @@ class ModifyOrderRequest:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class ModifyOrderData:
     client: str
@@ -70,6 +67,7 @@ class ModifyOrderData:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class ModifyOrderResponse:
     status: int
@@ -1,14 +1,10 @@
 from ..constants import valid_exchanges, valid_sides, valid_products
 
 from dataclasses import dataclass, asdict, field
+from .slots import with_slots
 from typing import Optional
 from datetime import datetime
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-DEFAULT_CLIENT = os.getenv("CLIENT_ID")
+from ..config import default_client
 
 @dataclass
 class NewGttOrderRequest:
@@ -29,7 +25,7 @@ class NewGttOrderRequest:
     target_trigger_price: float
     target_order_price: str
     sender_order_no: int
-    client: str = field(default_factory=lambda: DEFAULT_CLIENT)
+    client: str = field(default_factory=default_client)
     
     def __post_init__(self):
         if self.exchange not in valid_exchanges:
@@ -56,6 +52,7 @@ class NewGttOrderRequest:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class NewGttOrderData:
     client: str
@@ -98,6 +95,7 @@ class NewGttOrderData:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class NewGttOrderResponse:
     status: int
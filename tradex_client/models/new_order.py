@@ -2,12 +2,8 @@ from ..constants import *
 
 from typing import Optional
 from dataclasses import dataclass, asdict, field
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-DEFAULT_CLIENT = os.getenv("CLIENT_ID")
+from .slots import with_slots
+from ..config import default_client
 
 @dataclass
 class NewOrderRequest:
@@ -25,7 +21,7 @@ class NewOrderRequest:
     trigger_price: float
     validity: str
     order_flag: int
-    client: str = field(default_factory=lambda: DEFAULT_CLIENT)
+    client: str = field(default_factory=default_client)
     
     def __post_init__(self):
         if self.exchange not in valid_exchanges:
@@ -52,6 +48,7 @@ class NewOrderRequest:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class NewOrderData:
     user_order_no: str
@@ -61,6 +58,7 @@ class NewOrderData:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class NewOrderResponse:
     status: int
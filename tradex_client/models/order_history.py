@@ -1,14 +1,12 @@
 from ..constants import valid_exchanges
 
 from dataclasses import dataclass, field, asdict
+from .slots import with_slots
+from .timestamps import parse_timestamp
+from .validation import STRICT, validation_policy
 from typing import List, Optional
 from datetime import datetime
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-DEFAULT_CLIENT = os.getenv("CLIENT_ID")
+from ..config import default_client
 
 @dataclass
 class OrderHistoryRequest:
@@ -16,7 +14,7 @@ class OrderHistoryRequest:
     code: str
     exchange_order_no: str
     sender_order_no: int
-    client: str = field(default_factory=lambda: DEFAULT_CLIENT)
+    client: str = field(default_factory=default_client)
 
     def __post_init__(self):
         if self.exchange not in valid_exchanges:
@@ -25,6 +23,7 @@ class OrderHistoryRequest:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class OrderHistoryData:
     client: str
@@ -72,48 +71,50 @@ class OrderHistoryData:
         return data
 
     @staticmethod
-    def parse_list(response):
-        return [
-            OrderHistoryData(
-                exchange=item["exchange"],
-                code=item["code"],
-                symbol=item["symbol"],
-                series=item["series"],
-                instrument=item["instrument"],
-                strike_price=item["strike_price"],
-                option_type=item["option_type"],
-                client=item["client"],
-                user=item["user"],
-                settlor=item["settlor"],
-                api_source=item["api_source"],
-                executing_id=item["executing_id"],
-                generated_by=item["generated_by"],
-                status=item["status"],
-                side=item["side"],
-                book=item["book"],
-                product=item["product"],
-                validity=item["validity"],
-                price=item["price"],
-                trigger=item["trigger"],
-                average_fill_price=item["average_fill_price"],
-                qty_remaining=item["qty_remaining"],
-                qty_traded=item["qty_traded"],
-                disc_qty=item["disc_qty"],
-                flags=item["flags"],
-                reason=item["reason"],
-                gtd=item["gtd"],
-                client_entry_time=datetime.fromisoformat(item["client_entry_time"].replace("Z", "+00:00")),
-                entry_at=datetime.fromisoformat(item["entry_at"].replace("Z", "+00:00")),
-                last_modified=datetime.fromisoformat(item["last_modified"].replace("Z", "+00:00")),
-                exchange_order_no=item["exchange_order_no"],
-                user_order_no=item["user_order_no"],
-                sender_order_no=item["sender_order_no"],
-                auction_number=item["auction_number"],
-                order_category=item["order_category"],
-                algol_id=item["algol_id"]
-            ) for item in response.get("data", [])
-        ]
+    def parse_list(response, validation: str=STRICT):
+        with validation_policy(validation):
+            return [
+                OrderHistoryData(
+                    exchange=item["exchange"],
+                    code=item["code"],
+                    symbol=item["symbol"],
+                    series=item["series"],
+                    instrument=item["instrument"],
+                    strike_price=item["strike_price"],
+                    option_type=item["option_type"],
+                    client=item["client"],
+                    user=item["user"],
+                    settlor=item["settlor"],
+                    api_source=item["api_source"],
+                    executing_id=item["executing_id"],
+                    generated_by=item["generated_by"],
+                    status=item["status"],
+                    side=item["side"],
+                    book=item["book"],
+                    product=item["product"],
+                    validity=item["validity"],
+                    price=item["price"],
+                    trigger=item["trigger"],
+                    average_fill_price=item["average_fill_price"],
+                    qty_remaining=item["qty_remaining"],
+                    qty_traded=item["qty_traded"],
+                    disc_qty=item["disc_qty"],
+                    flags=item["flags"],
+                    reason=item["reason"],
+                    gtd=item["gtd"],
+                    client_entry_time=parse_timestamp(item["client_entry_time"]),
+                    entry_at=parse_timestamp(item["entry_at"]),
+                    last_modified=parse_timestamp(item["last_modified"]),
+                    exchange_order_no=item["exchange_order_no"],
+                    user_order_no=item["user_order_no"],
+                    sender_order_no=item["sender_order_no"],
+                    auction_number=item["auction_number"],
+                    order_category=item["order_category"],
+                    algol_id=item["algol_id"]
+                ) for item in response.get("data", [])
+            ]
 
+@with_slots
 @dataclass
 class OrderHistoryResponse:
     status: int
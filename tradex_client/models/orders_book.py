@@ -1,9 +1,13 @@
 from ..constants import *
 
 from dataclasses import dataclass, field, asdict
+from .slots import with_slots
+from .timestamps import parse_timestamp
+from .validation import STRICT, should_validate, validation_policy
 from typing import List
 from datetime import datetime
 
+@with_slots
 @dataclass
 class OrderBookData:
     client: str
@@ -44,6 +48,11 @@ class OrderBookData:
     algol_id: int
 
     def __post_init__(self):
+        if should_validate():
+            self.validate()
+
+    def validate(self):
+        """Check the row against the allowed exchanges, sides, products, validity, books and value ranges."""
         if self.exchange not in valid_exchanges:
             raise ValueError(f"Invalid exchange: {self.exchange}. Allowed Exchanges: {valid_exchanges}")
 
@@ -94,49 +103,57 @@ class OrderBookData:
         return data
     
     @staticmethod
-    def parse_list(response):
-        return [
-            OrderBookData(
-                exchange=item["exchange"],
-                code=item["code"],
-                symbol=item["symbol"],
-                series=item["series"],
-                instrument=item["instrument"],
-                strike_price=item["strike_price"],
-                option_type=item["option_type"],
-                client=item["client"],
-                user=item["user"],
-                settlor=item["settlor"],
-                api_source=item["api_source"],
-                executing_id=item["executing_id"],
-                generated_by=item["generated_by"],
-                status=item["status"],
-                side=item["side"],
-                book=item["book"],
-                product=item["product"],
-                validity=item["validity"],
-                price=item["price"],
-                trigger=item["trigger"],
-                average_fill_price=item["average_fill_price"],
-                qty_remaining=item["qty_remaining"],
-                qty_traded=item["qty_traded"],
-                disc_qty=item["disc_qty"],
-                flags=item["flags"],
-                reason=item["reason"],
-                gtd=item["gtd"],
-                client_entry_time=datetime.fromisoformat(item["client_entry_time"].replace("Z", "+00:00")),
-                entry_at=datetime.fromisoformat(item["entry_at"].replace("Z", "+00:00")),
-                last_modified=datetime.fromisoformat(item["last_modified"].replace("Z", "+00:00")),
-                exchange_order_no=item["exchange_order_no"],
-                user_order_no=item["user_order_no"],
-                sender_order_no=item["sender_order_no"],
-                auction_number=item["auction_number"],
-                order_category=item["order_category"],
-                algol_id=item["algol_id"]
-            ) for item in response.get("data", [])
-        ]
+    def from_dict(item: dict):
+        """
+        Build a row from one decoded order dictionary, as found in the `data` array of
+        a book response or in a WebSocket event, decoding its timestamps.
+        """
+        return OrderBookData(
+            exchange=item["exchange"],
+            code=item["code"],
+            symbol=item["symbol"],
+            series=item["series"],
+            instrument=item["instrument"],
+            strike_price=item["strike_price"],
+            option_type=item["option_type"],
+            client=item["client"],
+            user=item["user"],
+            settlor=item["settlor"],
+            api_source=item["api_source"],
+            executing_id=item["executing_id"],
+            generated_by=item["generated_by"],
+            status=item["status"],
+            side=item["side"],
+            book=item["book"],
+            product=item["product"],
+            validity=item["validity"],
+            price=item["price"],
+            trigger=item["trigger"],
+            average_fill_price=item["average_fill_price"],
+            qty_remaining=item["qty_remaining"],
+            qty_traded=item["qty_traded"],
+            disc_qty=item["disc_qty"],
+            flags=item["flags"],
+            reason=item["reason"],
+            gtd=item["gtd"],
+            client_entry_time=parse_timestamp(item["client_entry_time"]),
+            entry_at=parse_timestamp(item["entry_at"]),
+            last_modified=parse_timestamp(item["last_modified"]),
+            exchange_order_no=item["exchange_order_no"],
+            user_order_no=item["user_order_no"],
+            sender_order_no=item["sender_order_no"],
+            auction_number=item["auction_number"],
+            order_category=item["order_category"],
+            algol_id=item["algol_id"]
+        )
+
+    @staticmethod
+    def parse_list(response, validation: str=STRICT):
+        with validation_policy(validation):
+            return [OrderBookData.from_dict(item) for item in response.get("data", [])]
         
 
+@with_slots
 @dataclass
 class OrderBookResponse:
     status: int
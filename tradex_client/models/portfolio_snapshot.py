@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from .funds_report import FundsReportResponse
+from .holdings import HoldingsResponse
+from .orders_book import OrderBookResponse
+from .positions import NetPositionResponse
+from .trades_book import TradesBookResponse
+
+@dataclass
+class PortfolioSnapshot:
+    order_book: Optional[OrderBookResponse] = None
+    trades_book: Optional[TradesBookResponse] = None
+    positions: Optional[NetPositionResponse] = None
+    holdings: Optional[HoldingsResponse] = None
+    funds_report: Optional[FundsReportResponse] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def is_complete(self):
+        return not self.errors
+
+    def get_dict(self):
+        return {
+            "order_book": self.order_book.get_dict() if self.order_book else None,
+            "trades_book": self.trades_book.get_dict() if self.trades_book else None,
+            "positions": self.positions.get_dict() if self.positions else None,
+            "holdings": self.holdings.get_dict() if self.holdings else None,
+            "funds_report": self.funds_report.get_dict() if self.funds_report else None,
+            "timings": dict(self.timings),
+            "errors": {endpoint: str(error) for endpoint, error in self.errors.items()},
+            "elapsed": self.elapsed
+        }
@@ -1,7 +1,10 @@
 from dataclasses import dataclass, field, asdict
+from .slots import with_slots
+from .validation import STRICT, validation_policy
 from typing import List
 from decimal import Decimal
 
+@with_slots
 @dataclass
 class NetPositionData:
     client: str
@@ -37,40 +40,42 @@ class NetPositionData:
         return asdict(self)
     
     @staticmethod
-    def parse_list(response):
-        return [
-            NetPositionData(
-                client=item["client"],
-                exchange=item["exchange"],
-                code=item["code"],
-                instrument=item["instrument"],
-                symbol=item["symbol"],
-                series=item["series"],
-                strike_price=item["strike_price"],
-                option_type=item["option_type"],
-                product=item["product"],
-                lot_size=item["lot_size"],
-                multiplier=item["multiplier"],
-                buy_avg=item["buy_avg"],
-                buy_qty=item["buy_qty"],
-                buy_value=item["buy_value"],
-                sell_avg=item["sell_avg"],
-                sell_qty=item["sell_qty"],
-                sell_value=item["sell_value"],
-                net_price=item["net_price"],
-                net_qty=item["net_qty"],
-                net_value=item["net_value"],
-                mtm=item["mtm"],
-                unrealized_mtm=item["unrealized_mtm"],
-                realized_mtm=item["realized_mtm"],
-                market_price=item["market_price"],
-                close_price=item["close_price"],
-                breakeven_point=item["breakeven_point"],
-                intrinsic_value=item["intrinsic_value"],
-                extrinsic_value=item["extrinsic_value"]
-            ) for item in response.get("data", [])
-        ]
+    def parse_list(response, validation: str=STRICT):
+        with validation_policy(validation):
+            return [
+                NetPositionData(
+                    client=item["client"],
+                    exchange=item["exchange"],
+                    code=item["code"],
+                    instrument=item["instrument"],
+                    symbol=item["symbol"],
+                    series=item["series"],
+                    strike_price=item["strike_price"],
+                    option_type=item["option_type"],
+                    product=item["product"],
+                    lot_size=item["lot_size"],
+                    multiplier=item["multiplier"],
+                    buy_avg=item["buy_avg"],
+                    buy_qty=item["buy_qty"],
+                    buy_value=item["buy_value"],
+                    sell_avg=item["sell_avg"],
+                    sell_qty=item["sell_qty"],
+                    sell_value=item["sell_value"],
+                    net_price=item["net_price"],
+                    net_qty=item["net_qty"],
+                    net_value=item["net_value"],
+                    mtm=item["mtm"],
+                    unrealized_mtm=item["unrealized_mtm"],
+                    realized_mtm=item["realized_mtm"],
+                    market_price=item["market_price"],
+                    close_price=item["close_price"],
+                    breakeven_point=item["breakeven_point"],
+                    intrinsic_value=item["intrinsic_value"],
+                    extrinsic_value=item["extrinsic_value"]
+                ) for item in response.get("data", [])
+            ]
 
+@with_slots
 @dataclass
 class NetPositionResponse:
     status: int
@@ -0,0 +1,19 @@
+from dataclasses import fields
+
+def with_slots(cls):
+    """
+    Rebuild a dataclass with `__slots__` so its instances carry no per-instance `__dict__`.
+
+    Equivalent to `@dataclass(slots=True)`, which is only available from Python 3.10.
+    Apply it on top of `@dataclass`. Attribute access, `asdict()` and `get_dict()` are
+    unchanged, but attributes that are not fields can no longer be set on instances.
+    Methods of the class must not use zero-argument `super()`.
+    """
+    field_names = tuple(field.name for field in fields(cls))
+    class_dict = dict(cls.__dict__)
+    class_dict["__slots__"] = field_names
+    for name in field_names:
+        class_dict.pop(name, None)
+    class_dict.pop("__dict__", None)
+    class_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, class_dict)
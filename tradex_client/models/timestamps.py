@@ -0,0 +1,94 @@
+import sys
+from datetime import datetime, timezone
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+NAIVE_EPOCH = datetime(1970, 1, 1)
+
+# From Python 3.11 `datetime.fromisoformat` accepts "Z" and any fraction length. Older
+# versions reject both, so there the value is normalised first.
+NATIVE_ISO = sys.version_info >= (3, 11)
+
+# A row usually carries the same timestamp in several consecutive fields (client entry,
+# entry, last modified), so the last decoded value is kept and reused when the next value
+# is equal. A single tuple is swapped in so concurrent readers always see a matching pair.
+_last_datetime = (None, None)
+_last_nanoseconds = (None, 0)
+
+def _normalise(value: str):
+    """
+    Rewrite a timestamp into the form `datetime.fromisoformat` accepts before Python 3.11:
+    a numeric offset instead of "Z" and a fraction of exactly six digits.
+    """
+    prefix = value[:19]
+    rest = value[19:]
+    if not rest:
+        return value
+    if rest[-1] == "Z":
+        zone = "+00:00"
+        rest = rest[:-1]
+    else:
+        index = max(rest.rfind("+"), rest.rfind("-"))
+        if index >= 0:
+            zone = rest[index:]
+            rest = rest[:index]
+        else:
+            zone = ""
+    fraction = rest[1:]
+    if fraction:
+        return prefix + "." + fraction[:6].ljust(6, "0") + zone
+    return prefix + zone
+
+def _decode(value: str):
+    if NATIVE_ISO:
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(_normalise(value))
+
+def parse_timestamp(value):
+    """
+    Decode an ISO 8601 timestamp from the API into a `datetime`.
+
+    Accepts a trailing "Z", numeric offsets and any number of fraction digits. Equal
+    consecutive strings decode to the same `datetime` object.
+
+    Args:
+        value: Timestamp string. `datetime` values are returned unchanged.
+
+    Returns:
+        datetime: The decoded timestamp, or None if `value` is empty
+    """
+    global _last_datetime
+    last = _last_datetime
+    if value == last[0]:
+        return last[1]
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    decoded = _decode(value)
+    _last_datetime = (value, decoded)
+    return decoded
+
+def timestamp_ns(value):
+    """
+    Decode an ISO 8601 timestamp from the API into nanoseconds since the Unix epoch.
+
+    Naive timestamps are taken as UTC. Precision is one microsecond.
+
+    Args:
+        value: Timestamp string or `datetime`
+
+    Returns:
+        int: Nanoseconds since the epoch, or 0 if `value` is empty
+    """
+    global _last_nanoseconds
+    last = _last_nanoseconds
+    if value == last[0]:
+        return last[1]
+    if not value:
+        return 0
+    if isinstance(value, datetime):
+        delta = value - (EPOCH if value.tzinfo is not None else NAIVE_EPOCH)
+        return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+    decoded = timestamp_ns(_decode(value))
+    _last_nanoseconds = (value, decoded)
+    return decoded
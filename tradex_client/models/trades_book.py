@@ -1,7 +1,11 @@
 from dataclasses import dataclass, field, asdict
+from .slots import with_slots
+from .timestamps import parse_timestamp
+from .validation import STRICT, validation_policy
 from typing import List
 from datetime import datetime
 
+@with_slots
 @dataclass
 class TradesBookData:
     client: str
@@ -48,47 +52,55 @@ class TradesBookData:
         return data
     
     @staticmethod
-    def parse_list(response):
-        return [
-            TradesBookData(
-                exchange=item["exchange"],
-                code=item["code"],
-                symbol=item["symbol"],
-                series=item["series"],
-                strike_price=item["strike_price"],
-                option_type=item["option_type"],
-                instrument=item["instrument"],
-                client=item["client"],
-                user=item["user"],
-                generated_by=item["generated_by"],
-                api_source=item["api_source"],
-                side=item["side"],
-                traded_qty=item["traded_qty"],
-                traded_price=item["traded_price"],
-                traded_value=item["traded_value"],
-                qty_remaining=item["qty_remaining"],
-                qty_cumulative=item["qty_cumulative"],
-                trade_time=datetime.fromisoformat(item["trade_time"].replace("Z", "+00:00")),
-                product=item["product"],
-                order_category=item["order_category"],
-                order_book=item["order_book"],
-                order_validity=item["order_validity"],
-                order_price=item["order_price"],
-                order_qty=item["order_qty"],
-                order_trigger=item["order_trigger"],
-                average_fill_price=item["average_fill_price"],
-                order_status=item["order_status"],
-                order_disc_qty=item["order_disc_qty"],
-                order_entry_at=datetime.fromisoformat(item["order_entry_at"].replace("Z", "+00:00")),
-                order_last_modified=datetime.fromisoformat(item["order_last_modified"].replace("Z", "+00:00")),
-                trade_no=item["trade_no"],
-                exchange_order_no=item["exchange_order_no"],
-                sender_order_no=item["sender_order_no"],
-                user_order_no=item["user_order_no"],
-                algol_id=item["algol_id"]
-            ) for item in response.get("data", [])
-        ]
+    def from_dict(item: dict):
+        """
+        Build a row from one decoded trade dictionary, as found in the `data` array of
+        a book response or in a WebSocket event, decoding its timestamps.
+        """
+        return TradesBookData(
+            exchange=item["exchange"],
+            code=item["code"],
+            symbol=item["symbol"],
+            series=item["series"],
+            strike_price=item["strike_price"],
+            option_type=item["option_type"],
+            instrument=item["instrument"],
+            client=item["client"],
+            user=item["user"],
+            generated_by=item["generated_by"],
+            api_source=item["api_source"],
+            side=item["side"],
+            traded_qty=item["traded_qty"],
+            traded_price=item["traded_price"],
+            traded_value=item["traded_value"],
+            qty_remaining=item["qty_remaining"],
+            qty_cumulative=item["qty_cumulative"],
+            trade_time=parse_timestamp(item["trade_time"]),
+            product=item["product"],
+            order_category=item["order_category"],
+            order_book=item["order_book"],
+            order_validity=item["order_validity"],
+            order_price=item["order_price"],
+            order_qty=item["order_qty"],
+            order_trigger=item["order_trigger"],
+            average_fill_price=item["average_fill_price"],
+            order_status=item["order_status"],
+            order_disc_qty=item["order_disc_qty"],
+            order_entry_at=parse_timestamp(item["order_entry_at"]),
+            order_last_modified=parse_timestamp(item["order_last_modified"]),
+            trade_no=item["trade_no"],
+            exchange_order_no=item["exchange_order_no"],
+            sender_order_no=item["sender_order_no"],
+            user_order_no=item["user_order_no"],
+            algol_id=item["algol_id"]
+        )
 
+    @staticmethod
+    def parse_list(response, validation: str=STRICT):
+        with validation_policy(validation):
+            return [TradesBookData.from_dict(item) for item in response.get("data", [])]
+
+@with_slots
 @dataclass
 class TradesBookResponse:
     status: int
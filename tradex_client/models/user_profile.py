@@ -1,6 +1,8 @@
 from dataclasses import dataclass, asdict
+from .slots import with_slots
 from typing import Optional
 
+@with_slots
 @dataclass
 class UserProfileData:
     client_id: str
@@ -17,6 +19,7 @@ class UserProfileData:
     def get_dict(self):
         return asdict(self)
 
+@with_slots
 @dataclass
 class UserProfileResponse:
     status: int
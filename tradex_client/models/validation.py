@@ -0,0 +1,51 @@
+import threading
+from contextlib import contextmanager
+
+from ..constants import validation_policies
+
+STRICT = "strict"
+SAMPLED = "sampled"
+TRUSTED = "trusted"
+
+# Under the sampled policy the first server row on a thread and every SAMPLE_RATE-th row after it are checked.
+SAMPLE_RATE = 100
+
+_state = threading.local()
+
+@contextmanager
+def validation_policy(policy: str=STRICT):
+    """
+    Select how response models built from server data in this block are validated.
+
+    Request models are always validated; only response models consult the policy.
+
+    Args:
+        policy (str, optional): "strict" checks every row, "sampled" checks one row in
+            SAMPLE_RATE and "trusted" skips the checks. Defaults to "strict".
+
+    Raises:
+        ValueError: If the policy is not one of `constants.validation_policies`
+    """
+    if policy not in validation_policies:
+        raise ValueError(f"Invalid validation policy: {policy}. Allowed Policies: {validation_policies}")
+
+    previous = getattr(_state, "policy", STRICT)
+    _state.policy = policy
+    try:
+        yield
+    finally:
+        _state.policy = previous
+
+def should_validate():
+    """
+    Return whether the response model being built should run its checks.
+    """
+    policy = getattr(_state, "policy", STRICT)
+    if policy == STRICT:
+        return True
+    if policy == TRUSTED:
+        return False
+
+    count = getattr(_state, "count", 0)
+    _state.count = count + 1
+    return count % SAMPLE_RATE == 0
@@ -0,0 +1,312 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from .exceptions import TradeXAPIError, TradeXTimeoutError
+from .models import ExecuteBasketData, ExecuteBasketOrderRequest, NewOrderData, NewOrderRequest, NewOrderResponse
+
+class OrderGateway:
+    """
+    Micro-batcher that sends bursts of new orders as ExecuteBasket requests.
+
+    Orders submitted within `window` seconds of the first order of a batch, up to
+    `max_batch_size` orders, are sent together as one basket instead of one NewOrder
+    request each. Every submitter gets its own Future resolving to a NewOrderResponse.
+    A batch holding a single order is sent as a plain NewOrder request.
+
+    The basket response is matched back to the submitted orders by `sender_order_no`.
+    If the server does not return per-order entries, each order's response carries the
+    basket status and message with `data` set to None. Every Future is resolved, with the
+    request's error if the basket fails or its response cannot be read.
+
+    Orders whose deadline has passed by the time their batch is sent fail on their own
+    with TradeXTimeoutError and are left out of the basket. The rest are sent with the
+    shortest remaining deadline among them.
+
+    Attributes:
+        client (TradeXClient): Client used to send the requests
+        window (float): Seconds to wait for more orders after the first order of a batch
+        max_batch_size (int): Maximum number of orders per basket
+        is_running (bool): Whether the flusher thread is accepting orders
+    """
+    def __init__(self, client, window: float=0.005, max_batch_size: int=50):
+        if window < 0:
+            raise ValueError("Batching window cannot be negative.")
+        if max_batch_size <= 0:
+            raise ValueError("Maximum batch size must be greater than zero.")
+
+        self.client = client
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.pending_orders = queue.Queue()
+        self.submit_lock = threading.Lock()
+        self.is_running = False
+        self.flusher_thread = None
+
+    def start(self):
+        if self.is_running:
+            return
+        self.is_running = True
+        self.flusher_thread = threading.Thread(target=self._flush_loop, name="tradex-order-gateway", daemon=True)
+        self.flusher_thread.start()
+
+    def stop(self):
+        """
+        Stop accepting orders and wait until all pending orders have been sent.
+        """
+        with self.submit_lock:
+            self.is_running = False
+        if self.flusher_thread:
+            self.flusher_thread.join()
+            self.flusher_thread = None
+
+    def submit(self, new_order_details: NewOrderRequest, deadline: float=None):
+        """
+        Queue a new order for the next batch.
+
+        A Future that is cancelled before its batch is sent is left out of the batch.
+
+        Args:
+            new_order_details (NewOrderRequest): Order details.
+            deadline (float, optional): Latency budget in seconds for the order, counted
+                from now. Defaults to None.
+
+        Returns:
+            Future: Resolves to the order's NewOrderResponse, or raises the error of the
+                request that carried it
+
+        Raises:
+            RuntimeError: If the gateway is not running
+        """
+        future = Future()
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        with self.submit_lock:
+            if not self.is_running:
+                raise RuntimeError("Order gateway is not running.")
+            self.pending_orders.put((new_order_details, future, deadline_at))
+        return future
+
+    def _flush_loop(self):
+        while self.is_running or not self.pending_orders.empty():
+            try:
+                batch = [self.pending_orders.get(timeout=0.1)]
+            except queue.Empty:
+                continue
+
+            window_end = time.monotonic() + self.window
+            while len(batch) < self.max_batch_size:
+                remaining = window_end - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self.pending_orders.get(timeout=remaining))
+                    else:
+                        batch.append(self.pending_orders.get_nowait())
+                except queue.Empty:
+                    break
+
+            self._send_batch(batch)
+
+    def _send_batch(self, batch):
+        batch = [(order, future, deadline_at) for order, future, deadline_at in batch if future.set_running_or_notify_cancel()]
+        batch = self._drop_expired(batch)
+        if not batch:
+            return
+        orders = [order for order, _, _ in batch]
+        futures = [future for _, future, _ in batch]
+        deadline = self._batch_deadline(batch)
+
+        try:
+            if len(orders) == 1:
+                futures[0].set_result(self.client._send_new_order(orders[0], deadline=deadline))
+                return
+
+            response = self.client._post('ExecuteBasket', payload=self._basket_payload(orders), deadline=deadline)
+            self._resolve(orders, futures, response)
+        except Exception as ex:
+            # The flusher thread must survive and no caller may be left waiting
+            self._fail(futures, ex)
+
+    def _drop_expired(self, batch):
+        now = time.monotonic()
+        live = []
+        for order, future, deadline_at in batch:
+            if deadline_at is not None and deadline_at <= now:
+                self._fail([future], TradeXTimeoutError("Deadline exceeded waiting for order gateway batch for endpoint: NewOrder. The order was not sent."))
+            else:
+                live.append((order, future, deadline_at))
+        return live
+
+    def _batch_deadline(self, batch):
+        deadlines = [deadline_at for _, _, deadline_at in batch if deadline_at is not None]
+        return min(deadlines) - time.monotonic() if deadlines else None
+
+    def _basket_payload(self, orders):
+        basket = ExecuteBasketOrderRequest(
+            orders=[self._to_basket_data(order) for order in orders],
+            client=self.client.client_id
+        )
+        return self.client._get_dict(basket)
+
+    def _fail(self, futures, ex):
+        for future in futures:
+            if not future.done():
+                future.set_exception(ex)
+
+    def _resolve(self, orders, futures, response):
+        if not isinstance(response, dict):
+            raise TradeXAPIError(f"Empty or invalid response from ExecuteBasket: {response!r}")
+        entries = response.get('data')
+        if isinstance(entries, dict):
+            entries = [entries]
+        elif not isinstance(entries, list):
+            entries = []
+        entries_by_sender = {entry.get('sender_order_no'): entry for entry in entries if isinstance(entry, dict)}
+
+        for order, future in zip(orders, futures):
+            if future.done():
+                continue
+            entry = entries_by_sender.get(order.sender_order_no, {})
+            data = None
+            if 'user_order_no' in entry:
+                data = NewOrderData(
+                    user_order_no=entry['user_order_no'],
+                    sender_order_no=entry.get('sender_order_no'),
+                    client=entry.get('client', self.client.client_id)
+                )
+            future.set_result(NewOrderResponse(
+                status=entry.get('status', response.get('status')),
+                message=entry.get('message', response.get('message')),
+                data=data
+            ))
+
+    def _to_basket_data(self, order: NewOrderRequest):
+        return ExecuteBasketData(
+            client=self.client.client_id,
+            exchange=order.exchange,
+            code=order.code,
+            side=order.side,
+            quantity=order.quantity,
+            price=order.price,
+            book=order.book,
+            trigger_price=order.trigger_price,
+            disclosed_qty=order.disclosed_qty,
+            product=order.product,
+            validity=order.validity,
+            gtd=order.gtd,
+            order_flag=order.order_flag,
+            sender_order_no=order.sender_order_no,
+            algol_id=order.algol_id
+        )
+
+class AsyncOrderGateway(OrderGateway):
+    """
+    OrderGateway for AsyncTradeXClient.
+
+    Orders are batched by a task on the running event loop instead of a thread, and
+    every submitter gets an asyncio Future. After the first order of a batch the task
+    waits `window` seconds, unless `max_batch_size` orders are already queued.
+
+    Attributes:
+        sending (set): Futures of the orders in the basket being sent
+    """
+    def __init__(self, client, window: float=0.005, max_batch_size: int=50):
+        super().__init__(client, window=window, max_batch_size=max_batch_size)
+        self.pending_orders = asyncio.Queue()
+        self.sending = set()
+        self.flusher_task = None
+
+    def start(self):
+        if self.is_running:
+            return
+        self.is_running = True
+        self.flusher_task = asyncio.ensure_future(self._flush_loop())
+
+    async def stop(self):
+        """
+        Stop accepting orders and wait until all pending orders have been sent.
+        """
+        if not self.is_running:
+            return
+        self.is_running = False
+        self.pending_orders.put_nowait(None)
+        if self.flusher_task:
+            await self.flusher_task
+            self.flusher_task = None
+
+    def submit(self, new_order_details: NewOrderRequest, deadline: float=None):
+        """
+        Queue a new order for the next batch.
+
+        Args:
+            new_order_details (NewOrderRequest): Order details.
+            deadline (float, optional): Latency budget in seconds for the order, counted
+                from now. Defaults to None.
+
+        Returns:
+            asyncio.Future: Resolves to the order's NewOrderResponse, or raises the error of
+                the request that carried it
+
+        Raises:
+            RuntimeError: If the gateway is not running
+        """
+        if not self.is_running:
+            raise RuntimeError("Order gateway is not running.")
+        future = asyncio.get_running_loop().create_future()
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        self.pending_orders.put_nowait((new_order_details, future, deadline_at))
+        return future
+
+    def withdraw(self, future):
+        """
+        Cancel a submitted order that has not been sent yet.
+
+        Returns:
+            bool: True if the order was withdrawn, False if it was already sent or resolved
+        """
+        if future in self.sending:
+            return False
+        return future.cancel()
+
+    async def _flush_loop(self):
+        while True:
+            item = await self.pending_orders.get()
+            if item is None:
+                return
+            batch = [item]
+            if self.window and self.pending_orders.qsize() < self.max_batch_size - 1:
+                await asyncio.sleep(self.window)
+            # The stop marker is always last, so it can wait for the next round
+            while len(batch) < self.max_batch_size and not self.pending_orders.empty():
+                item = self.pending_orders.get_nowait()
+                if item is None:
+                    self.pending_orders.put_nowait(None)
+                    break
+                batch.append(item)
+            await self._send_batch(batch)
+
+    async def _send_batch(self, batch):
+        batch = [(order, future, deadline_at) for order, future, deadline_at in batch if not future.done()]
+        batch = self._drop_expired(batch)
+        if not batch:
+            return
+        orders = [order for order, _, _ in batch]
+        futures = [future for _, future, _ in batch]
+        deadline = self._batch_deadline(batch)
+
+        self.sending.update(futures)
+        try:
+            if len(orders) == 1:
+                response = await self.client._send_new_order(orders[0], deadline=deadline)
+                if not futures[0].done():
+                    futures[0].set_result(response)
+                return
+
+            response = await self.client._post('ExecuteBasket', payload=self._basket_payload(orders), deadline=deadline)
+            self._resolve(orders, futures, response)
+        except Exception as ex:
+            # The flusher task must survive and no caller may be left waiting
+            self._fail(futures, ex)
+        finally:
+            self.sending.difference_update(futures)
@@ -0,0 +1,178 @@
+import threading
+
+from .models import OrderBookData, OrderBookResponse
+
+# Order book filters that select by status; "All" returns every order.
+order_book_filters = ("All", "Pending", "Unconfirmed", "Cancelled", "Rejected", "Failed", "Executed")
+
+# Order statuses each filter selects, for the filters the store answers locally. Only final
+# states whose status value is the filter's name are listed; "Pending" and "Unconfirmed" also
+# cover intermediate states (e.g. modified, partly executed or trigger pending orders) that
+# the server groups on its own, so they are always sent to the server.
+order_book_filter_statuses = {
+    "Cancelled": ("Cancelled",),
+    "Rejected": ("Rejected",),
+    "Failed": ("Failed",),
+    "Executed": ("Executed",),
+}
+
+class OrderStore:
+    """
+    Local mirror of the day's order book, kept current by WebSocket order events.
+
+    The store is seeded once from `get_order_book('All')` and then updated with every
+    `order` event (see `TradeXClient.enable_order_store`), so order states can be read
+    without downloading the book again. Orders are kept by `user_order_no`, which TradeX
+    assigns when the order is accepted and which stays the same for the life of the
+    order. Lookups by `user_order_no`, `exchange_order_no` and `sender_order_no`, and by
+    symbol or status, are dictionary lookups.
+
+    An update whose `last_modified` is older than the stored order's is ignored, so
+    seeding and events may overlap in any order.
+
+    Attributes:
+        orders (dict): Latest OrderBookData by `user_order_no`, in first-seen order
+        updates (int): Number of updates applied
+        stale_updates (int): Number of updates ignored for being older than the stored order
+    """
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.orders = {}
+        self.by_exchange_order_no = {}
+        self.by_sender_order_no = {}
+        self.symbol_index = {}
+        self.status_index = {}
+        self.updates = 0
+        self.stale_updates = 0
+
+    def __len__(self):
+        return len(self.orders)
+
+    def __contains__(self, user_order_no):
+        return user_order_no in self.orders
+
+    def update(self, order: OrderBookData):
+        """
+        Insert or replace an order and move it between the symbol and status indexes.
+
+        Args:
+            order (OrderBookData): Order row from the book or from an `order` event
+
+        Returns:
+            bool: True if the order was stored, False if it was older than the stored order
+        """
+        key = order.user_order_no
+        with self.lock:
+            previous = self.orders.get(key)
+            if previous is not None:
+                if self._is_stale(order, previous):
+                    self.stale_updates += 1
+                    return False
+                self._unindex(key, previous, order)
+            self.orders[key] = order
+            if order.exchange_order_no:
+                self.by_exchange_order_no[order.exchange_order_no] = key
+            if order.sender_order_no:
+                self.by_sender_order_no[order.sender_order_no] = key
+            # An order already indexed under the same symbol or status keeps its place
+            self.symbol_index.setdefault(order.symbol, {})[key] = order
+            self.status_index.setdefault(order.status, {})[key] = order
+            self.updates += 1
+            return True
+
+    def update_many(self, orders):
+        with self.lock:
+            for order in orders:
+                self.update(order)
+
+    def clear(self):
+        with self.lock:
+            self.orders.clear()
+            self.by_exchange_order_no.clear()
+            self.by_sender_order_no.clear()
+            self.symbol_index.clear()
+            self.status_index.clear()
+
+    def get(self, user_order_no):
+        """
+        Return the order with this `user_order_no`, or None.
+        """
+        return self.orders.get(user_order_no)
+
+    def get_by_exchange_order_no(self, exchange_order_no: str):
+        return self.orders.get(self.by_exchange_order_no.get(exchange_order_no))
+
+    def get_by_sender_order_no(self, sender_order_no):
+        return self.orders.get(self.by_sender_order_no.get(sender_order_no))
+
+    def get_by_symbol(self, symbol: str):
+        """
+        Return the orders for a symbol, in first-seen order.
+        """
+        with self.lock:
+            return list(self.symbol_index.get(symbol, {}).values())
+
+    def get_by_status(self, status: str):
+        """
+        Return the orders currently in a status, in the order they reached it.
+        """
+        with self.lock:
+            return list(self.status_index.get(status, {}).values())
+
+    def answers(self, filter_type: str):
+        """
+        Whether `get_order_book(filter_type)` can be answered exactly from the store.
+        """
+        return filter_type == 'All' or filter_type in order_book_filter_statuses
+
+    def get_order_book(self, filter_type: str='All'):
+        """
+        Answer an order book query from the store.
+
+        Args:
+            filter_type (str, optional): "All" or a filter listed in
+                `order_book_filter_statuses`. Defaults to 'All'.
+
+        Returns:
+            OrderBookResponse: The matching orders; all orders are in first-seen order and
+                filtered orders in the order they reached their status
+
+        Raises:
+            ValueError: If an invalid filter_type is provided, or one the store cannot answer
+        """
+        if filter_type not in order_book_filters:
+            list_filters = ', '.join(order_book_filters)
+            raise ValueError(f'Invalid filter type! Must be one of these: {list_filters}')
+        if not self.answers(filter_type):
+            raise ValueError(f'Filter type {filter_type} cannot be answered from the order store.')
+        with self.lock:
+            if filter_type == 'All':
+                orders = list(self.orders.values())
+            else:
+                orders = [order for status in order_book_filter_statuses[filter_type]
+                          for order in self.status_index.get(status, {}).values()]
+        return OrderBookResponse(status=200, message="Order book served from the local order store", data=orders)
+
+    def _is_stale(self, order, previous):
+        if order.last_modified is None or previous.last_modified is None:
+            return False
+        try:
+            return order.last_modified < previous.last_modified
+        except TypeError:
+            # Naive and aware timestamps cannot be compared; take the newer arrival.
+            return False
+
+    def _unindex(self, key, order, replacement=None):
+        """Remove an order from the indexes whose value its replacement changes"""
+        if replacement is None or replacement.symbol != order.symbol:
+            orders = self.symbol_index.get(order.symbol)
+            if orders is not None:
+                orders.pop(key, None)
+                if not orders:
+                    del self.symbol_index[order.symbol]
+        if replacement is None or replacement.status != order.status:
+            orders = self.status_index.get(order.status)
+            if orders is not None:
+                orders.pop(key, None)
+                if not orders:
+                    del self.status_index[order.status]
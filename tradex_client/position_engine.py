@@ -0,0 +1,379 @@
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+
+from .models import NetPositionData, TradesBookData
+from .singleflight import fresh_reads
+
+logger = logging.getLogger(__name__)
+
+class Position:
+    """
+    Running net position for one (exchange, code, product).
+
+    Values are quantity x price x multiplier, like the server's position values, and
+    averages are per unit. Realized MTM is booked on the matched quantity at the
+    difference between the average sell and buy prices; each fill adds the change it
+    makes to that amount, so a position loaded from the server keeps the server's
+    realized MTM and moves from there.
+    """
+    __slots__ = ("exchange", "code", "product", "symbol", "multiplier",
+                 "buy_qty", "buy_value", "sell_qty", "sell_value", "realized_mtm")
+
+    def __init__(self, exchange: str, code: str, product: str, symbol: str="", multiplier: int=1):
+        self.exchange = exchange
+        self.code = code
+        self.product = product
+        self.symbol = symbol
+        self.multiplier = multiplier or 1
+        self.buy_qty = 0
+        self.buy_value = 0.0
+        self.sell_qty = 0
+        self.sell_value = 0.0
+        self.realized_mtm = 0.0
+
+    @property
+    def buy_avg(self):
+        return self.buy_value / (self.buy_qty * self.multiplier) if self.buy_qty else 0.0
+
+    @property
+    def sell_avg(self):
+        return self.sell_value / (self.sell_qty * self.multiplier) if self.sell_qty else 0.0
+
+    @property
+    def net_qty(self):
+        return self.buy_qty - self.sell_qty
+
+    @property
+    def net_value(self):
+        return self.sell_value - self.buy_value
+
+    def add_trade(self, side: str, qty: int, price: float):
+        before = self._matched_mtm()
+        if side == "Buy":
+            self.buy_qty += qty
+            self.buy_value += qty * price * self.multiplier
+        else:
+            self.sell_qty += qty
+            self.sell_value += qty * price * self.multiplier
+        self.realized_mtm += self._matched_mtm() - before
+
+    def _matched_mtm(self):
+        matched = min(self.buy_qty, self.sell_qty)
+        return matched * (self.sell_avg - self.buy_avg) * self.multiplier if matched else 0.0
+
+    def get_dict(self):
+        return {
+            "exchange": self.exchange,
+            "code": self.code,
+            "product": self.product,
+            "symbol": self.symbol,
+            "multiplier": self.multiplier,
+            "buy_qty": self.buy_qty,
+            "buy_value": self.buy_value,
+            "buy_avg": self.buy_avg,
+            "sell_qty": self.sell_qty,
+            "sell_value": self.sell_value,
+            "sell_avg": self.sell_avg,
+            "net_qty": self.net_qty,
+            "net_value": self.net_value,
+            "realized_mtm": self.realized_mtm
+        }
+
+    @staticmethod
+    def from_net_position(row: NetPositionData):
+        position = Position(row.exchange, row.code, row.product, row.symbol, row.multiplier)
+        position.buy_qty = row.buy_qty
+        position.buy_value = float(row.buy_value)
+        position.sell_qty = row.sell_qty
+        position.sell_value = float(row.sell_value)
+        position.realized_mtm = float(row.realized_mtm)
+        return position
+
+class PositionEngine:
+    """
+    Net positions per (exchange, code, product), updated from WebSocket trade events.
+
+    Each `trade` event adds its fill to one Position in constant time, so exposure is
+    current as soon as the event is received instead of one `get_positions` call later.
+    Trades are counted once per (exchange, trade_no), so replayed events do not move
+    the position twice. The trade numbers seen are kept in an LRU of `capacity` keys,
+    which should hold more than a day's trades.
+
+    `reconcile` replaces the positions with the server's `get_positions('All')`, which
+    also brings in opening positions and the multipliers of derivatives. A position
+    that traded while the snapshot was in flight keeps its local value, because the
+    snapshot may or may not include that trade; every other position is replaced, so
+    reconciles make progress however busy the market is. `start_reconcile` runs it
+    periodically on a background thread.
+
+    The engine is attached to the WebSocket client before `seed` loads the first
+    snapshot, so no trade is missed while it downloads.
+
+    Attributes:
+        positions (dict): Position by (exchange, code, product)
+        capacity (int): Maximum number of trade numbers remembered
+        trades_applied (int): Number of trade events applied
+        reconciles (int): Number of snapshots applied
+        corrections (int): Number of positions a snapshot changed
+    """
+    def __init__(self, client=None, capacity: int=100000):
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than zero.")
+        self.client = client
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.positions = {}
+        self.trade_keys = OrderedDict()
+        self.trades_applied = 0
+        self.reconciles = 0
+        self.corrections = 0
+        self.keys_in_flight = None
+        self.stop_event = threading.Event()
+        self.reconcile_thread = None
+
+    def __len__(self):
+        return len(self.positions)
+
+    def apply_trade(self, trade: TradesBookData):
+        """
+        Add a fill to its position.
+
+        Args:
+            trade (TradesBookData): Trade from a `trade` event or the trades book
+
+        Returns:
+            bool: True if the trade was applied, False if it had been applied before
+        """
+        trade_key = (trade.exchange, trade.trade_no)
+        key = (trade.exchange, trade.code, trade.product)
+        with self.lock:
+            if trade.trade_no:
+                if trade_key in self.trade_keys:
+                    self.trade_keys.move_to_end(trade_key)
+                    return False
+                self.trade_keys[trade_key] = None
+                if len(self.trade_keys) > self.capacity:
+                    self.trade_keys.popitem(last=False)
+            position = self.positions.get(key)
+            if position is None:
+                position = self.positions[key] = Position(trade.exchange, trade.code, trade.product, trade.symbol)
+            position.add_trade(trade.side, trade.traded_qty, trade.traded_price)
+            self.trades_applied += 1
+            if self.keys_in_flight is not None:
+                self.keys_in_flight.add(key)
+            return True
+
+    def get(self, exchange: str, code: str, product: str):
+        """
+        Return the Position for an instrument and product, or None.
+        """
+        return self.positions.get((exchange, code, product))
+
+    def net_qty(self, exchange: str, code: str, product: str):
+        position = self.positions.get((exchange, code, product))
+        return position.net_qty if position is not None else 0
+
+    def get_positions(self):
+        with self.lock:
+            return list(self.positions.values())
+
+    def load(self, rows, keep=()):
+        """
+        Replace the positions with a server snapshot.
+
+        Args:
+            rows (list): NetPositionData rows from `get_positions('All')`
+            keep (collection, optional): Keys of positions that keep their local value. Defaults to ().
+
+        Returns:
+            int: Number of positions that differed from the snapshot
+        """
+        with self.lock:
+            return self._load(rows, keep)
+
+    def seed(self, deadline: float=None, attempts: int=3):
+        """
+        Load the first snapshot into an engine that is already receiving trades.
+
+        Unlike `reconcile`, positions that traded while the snapshot was in flight take
+        the snapshot too, since their local value holds only those trades. The snapshot
+        is then fetched again, up to `attempts` times in all, until one arrives with no
+        trade in flight; positions still unsettled after that are corrected by the
+        following reconciles.
+
+        Args:
+            deadline (float, optional): Latency budget in seconds for each request. Defaults to None.
+            attempts (int, optional): Maximum number of snapshots to fetch. Defaults to 3.
+
+        Returns:
+            bool: True if a snapshot arrived with no trade in flight
+        """
+        settled = self._reconcile(deadline, keep_traded=False)
+        for _ in range(attempts - 1):
+            if settled:
+                break
+            settled = self._reconcile(deadline, keep_traded=True)
+        return settled
+
+    def reconcile(self, deadline: float=None):
+        """
+        Fetch `get_positions('All')` and replace the positions with it, except those that
+        traded while it was in flight.
+
+        Args:
+            deadline (float, optional): Latency budget in seconds for the request. Defaults to None.
+
+        Returns:
+            bool: True if every position was replaced, False if some kept their local value
+        """
+        return self._reconcile(deadline, keep_traded=True)
+
+    def _reconcile(self, deadline, keep_traded):
+        self._begin_snapshot()
+        try:
+            with fresh_reads():
+                rows = self.client.get_positions('All', deadline=deadline).data
+        except Exception:
+            self._abort_snapshot()
+            raise
+        return self._apply_snapshot(rows, keep_traded)
+
+    def _begin_snapshot(self):
+        with self.lock:
+            self.keys_in_flight = set()
+
+    def _abort_snapshot(self):
+        with self.lock:
+            self.keys_in_flight = None
+
+    def _apply_snapshot(self, rows, keep_traded):
+        # Under the lock, so no trade lands between reading the keys and loading
+        with self.lock:
+            keys_in_flight, self.keys_in_flight = self.keys_in_flight, None
+            self._load(rows, keys_in_flight if keep_traded else ())
+        return not keys_in_flight
+
+    def start_reconcile(self, interval: float=60):
+        """
+        Reconcile every `interval` seconds on a background thread until `stop_reconcile`.
+        """
+        if interval <= 0:
+            raise ValueError("Reconcile interval must be greater than zero.")
+        self.stop_reconcile()
+        self.stop_event.clear()
+        self.reconcile_thread = threading.Thread(target=self._reconcile_loop, args=(interval,), name="tradex-position-reconcile", daemon=True)
+        self.reconcile_thread.start()
+
+    def stop_reconcile(self):
+        if self.reconcile_thread:
+            self.stop_event.set()
+            self.reconcile_thread.join()
+            self.reconcile_thread = None
+
+    def _reconcile_loop(self, interval):
+        while not self.stop_event.wait(interval):
+            try:
+                self.reconcile()
+            except Exception as e:
+                logger.warning("Position reconcile failed: %s", e)
+
+    def _load(self, rows, keep):
+        snapshot = {}
+        for row in rows:
+            position = Position.from_net_position(row)
+            snapshot[(position.exchange, position.code, position.product)] = position
+        for key in keep:
+            position = self.positions.get(key)
+            if position is not None:
+                snapshot[key] = position
+            else:
+                snapshot.pop(key, None)
+        changed = self._count_changes(snapshot)
+        self.positions = snapshot
+        self.reconciles += 1
+        self.corrections += changed
+        return changed
+
+    def _count_changes(self, snapshot):
+        changed = 0
+        for key in self.positions.keys() | snapshot.keys():
+            current = self.positions.get(key)
+            expected = snapshot.get(key)
+            if current is None or expected is None:
+                changed += 1
+            elif (current.buy_qty, current.sell_qty) != (expected.buy_qty, expected.sell_qty) \
+                    or abs(current.buy_value - expected.buy_value) > 0.005 \
+                    or abs(current.sell_value - expected.sell_value) > 0.005:
+                changed += 1
+        return changed
+
+class AsyncPositionEngine(PositionEngine):
+    """
+    PositionEngine for AsyncTradeXClient.
+
+    Trades are applied the same way, from the asyncio WebSocket client's receiver task.
+    `seed` and `reconcile` are coroutines awaiting the client's `get_positions`, and
+    `start_reconcile` runs the periodic reconcile as a task on the running event loop.
+    """
+    def __init__(self, client=None, capacity: int=100000):
+        super().__init__(client, capacity)
+        self.reconcile_task = None
+
+    async def seed(self, deadline: float=None, attempts: int=3):
+        """
+        Load the first snapshot into an engine that is already receiving trades.
+
+        See PositionEngine.seed.
+        """
+        settled = await self._reconcile(deadline, keep_traded=False)
+        for _ in range(attempts - 1):
+            if settled:
+                break
+            settled = await self._reconcile(deadline, keep_traded=True)
+        return settled
+
+    async def reconcile(self, deadline: float=None):
+        """
+        Fetch `get_positions('All')` and replace the positions with it, except those that
+        traded while it was in flight.
+
+        See PositionEngine.reconcile.
+        """
+        return await self._reconcile(deadline, keep_traded=True)
+
+    async def _reconcile(self, deadline, keep_traded):
+        self._begin_snapshot()
+        try:
+            with fresh_reads():
+                rows = (await self.client.get_positions('All', deadline=deadline)).data
+        except BaseException:
+            # Also when cancelled, so trades stop being collected
+            self._abort_snapshot()
+            raise
+        return self._apply_snapshot(rows, keep_traded)
+
+    def start_reconcile(self, interval: float=60):
+        """
+        Reconcile every `interval` seconds in a task on the running event loop until `stop_reconcile`.
+        """
+        if interval <= 0:
+            raise ValueError("Reconcile interval must be greater than zero.")
+        self.stop_reconcile()
+        self.reconcile_task = asyncio.ensure_future(self._reconcile_loop(interval))
+
+    def stop_reconcile(self):
+        if self.reconcile_task:
+            self.reconcile_task.cancel()
+            self.reconcile_task = None
+
+    async def _reconcile_loop(self, interval):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reconcile()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Position reconcile failed: %s", e)
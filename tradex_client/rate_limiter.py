@@ -0,0 +1,264 @@
+import asyncio
+import itertools
+import threading
+import time
+
+from .constants import endpoint_priorities
+from .exceptions import TradeXRateLimitError, TradeXTimeoutError
+
+BLOCK = "block"
+NON_BLOCKING = "nonblock"
+PRIORITY = "priority"
+
+# Priority of endpoints missing from `endpoint_priorities`: reads go last
+READ_PRIORITY = 2
+
+def request_exchanges(payload: dict):
+    """
+    Return the exchange of each order a request carries: the request's own `exchange`,
+    or one entry per order of a basket.
+    """
+    if not payload:
+        return ()
+    exchange = payload.get("exchange")
+    if exchange:
+        return (exchange,)
+    orders = payload.get("orders")
+    if orders:
+        return tuple(order.get("exchange") for order in orders if order.get("exchange"))
+    return ()
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at `rate` tokens per second, up to `burst` tokens.
+
+    Attributes:
+        rate (float): Tokens added per second
+        burst (float): Maximum number of tokens, i.e. the largest burst allowed
+        tokens (float): Tokens available at the last refill
+    """
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float=None):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than zero.")
+        burst = burst if burst is not None else max(rate, 1)
+        if burst < 1:
+            raise ValueError("Burst must be at least one token.")
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def wait_time(self, now: float, tokens: float=1):
+        """
+        Return the seconds until `tokens` tokens are available, 0.0 if they are now.
+        """
+        self.refill(now)
+        if self.tokens >= tokens:
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+    def __repr__(self):
+        return f"TokenBucket(rate={self.rate}, burst={self.burst})"
+
+def make_bucket(limit):
+    """
+    Build a TokenBucket from a limit: a rate in requests per second, or a (rate, burst) tuple.
+    """
+    if isinstance(limit, (tuple, list)):
+        return TokenBucket(*limit)
+    return TokenBucket(limit)
+
+class RateLimiter:
+    """
+    Client-side rate governor with token buckets per endpoint and per exchange.
+
+    A request takes one token from its endpoint's bucket and one token per order from
+    the bucket of each exchange it trades on, all at once; endpoints and exchanges
+    without a limit are not throttled. What happens when a bucket is empty depends on
+    `mode`:
+
+    - "block": the request waits for its tokens, first come first served among the
+      requests that share a bucket.
+    - "nonblock": TradeXRateLimitError is raised at once, before anything is sent.
+    - "priority": the request waits like in "block" mode, but waiting requests are
+      served by endpoint priority (`constants.endpoint_priorities`: cancels, then
+      order entry, then reads), first come first served within a priority. A cancel
+      arriving while new orders wait is sent as soon as a token is free.
+
+    A waiting request never waits past its call's deadline; it raises
+    TradeXTimeoutError instead.
+
+    Attributes:
+        mode (str): "block", "nonblock" or "priority"
+        endpoint_buckets (dict): TokenBucket by endpoint
+        exchange_buckets (dict): TokenBucket by exchange
+        priorities (dict): Priority by endpoint, lower first
+    """
+    def __init__(self, endpoint_limits: dict=None, exchange_limits: dict=None, mode: str=BLOCK, priorities: dict=None):
+        if mode not in (BLOCK, NON_BLOCKING, PRIORITY):
+            raise ValueError(f"Invalid rate limiter mode: {mode}. Allowed Modes: {BLOCK}, {NON_BLOCKING}, {PRIORITY}")
+        self.mode = mode
+        self.endpoint_buckets = {endpoint: make_bucket(limit) for endpoint, limit in (endpoint_limits or {}).items()}
+        self.exchange_buckets = {exchange: make_bucket(limit) for exchange, limit in (exchange_limits or {}).items()}
+        self.priorities = {**endpoint_priorities, **(priorities or {})}
+        self.condition = threading.Condition()
+        self.sequence = itertools.count()
+        # (priority, sequence) and needed tokens of every waiting request
+        self.waiters = {}
+        self.reset_metrics()
+
+    def acquire(self, endpoint: str, exchanges=(), deadline_at: float=None):
+        """
+        Take the tokens for one request, waiting for them unless the mode is "nonblock".
+
+        Args:
+            endpoint (str): API endpoint of the request
+            exchanges (sequence, optional): Exchange of each order in the request. Defaults to ().
+            deadline_at (float, optional): `time.monotonic()` time to give up waiting at. Defaults to None.
+
+        Returns:
+            float: Seconds spent waiting
+
+        Raises:
+            TradeXRateLimitError: In "nonblock" mode, if the tokens are not available
+            TradeXTimeoutError: If the deadline passes while waiting
+        """
+        needed = self._needed_tokens(endpoint, exchanges)
+        if not needed:
+            return 0.0
+        key = self._waiter_key(endpoint)
+        started = time.monotonic()
+        with self.condition:
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = self._try_take(key, needed, now)
+                    if wait == 0.0:
+                        return self._acquired(key, started, now)
+                    wait = self._wait_or_give_up(endpoint, key, needed, wait, now, deadline_at)
+                    self.condition.wait(wait)
+            finally:
+                if self.waiters.pop(key, None) is not None:
+                    self.condition.notify_all()
+
+    async def acquire_async(self, endpoint: str, exchanges=(), deadline_at: float=None):
+        """
+        Take the tokens for one request without blocking the event loop; see `acquire`.
+        """
+        needed = self._needed_tokens(endpoint, exchanges)
+        if not needed:
+            return 0.0
+        key = self._waiter_key(endpoint)
+        started = time.monotonic()
+        try:
+            while True:
+                with self.condition:
+                    now = time.monotonic()
+                    wait = self._try_take(key, needed, now)
+                    if wait == 0.0:
+                        return self._acquired(key, started, now)
+                    wait = self._wait_or_give_up(endpoint, key, needed, wait, now, deadline_at)
+                if wait is None:
+                    # Behind another request: check again after the time one token takes
+                    wait = min(1 / bucket.rate for bucket in needed)
+                    if deadline_at is not None:
+                        wait = min(wait, deadline_at - now)
+                await asyncio.sleep(wait)
+        finally:
+            with self.condition:
+                if self.waiters.pop(key, None) is not None:
+                    self.condition.notify_all()
+
+    def get_metrics(self):
+        """
+        Return a snapshot of the limiter metrics.
+
+        Returns:
+            dict: `acquired`, `throttled` (requests that had to wait), `rejected`, `timed_out`,
+                `waiting`, `total_wait` and `max_wait` (seconds)
+        """
+        with self.condition:
+            return {
+                "acquired": self.acquired,
+                "throttled": self.throttled,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "waiting": len(self.waiters),
+                "total_wait": self.total_wait,
+                "max_wait": self.max_wait
+            }
+
+    def reset_metrics(self):
+        with self.condition:
+            self.acquired = 0
+            self.throttled = 0
+            self.rejected = 0
+            self.timed_out = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+
+    def _needed_tokens(self, endpoint, exchanges):
+        """Return {bucket: tokens} for a request. A basket never needs more than a full bucket."""
+        needed = {}
+        bucket = self.endpoint_buckets.get(endpoint)
+        if bucket is not None:
+            needed[bucket] = 1
+        for exchange in exchanges:
+            bucket = self.exchange_buckets.get(exchange)
+            if bucket is not None:
+                needed[bucket] = min(needed.get(bucket, 0) + 1, bucket.burst)
+        return needed
+
+    def _waiter_key(self, endpoint):
+        priority = self.priorities.get(endpoint, READ_PRIORITY) if self.mode == PRIORITY else 0
+        return (priority, next(self.sequence))
+
+    def _try_take(self, key, needed, now):
+        """
+        Take the tokens if no request ahead shares a bucket and all are available.
+        Returns 0.0 if taken, None if a request ahead waits, else the seconds to wait.
+        Called with the condition held.
+        """
+        for other, other_needed in self.waiters.items():
+            if other < key and not needed.keys().isdisjoint(other_needed.keys()):
+                return None
+        wait = 0.0
+        for bucket, tokens in needed.items():
+            wait = max(wait, bucket.wait_time(now, tokens))
+        if wait > 0.0:
+            return wait
+        for bucket, tokens in needed.items():
+            bucket.tokens -= tokens
+        return 0.0
+
+    def _wait_or_give_up(self, endpoint, key, needed, wait, now, deadline_at):
+        """Register the request as waiting and return how long to wait, or raise. Called with the condition held."""
+        if self.mode == NON_BLOCKING:
+            self.rejected += 1
+            raise TradeXRateLimitError(f"Rate limit reached for endpoint: {endpoint}")
+        if deadline_at is not None:
+            remaining = deadline_at - now
+            if remaining <= 0:
+                self.timed_out += 1
+                raise TradeXTimeoutError(f"Deadline spent waiting for the rate limit of endpoint: {endpoint}")
+            wait = remaining if wait is None else min(wait, remaining)
+        self.waiters[key] = needed
+        return wait
+
+    def _acquired(self, key, started, now):
+        """Record a successful acquire. Called with the condition held."""
+        waited = now - started
+        self.acquired += 1
+        if key in self.waiters:
+            self.throttled += 1
+            self.total_wait += waited
+            if waited > self.max_wait:
+                self.max_wait = waited
+        return waited
@@ -0,0 +1,207 @@
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+
+from .constants import cache_ttls, event_cache_invalidations, endpoint_cache_invalidations
+from .singleflight import call_key, shared_reads
+
+# Returned by `ResponseCache.get` on a miss, since None is a valid response
+MISSING = object()
+
+class ResponseCache:
+    """
+    TTL cache of read endpoint responses, bounded in size with LRU eviction.
+
+    Only endpoints with a TTL are cached (`constants.cache_ttls`, e.g. "Holdings" or
+    "FundsReport", merged with the `ttls` given). Entries are keyed by endpoint and
+    call arguments, and a hit returns the cached response object itself, so treat
+    responses as read-only.
+
+    Invalidating an endpoint bumps its generation instead of searching the entries,
+    so it costs the same however many entries there are; stale entries are dropped
+    when next looked up or evicted. A response fetched while its endpoint was
+    invalidated is not stored, because it may predate the change.
+
+    Invalidation happens:
+
+    - explicitly, with `invalidate(endpoint)` or `invalidate()` for everything;
+    - after requests that change server state (`constants.endpoint_cache_invalidations`,
+      e.g. NewOrder invalidates the order book and funds);
+    - on WebSocket events (`constants.event_cache_invalidations`: order events
+      invalidate the order books and funds, trade events also trades, positions and
+      holdings), and on every WebSocket (re)connection for the events that may have
+      been missed.
+
+    Attributes:
+        ttls (dict): Seconds an entry lives, by endpoint
+        maxsize (int): Maximum number of entries
+    """
+    def __init__(self, ttls: dict=None, maxsize: int=1024):
+        if maxsize <= 0:
+            raise ValueError("Cache size must be greater than zero.")
+        self.ttls = {**cache_ttls, **(ttls or {})}
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.generations = {}
+        self.reset_metrics()
+
+    def is_cached(self, endpoint: str):
+        return bool(self.ttls.get(endpoint))
+
+    def get(self, key):
+        """
+        Return the live entry for `key`, or MISSING.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires_at, generation, value = entry
+                if generation == self.generations.get(key[0], 0) and time.monotonic() < expires_at:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self.entries[key]
+            self.misses += 1
+            return MISSING
+
+    def generation(self, endpoint: str):
+        """
+        Return the endpoint's current generation, to pass to `put` with the response fetched next.
+        """
+        return self.generations.get(endpoint, 0)
+
+    def put(self, key, value, generation: int):
+        """
+        Store a response unless its endpoint was invalidated since `generation` was read.
+
+        Returns:
+            bool: True if stored
+        """
+        endpoint = key[0]
+        ttl = self.ttls.get(endpoint)
+        if not ttl:
+            return False
+        with self.lock:
+            if generation != self.generations.get(endpoint, 0):
+                return False
+            self.entries[key] = (time.monotonic() + ttl, generation, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, endpoint: str=None):
+        """
+        Drop the cached responses of an endpoint, or of every endpoint when None.
+        """
+        with self.lock:
+            if endpoint is None:
+                for name in set(self.ttls) | set(self.generations):
+                    self.generations[name] = self.generations.get(name, 0) + 1
+                self.entries.clear()
+            else:
+                self.generations[endpoint] = self.generations.get(endpoint, 0) + 1
+            self.invalidations += 1
+
+    def invalidate_event(self, event_type: str):
+        """
+        Drop the responses a WebSocket event of this type makes stale.
+        """
+        for endpoint in event_cache_invalidations.get(event_type, ()):
+            self.invalidate(endpoint)
+
+    def invalidate_after(self, endpoint: str):
+        """
+        Drop the responses a request to `endpoint` makes stale.
+        """
+        if endpoint == "Login" or endpoint == "Logout":
+            # Responses cached for the previous session
+            self.invalidate()
+            return
+        for name in endpoint_cache_invalidations.get(endpoint, ()):
+            self.invalidate(name)
+
+    def invalidate_events(self):
+        """
+        Drop every response a WebSocket event could have made stale, e.g. after a reconnection.
+        """
+        for endpoints in event_cache_invalidations.values():
+            for endpoint in endpoints:
+                self.invalidate(endpoint)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get_metrics(self):
+        """
+        Return a snapshot of the cache metrics.
+
+        Returns:
+            dict: `size`, `hits`, `misses`, `evictions` and `invalidations`
+        """
+        with self.lock:
+            return {
+                "size": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+
+    def reset_metrics(self):
+        with self.lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.invalidations = 0
+
+def cached(endpoint: str):
+    """
+    Decorate a read endpoint method so that its responses are served from the client's
+    `response_cache` while fresh.
+
+    The call is made as usual when the client has no cache, the endpoint has no TTL or
+    inside `fresh_reads()`; a fresh response is still stored. Apply it below
+    `@coalesced`, so that only the caller that sent a request stores its response.
+    Works for plain and coroutine methods.
+    """
+    def decorate(method):
+        signature = inspect.signature(method)
+
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                cache = self.response_cache
+                if cache is None or not cache.is_cached(endpoint):
+                    return await method(self, *args, **kwargs)
+                key, _ = call_key(signature, endpoint, self, args, kwargs)
+                if shared_reads.get():
+                    value = cache.get(key)
+                    if value is not MISSING:
+                        return value
+                generation = cache.generation(endpoint)
+                value = await method(self, *args, **kwargs)
+                cache.put(key, value, generation)
+                return value
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = self.response_cache
+            if cache is None or not cache.is_cached(endpoint):
+                return method(self, *args, **kwargs)
+            key, _ = call_key(signature, endpoint, self, args, kwargs)
+            if shared_reads.get():
+                value = cache.get(key)
+                if value is not MISSING:
+                    return value
+            generation = cache.generation(endpoint)
+            value = method(self, *args, **kwargs)
+            cache.put(key, value, generation)
+            return value
+        return wrapper
+    return decorate
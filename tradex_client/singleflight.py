@@ -0,0 +1,187 @@
+import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
+import threading
+
+from .exceptions import TradeXAPIError, TradeXTimeoutError
+
+# Cleared by `fresh_reads` for callers that need a request sent after they asked
+shared_reads = contextvars.ContextVar("tradex_shared_reads", default=True)
+
+@contextlib.contextmanager
+def fresh_reads():
+    """
+    Within this block, reads on the current thread or task send their own request
+    instead of joining one already in flight or using a cached response.
+
+    Used where a snapshot must not predate the caller, e.g. resyncing after a
+    reconnection or reconciling positions.
+    """
+    token = shared_reads.set(False)
+    try:
+        yield
+    finally:
+        shared_reads.reset(token)
+
+def call_key(signature, name, self, args, kwargs):
+    """
+    Return the identity of a read call, `(name, *arguments)` without `deadline`, and its deadline.
+    """
+    arguments = signature.bind(self, *args, **kwargs)
+    arguments.apply_defaults()
+    arguments = arguments.arguments
+    deadline = arguments.pop("deadline", None)
+    arguments.pop("self", None)
+    return (name,) + tuple(arguments.values()), deadline
+
+class Flight:
+    """One request in flight, shared by its caller and the callers that joined it."""
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls into one.
+
+    The first caller for a key runs the call; callers asking for the same key while
+    it is in flight wait for it and receive the same result object, or the same
+    exception. The key is forgotten as soon as the call returns, so nothing is
+    cached: a call made after it returns runs again.
+
+    Attributes:
+        executed (int): Number of calls run
+        coalesced (int): Number of callers that shared a call instead of running their own
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flights = {}
+        self.async_flights = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, function, timeout: float=None):
+        """
+        Run `function()`, or wait for the identical call in flight and share its result.
+
+        Args:
+            key: Hashable identity of the call
+            function (callable): Function that makes the call
+            timeout (float, optional): Seconds to wait for a call in flight. Defaults to None.
+
+        Raises:
+            TradeXTimeoutError: If the call in flight does not finish within `timeout`
+        """
+        with self.lock:
+            flight = self.flights.get(key)
+            if flight is None:
+                flight = self.flights[key] = Flight()
+                self.executed += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            if not flight.done.wait(timeout):
+                raise TradeXTimeoutError(f"Deadline spent waiting for the request in flight: {key[0]}")
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = function()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.flights[key]
+            flight.done.set()
+
+    async def do_async(self, key, function, timeout: float=None):
+        """
+        Await `function()`, or the identical call in flight on the same event loop; see `do`.
+
+        If the caller running the call is cancelled, the callers that joined it raise
+        TradeXAPIError rather than CancelledError.
+        """
+        key = (asyncio.get_running_loop(), key)
+        with self.lock:
+            future = self.async_flights.get(key)
+            if future is None:
+                future = self.async_flights[key] = key[0].create_future()
+                self.executed += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.TimeoutError:
+                raise TradeXTimeoutError(f"Deadline spent waiting for the request in flight: {key[1][0]}")
+
+        try:
+            result = await function()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            # The leader's cancellation is its own; the callers that joined get an error instead
+            future.set_exception(TradeXAPIError(f"The request in flight was cancelled by the caller that sent it: {key[1][0]}"))
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Marks the exception as retrieved when nobody joined the call
+            future.exception()
+            raise
+        finally:
+            with self.lock:
+                del self.async_flights[key]
+
+    def get_metrics(self):
+        with self.lock:
+            return {
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "in_flight": len(self.flights) + len(self.async_flights)
+            }
+
+def coalesced(method):
+    """
+    Decorate a read endpoint method so that identical concurrent calls share one request.
+
+    Calls are identical when every argument other than `deadline` is equal; a caller
+    that joins a request waits at most its own deadline. Coalescing is skipped when the
+    client's `singleflight` is None or inside `fresh_reads()`. Works for plain and
+    coroutine methods.
+    """
+    signature = inspect.signature(method)
+    name = method.__name__
+
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            singleflight = self.singleflight
+            if singleflight is None or not shared_reads.get():
+                return await method(self, *args, **kwargs)
+            key, deadline = call_key(signature, name, self, args, kwargs)
+            return await singleflight.do_async(key, lambda: method(self, *args, **kwargs), deadline)
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        singleflight = self.singleflight
+        if singleflight is None or not shared_reads.get():
+            return method(self, *args, **kwargs)
+        key, deadline = call_key(signature, name, self, args, kwargs)
+        return singleflight.do(key, lambda: method(self, *args, **kwargs), deadline)
+    return wrapper
@@ -0,0 +1,198 @@
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from .instrumentation import WEBSOCKET
+
+logger = logging.getLogger(__name__)
+
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+CONFLATE = "conflate"
+
+# Seconds between warnings about a subscriber dropping events
+DROP_WARNING_INTERVAL = 10.0
+
+class SubscriberQueue:
+    """
+    Bounded event queue with its own delivery thread, for one WebSocket subscriber.
+
+    Events are delivered to `callback` one at a time in the order they were queued. What
+    happens when the subscriber falls `maxsize` events behind depends on `overflow`:
+
+    - "block": `put` waits for room, which holds up the receiver like the shared
+      callback dispatcher does.
+    - "drop_oldest": the oldest waiting event is dropped to make room.
+    - "conflate": an `order` event replaces the waiting event for the same
+      `exchange_order_no`, keeping its place in the queue, so only the latest state of
+      each order is delivered. Other events, and order events that find no waiting
+      event for their order when the queue is full, drop the oldest waiting event.
+
+    With "drop_oldest" and "conflate" `put` never waits, so a stalled callback cannot
+    hold up the receiver and memory stays bounded. Dropped events are lost to the
+    subscriber: the first drop is logged as a warning, naming the subscriber and the
+    dropped event's type, and further drops at most every `DROP_WARNING_INTERVAL` seconds.
+
+    Attributes:
+        callback (callable): Function called with each event's data
+        maxsize (int): Maximum number of waiting events
+        overflow (str): "block", "drop_oldest" or "conflate"
+        is_running (bool): Whether the delivery thread is running
+    """
+    def __init__(self, callback, maxsize: int=1000, overflow: str=BLOCK, name: str="tradex-subscriber"):
+        if maxsize <= 0:
+            raise ValueError("Subscriber queue size must be greater than zero.")
+        if overflow not in (BLOCK, DROP_OLDEST, CONFLATE):
+            raise ValueError(f"Invalid overflow policy: {overflow}. Allowed Policies: {BLOCK}, {DROP_OLDEST}, {CONFLATE}")
+
+        self.callback = callback
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.name = name
+        self.is_running = False
+        self.events = OrderedDict()
+        self.sequence = itertools.count()
+        self.condition = threading.Condition()
+        self.delivery_thread = None
+        self.instrumentation = None
+        self.last_drop_warning = None
+        self.reset_metrics()
+
+    def start(self):
+        with self.condition:
+            if self.is_running:
+                return
+            self.is_running = True
+        self.delivery_thread = threading.Thread(target=self._delivery_loop, name=self.name, daemon=True)
+        self.delivery_thread.start()
+
+    def stop(self, wait: bool=True):
+        """
+        Stop the delivery thread after the events already queued have been delivered.
+
+        Args:
+            wait (bool, optional): Block until the thread has finished. Defaults to True.
+        """
+        with self.condition:
+            if not self.is_running:
+                return
+            self.is_running = False
+            self.condition.notify_all()
+        if wait and self.delivery_thread is not threading.current_thread():
+            self.delivery_thread.join()
+        self.delivery_thread = None
+
+    def put(self, message_type: str, data):
+        """
+        Queue an event, applying the overflow policy if the queue is full.
+
+        Returns:
+            bool: True if the event was queued or conflated, False if the queue is stopped
+        """
+        key = None
+        if self.overflow == CONFLATE and message_type == "order":
+            exchange_order_no = getattr(data, "exchange_order_no", None)
+            if exchange_order_no:
+                key = exchange_order_no
+        if key is None:
+            key = next(self.sequence)
+
+        dropped_type = None
+        with self.condition:
+            if not self.is_running:
+                return False
+            if key in self.events:
+                self.events[key] = (message_type, data, time.monotonic())
+                self.conflated += 1
+                return True
+            while len(self.events) >= self.maxsize:
+                if self.overflow != BLOCK:
+                    _, (dropped_type, _, _) = self.events.popitem(last=False)
+                    self.dropped += 1
+                    break
+                self.condition.wait()
+                if not self.is_running:
+                    return False
+            self.events[key] = (message_type, data, time.monotonic())
+            self.queued += 1
+            if len(self.events) > self.max_queue_depth:
+                self.max_queue_depth = len(self.events)
+            self.condition.notify_all()
+            dropped = self.dropped
+
+        if dropped_type is not None:
+            self._warn_dropped(dropped_type, dropped)
+        return True
+
+    def _warn_dropped(self, message_type, dropped):
+        now = time.monotonic()
+        if self.last_drop_warning is not None and now - self.last_drop_warning < DROP_WARNING_INTERVAL:
+            return
+        self.last_drop_warning = now
+        logger.warning(
+            "Subscriber %s (%s) is %d events behind and dropped a %s event; %d events dropped so far",
+            self.name, getattr(self.callback, "__qualname__", repr(self.callback)), self.maxsize, message_type, dropped
+        )
+
+    def qsize(self):
+        return len(self.events)
+
+    def get_metrics(self):
+        """
+        Return a snapshot of the queue metrics.
+
+        Returns:
+            dict: `queue_depth`, `max_queue_depth`, `queued`, `delivered`, `failed`, `dropped`,
+                `conflated` and `max_delivery_latency` (seconds from queueing to the callback)
+        """
+        with self.condition:
+            return {
+                "queue_depth": len(self.events),
+                "max_queue_depth": self.max_queue_depth,
+                "queued": self.queued,
+                "delivered": self.delivered,
+                "failed": self.failed,
+                "dropped": self.dropped,
+                "conflated": self.conflated,
+                "max_delivery_latency": self.max_delivery_latency
+            }
+
+    def reset_metrics(self):
+        with self.condition:
+            self.queued = 0
+            self.delivered = 0
+            self.failed = 0
+            self.dropped = 0
+            self.conflated = 0
+            self.max_queue_depth = 0
+            self.max_delivery_latency = 0.0
+
+    def _delivery_loop(self):
+        while True:
+            with self.condition:
+                while not self.events and self.is_running:
+                    self.condition.wait()
+                if not self.events:
+                    return
+                _, (message_type, data, queued_at) = self.events.popitem(last=False)
+                self.condition.notify_all()
+            latency = time.monotonic() - queued_at
+            failed = False
+            instrumentation = self.instrumentation
+            started = time.perf_counter_ns() if instrumentation is not None and instrumentation.enabled else 0
+            try:
+                self.callback(data)
+            except Exception as e:
+                failed = True
+                logger.error("Callback execution failed for %s: %s", message_type, e, exc_info=True)
+            if started:
+                instrumentation.record(WEBSOCKET, str(message_type), "callback", time.perf_counter_ns() - started)
+
+            with self.condition:
+                self.delivered += 1
+                if failed:
+                    self.failed += 1
+                if latency > self.max_delivery_latency:
+                    self.max_delivery_latency = latency
@@ -0,0 +1,140 @@
+import itertools
+import threading
+
+# Fields a subscription can filter on, and the name of the field in each event's
+# decoded `data` dictionary. Trade events carry their order's status as `order_status`.
+filter_fields = ("exchange", "code", "client", "status")
+event_field_names = {
+    "trade": {"status": "order_status"},
+}
+
+class Subscription:
+    """
+    One subscriber to one event type, with optional field filters.
+
+    A filter value is a single value or a collection of accepted values; a field
+    without a filter accepts any value. Keep the object to pass to `unsubscribe`.
+
+    Attributes:
+        event_type (str): Event type the subscriber receives
+        callback (callable): Function called with each matching event
+        filters (dict): Accepted values by field, as frozensets
+        subscription_id (int): Sequence number, in subscription order
+        queue (SubscriberQueue): The subscriber's own queue, or None to use the shared dispatcher
+    """
+    __slots__ = ("event_type", "callback", "filters", "checks", "subscription_id", "queue")
+
+    def __init__(self, event_type: str, callback, filters: dict, subscription_id: int, queue=None):
+        self.event_type = event_type
+        self.callback = callback
+        self.filters = filters
+        self.queue = queue
+        names = event_field_names.get(event_type, {})
+        # (field name in the event data, accepted values), ready for the match loop
+        self.checks = tuple((names.get(field, field), values) for field, values in filters.items())
+        self.subscription_id = subscription_id
+
+    def matches(self, data: dict):
+        """
+        Return True if the decoded event data passes every filter.
+        """
+        for name, values in self.checks:
+            if data.get(name) not in values:
+                return False
+        return True
+
+    def __repr__(self):
+        return f"Subscription({self.event_type!r}, {self.callback!r}, filters={self.filters!r})"
+
+class SubscriptionBus:
+    """
+    Fan-out of WebSocket events to any number of subscribers per event type.
+
+    Filters are checked against the decoded JSON dictionary of the event, so the
+    WebSocket client only builds an OrderBookData or TradesBookData when at least one
+    subscriber (or the order store, position engine or resync) wants the event.
+
+    Subscribing and unsubscribing replace the per-type tuple of subscriptions instead
+    of changing it, so `match` can run on the receiver thread without a lock while
+    other threads subscribe.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscriptions = {}
+        self.ids = itertools.count(1)
+
+    def subscribe(self, event_type: str, callback, exchange=None, code=None, client=None, status=None, queue=None):
+        """
+        Call `callback` with every `event_type` event that passes the filters.
+
+        Args:
+            event_type (str): Event type, e.g. "order" or "trade"
+            callback (callable): Function to call with the event
+            exchange (str | collection, optional): Accepted exchanges. Defaults to any.
+            code (str | collection, optional): Accepted instrument codes. Defaults to any.
+            client (str | collection, optional): Accepted client IDs. Defaults to any.
+            status (str | collection, optional): Accepted order statuses. Defaults to any.
+            queue (SubscriberQueue, optional): Queue that delivers this subscriber's events.
+                Defaults to None.
+
+        Returns:
+            Subscription: Handle for `unsubscribe`
+        """
+        if not callable(callback):
+            raise ValueError("Callback must be callable.")
+        filters = {}
+        for field, value in zip(filter_fields, (exchange, code, client, status)):
+            if value is None:
+                continue
+            if isinstance(value, (str, int)):
+                value = (value,)
+            filters[field] = frozenset(value)
+
+        subscription = Subscription(event_type, callback, filters, next(self.ids), queue)
+        with self.lock:
+            self.subscriptions[event_type] = self.subscriptions.get(event_type, ()) + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """
+        Stop delivering events to a subscription.
+
+        Returns:
+            bool: True if the subscription was active, False otherwise
+        """
+        with self.lock:
+            current = self.subscriptions.get(subscription.event_type, ())
+            remaining = tuple(item for item in current if item is not subscription)
+            if len(remaining) == len(current):
+                return False
+            if remaining:
+                self.subscriptions[subscription.event_type] = remaining
+            else:
+                del self.subscriptions[subscription.event_type]
+            return True
+
+    def get_subscriptions(self):
+        """
+        Return every active subscription, in subscription order.
+        """
+        subscriptions = [subscription for items in list(self.subscriptions.values()) for subscription in items]
+        return sorted(subscriptions, key=lambda subscription: subscription.subscription_id)
+
+    def has_subscribers(self, event_type: str):
+        return event_type in self.subscriptions
+
+    def match(self, event_type: str, data: dict):
+        """
+        Return the subscriptions that want an event, in subscription order.
+
+        Args:
+            event_type (str): Event type
+            data (dict): Decoded `data` dictionary of the event
+
+        Returns:
+            list: Matching subscriptions
+        """
+        subscriptions = self.subscriptions.get(event_type)
+        if not subscriptions:
+            return []
+        return [subscription for subscription in subscriptions if subscription.matches(data)]
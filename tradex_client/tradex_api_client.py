@@ -1,9 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
+import time
 import requests
 from dataclasses import asdict
-from dotenv import load_dotenv, set_key, get_key
+from dotenv import set_key, get_key
 import os
 import json
+import logging
 from urllib.parse import urlparse
 from tradex_client.models.cancel_all_orders import CancelAllOrderRequest,CancelAllOrderResponse
 
@@ -12,6 +15,7 @@ from tradex_client.models.cancel_order import CancelOrderRequest, CancelOrderDat
 from tradex_client.models.convert_position import ConvertPositionRequest, ConvertPositionData, ConvertPositionResponse
 from tradex_client.models.exchange_status import ExchangeStatusData, ExchangeStatusResponse
 from tradex_client.models.execute_basket_orders import ExecuteBasketOrderRequest, ExecuteBasketData, ExecuteBasketResponse
+from tradex_client.models.frames import OrderBookFrame, TradesFrame, NetPositionFrame, HoldingsFrame
 from tradex_client.models.funds_report import FundsReportData, FundsReportResponse
 from tradex_client.models.gtt_order_book import GTTOrderBookData, GTTOrdersBookResponse
 from tradex_client.models.holdings import HoldingsData, HoldingsResponse
@@ -24,12 +28,26 @@ from tradex_client.models.new_order import NewOrderRequest, NewOrderData, NewOrd
 from tradex_client.models.order_history import OrderHistoryRequest, OrderHistoryData, OrderHistoryResponse
 from tradex_client.models.order_status import OrderStatusRequest, OrderStatusData, OrderStatusResponse
 from tradex_client.models.orders_book import OrderBookResponse, OrderBookData
+from tradex_client.models.portfolio_snapshot import PortfolioSnapshot
 from tradex_client.models.positions import NetPositionData, NetPositionResponse
 from tradex_client.models.trades_book import TradesBookData, TradesBookResponse
 from tradex_client.models.user_profile import UserProfileData, UserProfileResponse
 
-from tradex_client.exceptions import TradeXAPIError, TradeXAuthenticationError, TradeXDataFetchError, TradeXInvalidResponseError
+from tradex_client.config import load_env, invalidate_env
+from tradex_client.constants import endpoint_timeouts as default_endpoint_timeouts, validation_policies
+from tradex_client.exceptions import TradeXAPIError, TradeXAuthenticationError, TradeXDataFetchError, TradeXInvalidResponseError, TradeXTimeoutError
 from tradex_client.tradex_websocket_client import TradeXWebSocketClient
+from tradex_client.order_gateway import OrderGateway
+from tradex_client.order_store import OrderStore, order_book_filters
+from tradex_client.position_engine import PositionEngine
+from tradex_client.event_resync import EventResync
+from tradex_client.instrumentation import Instrumentation, timed_endpoint
+from tradex_client.rate_limiter import RateLimiter, request_exchanges
+from tradex_client.response_cache import ResponseCache, cached
+from tradex_client.singleflight import SingleFlight, coalesced, fresh_reads
+from tradex_client.log import logger as package_logger, enable_logging
+
+logger = logging.getLogger(__name__)
 
 class TradeXClient:
     """
@@ -43,14 +61,20 @@ class TradeXClient:
     parameter passing, and can optionally save credentials to a .env file for later use.
     
     Attributes:
-        debug (bool): Flag to enable verbose debug output
+        debug (bool): Flag to enable verbose debug output through the `tradex_client` logger
         app_key (str): API key for authentication
         secret_key (str): Secret key for authentication
         base_url (str): Base URL for the TradeX API
         websocket_host (str): Websocket host for the TradeX API
         websocket_port (str): Websocket port for the TradeX API
-        timeout (int): Request timeout in seconds
+        timeout (int | tuple): Default request timeout in seconds, or a (connect, read) tuple
+        endpoint_timeouts (dict): Per-endpoint (connect, read) timeouts that override `timeout`
+        validation (str): Validation policy for response models built from server data
         request_session (requests.Session): Session for making HTTP requests
+        instrumentation (Instrumentation): Latency histograms, disabled until `instrumentation.enable()`
+        rate_limiter (RateLimiter): Client-side rate governor applied by `_post`, or None
+        singleflight (SingleFlight): Coalesces identical concurrent reads, or None to send each one
+        response_cache (ResponseCache): TTL cache of read responses, or None
         token (str): Authentication token received after login
         client_id (str): Client ID received after login
         user_id (str): User ID received after login
@@ -60,7 +84,7 @@ class TradeXClient:
     Raises:
         ValueError: If required credentials are missing or invalid
     """
-    def __init__(self, app_key: str, secret_key: str, base_url: str=None, websocket_url: str="wss://tradex.saral-info.com:30001", client_id: str=None, user_id: str=None, debug=False, timeout=7, env_file='.env'):
+    def __init__(self, app_key: str, secret_key: str, base_url: str=None, websocket_url: str="wss://tradex.saral-info.com:30001", client_id: str=None, user_id: str=None, debug=False, timeout=7, env_file='.env', endpoint_timeouts: dict=None, validation: str='strict'):
         """
         Initialize the TradeXClient with authentication credentials and settings.
         
@@ -75,21 +99,37 @@ class TradeXClient:
             websocket_url (str, optional): Websocket URL for the TradeX API. If None, will be loaded from environment.
             client_id (str, optional): Client ID for authentication. If None, will be loaded from environment.
             user_id (str, optional): User ID for API calls. If None, will be loaded from environment.
-            debug (bool, optional): Enable debug mode for verbose output. Defaults to False.
-            timeout (int, optional): Request timeout in seconds. Defaults to 7.
+            debug (bool, optional): Log at DEBUG level, including response bodies, to stderr
+                if the application has not configured logging. Defaults to False.
+            timeout (int | tuple, optional): Request timeout in seconds, or a (connect, read) tuple, for
+                endpoints without their own entry in `endpoint_timeouts`. Defaults to 7.
             env_file (str, optional): Path to .env file. Defaults to '.env'.
+            endpoint_timeouts (dict, optional): Mapping of endpoint name to timeout, merged over
+                `constants.endpoint_timeouts`. Defaults to None.
+            validation (str, optional): How response rows from the server are validated: "strict"
+                checks every row, "sampled" checks a sample and "trusted" skips the checks. Request
+                models are always checked. Defaults to "strict".
             
         Raises:
             ValueError: If API key, secret key, base URL, websocket URL, client ID or user ID are missing,
-                or if client ID or user ID exceed length limits.
+                if client ID or user ID exceed length limits, or if the validation policy is invalid.
         """
         self.env_file = env_file
-        load_dotenv(dotenv_path=self.env_file)
+        load_env(self.env_file)
         
         self.debug = debug
+        if debug and not package_logger.handlers:
+            enable_logging(logging.DEBUG)
         self.base_url = base_url
         self.timeout = timeout
-        self.request_session = requests.Session()
+        self.endpoint_timeouts = {**default_endpoint_timeouts, **(endpoint_timeouts or {})}
+        
+        if validation not in validation_policies:
+            raise ValueError(f"Invalid validation policy: {validation}. Allowed Policies: {validation_policies}")
+        self.validation = validation
+        self.request_session = self._create_request_session()
+        self.instrumentation = Instrumentation()
+        self.singleflight = SingleFlight()
         
         save_to_env = False
         
@@ -122,8 +162,7 @@ class TradeXClient:
             save_to_env = True
         self.websocket_port = self.websocket_port or env_websocket_port
         
-        if self.debug:
-            print(self.websocket_host, self.websocket_port)
+        logger.debug("WebSocket server: %s:%s", self.websocket_host, self.websocket_port)
         
         # Load and validate client ID
         env_client_id = os.environ.get('CLIENT_ID')
@@ -166,6 +205,11 @@ class TradeXClient:
 
         self.websocket_client = None
         self.websocket_running = False
+        self.order_gateway = None
+        self.order_store = None
+        self.position_engine = None
+        self.rate_limiter = None
+        self.response_cache = None
     
     def set_credentials(self, client_id, user_id, base_url, websocket_host, websocket_port, save_to_env=False):
         """
@@ -196,6 +240,10 @@ class TradeXClient:
         
         # self.login()
         
+    def _create_request_session(self):
+        """Return the session `_post` sends requests through"""
+        return requests.Session()
+
     def __save_credentials_to_env(self):
         """
         Save the current credentials to the .env file.
@@ -209,15 +257,15 @@ class TradeXClient:
         set_key(self.env_file, 'BASE_URL', self.base_url)
         set_key(self.env_file, 'WEBSOCKET_HOST', self.websocket_host)
         set_key(self.env_file, 'WEBSOCKET_PORT', str(self.websocket_port))
+        invalidate_env(self.env_file)
         
-        if self.debug:
-            print("Credentials saved to", self.env_file)
+        logger.debug("Credentials saved to %s", self.env_file)
         
     # -------------------------------------------------------------------------
     # USER ENDPOINTS
     # -------------------------------------------------------------------------
     
-    def __check_existing_token(self):
+    def _check_existing_token(self):
         """
         Check if a valid token exists in the .env file.
         
@@ -237,15 +285,13 @@ class TradeXClient:
                 self.headers["Authorization"] = f"Bearer {self.token}"
                 return True
             else:
-                if self.debug:
-                    print("Token expired, will get a new one")
+                logger.debug("Token expired, will get a new one")
                 return False
         except (ValueError, TypeError):
-            if self.debug:
-                print("Error parsing token expiry time, will get a new one")
+            logger.debug("Error parsing token expiry time, will get a new one")
             return False
 
-    def __save_token_to_env(self, token, expiry_hours=24):
+    def _save_token_to_env(self, token, expiry_hours=24):
         """
         Save the authentication token and its expiry time to the .env file.
         
@@ -257,10 +303,17 @@ class TradeXClient:
         set_key(self.env_file, 'TOKEN', token)
         set_key(self.env_file, 'TOKEN_EXPIRY', expiry_time.isoformat())
         
-        if self.debug:
-            print(f"Token saved to {self.env_file}, expires at {expiry_time}")
+        logger.debug("Token saved to %s, expires at %s", self.env_file, expiry_time)
 
-    def login(self, get_new_token: bool=False):
+    def _clear_token_in_env(self):
+        """
+        Remove the authentication token and its expiry time from the .env file.
+        """
+        set_key(self.env_file, 'TOKEN', '')
+        set_key(self.env_file, 'TOKEN_EXPIRY', '')
+
+    @timed_endpoint
+    def login(self, get_new_token: bool=False, deadline: float=None):
         """
         Authenticate with the TradeX API using API key and secret key.
         
@@ -269,13 +322,16 @@ class TradeXClient:
         validating the credentials and stores the authentication token for
         subsequent API calls.
         
+        Args:
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Raises:
             TradeXAuthenticationError: If login fails due to invalid credentials or if
                 the response is missing required fields
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
-        if self.__check_existing_token() and not get_new_token:
-            if self.debug:
-                print("Using existing token from environment file")
+        if self._check_existing_token() and not get_new_token:
+            logger.debug("Using existing token from environment file")
             return LoginResponse(status="OK", message="Using existing token", data=None)
         
         login_payload = {
@@ -285,7 +341,7 @@ class TradeXClient:
             "source": "Test"
         }
         
-        response = self._post('Login', payload=login_payload) 
+        response = self._post('Login', payload=login_payload, deadline=deadline) 
 
         if not response or "data" not in response:
             raise TradeXAuthenticationError("Login failed. No valid response received.")
@@ -293,8 +349,8 @@ class TradeXClient:
         data = response["data"]
         self.login_data = LoginData(**data)
         
-        if self.debug:
-            print(json.dumps(self.login_data.get_dict(), indent=2))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Login data:\n%s", json.dumps(self.login_data.get_dict(), indent=2))
         
         if "token" not in data or "user_id" not in data:
             raise TradeXAuthenticationError("Login response is missing required fields.")
@@ -303,11 +359,12 @@ class TradeXClient:
         self.user_id = data["user_id"]
         self.headers["Authorization"] = f"Bearer {self.token}"
         
-        self.__save_token_to_env(self.token)
+        self._save_token_to_env(self.token)
         
         return LoginResponse(status=response.get('status'), message=response.get('message'), data=self.login_data)
     
-    def logout(self):
+    @timed_endpoint
+    def logout(self, deadline: float=None):
         """
         Log out from the TradeX API.
         
@@ -315,20 +372,23 @@ class TradeXClient:
         After logout, subsequent API calls will fail until a new login is performed.
         It also removes the token and token expiry entries from the environment file.
         
+        Args:
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             dict: The API response containing logout status and message
             
         Raises:
             TradeXAPIError: If the logout request fails
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         params = {
             "ClientID": self.user_id
         }
-        response = self._post('Logout', params=params)
+        response = self._post('Logout', params=params, deadline=deadline)
         
         # Remove token information from .env file
-        set_key(self.env_file, 'TOKEN', '')
-        set_key(self.env_file, 'TOKEN_EXPIRY', '')
+        self._clear_token_in_env()
         
         # Reset token attribute
         self.token = None
@@ -337,20 +397,27 @@ class TradeXClient:
         
         # Close websocket connection if active
         if self.websocket_client:
+            self.disable_order_store()
+            self.disable_position_engine()
             self.websocket_client.stop()
         
-        if self.debug:
-            print("Logged out and removed token from environment file")
+        logger.debug("Logged out and removed token from environment file")
         
         return response
         
-    def get_user_profile(self):
+    @coalesced
+    @cached('UserProfile')
+    @timed_endpoint
+    def get_user_profile(self, deadline: float=None):
         """
         Fetch the user profile information.
         
         This method retrieves detailed information about the authenticated user's profile,
         including personal details, account settings, and preferences.
         
+        Args:
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             UserProfileResponse: Object containing user profile data with fields such as
                 name, email, phone, address, and account settings
@@ -358,11 +425,12 @@ class TradeXClient:
         Raises:
             TradeXAPIError: If the API request fails
             TradeXDataFetchError: If the user profile data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         params = {
             "ClientID": self.client_id  
         }
-        response = self._post('UserProfile', params=params)
+        response = self._post('UserProfile', params=params, deadline=deadline)
         return UserProfileResponse(status=response.get('status'), message=response.get('message'), data=UserProfileData(**response.get('data')))
     
     
@@ -370,7 +438,7 @@ class TradeXClient:
     # ORDERS ENDPOINTS
     # -------------------------------------------------------------------------
     
-    def place_new_order(self, new_order_details: NewOrderRequest):
+    def place_new_order(self, new_order_details: NewOrderRequest, deadline: float=None):
         """
         Place a new trading order.
         
@@ -379,7 +447,8 @@ class TradeXClient:
         
         Args:
             new_order_details (NewOrderRequest): Order details.
-            
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             NewOrderResponse: Object containing order status and confirmation details,
                 including the assigned order ID and exchange order number
@@ -387,14 +456,139 @@ class TradeXClient:
         Raises:
             TradeXAPIError: If the order placement fails due to API errors
             TradeXInvalidResponseError: If the order parameters are invalid
+            TradeXTimeoutError: If the request times out or the deadline is spent. Through the
+                order gateway, an order still waiting for its batch is withdrawn first; one
+                already being sent is not, and the error says so.
+        """
+        if self.order_gateway is not None:
+            future = self.order_gateway.submit(new_order_details, deadline=deadline)
+            try:
+                return future.result(timeout=deadline)
+            except FutureTimeoutError:
+                if future.cancel():
+                    raise TradeXTimeoutError("Deadline exceeded waiting for order gateway batch for endpoint: NewOrder. The order was not sent.")
+                raise TradeXTimeoutError(
+                    "Deadline exceeded waiting for order gateway batch for endpoint: NewOrder. The order was already sent "
+                    f"and may be live; check the order book for sender_order_no {new_order_details.sender_order_no} before placing it again.",
+                    response_data={"sender_order_no": new_order_details.sender_order_no}
+                )
+        
+        return self._send_new_order(new_order_details, deadline=deadline)
+    
+    def enable_order_gateway(self, window: float=0.005, max_batch_size: int=50):
+        """
+        Route `place_new_order` calls through an order gateway that batches them.
+        
+        Orders placed from any thread within `window` seconds of each other, up to
+        `max_batch_size` orders, are sent as one ExecuteBasket request. Each caller still
+        receives its own NewOrderResponse. Use `order_gateway.submit()` to get a Future
+        instead of blocking.
+        
+        Args:
+            window (float, optional): Seconds to wait for more orders after the first order
+                of a batch. Defaults to 0.005.
+            max_batch_size (int, optional): Maximum number of orders per basket. Defaults to 50.
+            
+        Returns:
+            OrderGateway: The running gateway
+        """
+        if self.order_gateway is not None:
+            self.disable_order_gateway()
+        self.order_gateway = OrderGateway(self, window=window, max_batch_size=max_batch_size)
+        self.order_gateway.start()
+        return self.order_gateway
+    
+    def disable_order_gateway(self):
+        """
+        Send any queued orders and return `place_new_order` to one request per order.
+        """
+        if self.order_gateway is not None:
+            gateway, self.order_gateway = self.order_gateway, None
+            gateway.stop()
+    
+    def enable_rate_limiter(self, endpoint_limits: dict=None, exchange_limits: dict=None, mode: str="block", priorities: dict=None):
+        """
+        Throttle requests on the client with token buckets per endpoint and per exchange.
+        
+        Each limit is a rate in requests per second, or a (rate, burst) tuple. Order
+        requests also take one token per order from the bucket of their exchange, taken
+        from the request model (every order of a basket counts). See RateLimiter for the
+        modes: "block" waits for a token, "nonblock" raises TradeXRateLimitError at once
+        and "priority" waits with cancels served before order entry and order entry
+        before reads. Waiting never exceeds the call's deadline.
+        
+        Args:
+            endpoint_limits (dict, optional): Limit by endpoint name, e.g. {"NewOrder": (10, 20)}. Defaults to None.
+            exchange_limits (dict, optional): Limit by exchange, e.g. {"NseFO": 20}. Defaults to None.
+            mode (str, optional): "block", "nonblock" or "priority". Defaults to "block".
+            priorities (dict, optional): Priority by endpoint, merged over
+                `constants.endpoint_priorities`; lower goes first. Defaults to None.
+            
+        Returns:
+            RateLimiter: The limiter, whose `get_metrics()` reports throttled and rejected requests
+        """
+        self.rate_limiter = RateLimiter(endpoint_limits, exchange_limits, mode, priorities)
+        return self.rate_limiter
+    
+    def disable_rate_limiter(self):
+        """
+        Send requests without client-side throttling.
+        """
+        self.rate_limiter = None
+    
+    def enable_response_cache(self, ttls: dict=None, maxsize: int=1024):
+        """
+        Serve read endpoints from a TTL cache while their responses are fresh.
+        
+        Endpoints are cached for their TTL in `constants.cache_ttls` (exchange status,
+        user profile, holdings and funds report by default), merged with `ttls`; give
+        e.g. {"OrderBook": 2} to cache more. Cached responses are invalidated by the
+        client's own order requests and, while the websocket runs, by order and trade
+        events, so the order book, trades, positions and funds are not served stale.
+        Use `response_cache.invalidate(endpoint)` to drop entries explicitly and
+        `fresh_reads()` to bypass the cache.
+        
+        Args:
+            ttls (dict, optional): Seconds to cache each endpoint's responses, by endpoint
+                name; 0 disables caching for an endpoint. Defaults to None.
+            maxsize (int, optional): Maximum number of cached responses; the least recently
+                used are evicted first. Defaults to 1024.
+            
+        Returns:
+            ResponseCache: The cache, whose `get_metrics()` reports hits and misses
+        """
+        self.response_cache = ResponseCache(ttls, maxsize)
+        if self.websocket_client is not None:
+            self.websocket_client.response_cache = self.response_cache
+        return self.response_cache
+    
+    def disable_response_cache(self):
+        """
+        Send every read to the server again.
+        """
+        if self.websocket_client is not None:
+            self.websocket_client.response_cache = None
+        self.response_cache = None
+    
+    @timed_endpoint
+    def _send_new_order(self, new_order_details: NewOrderRequest, deadline: float=None):
+        """
+        Send a single NewOrder request, bypassing the order gateway.
+        
+        Args:
+            new_order_details (NewOrderRequest): Order details.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+            
+        Returns:
+            NewOrderResponse: Object containing order status and confirmation details
         """
-
         new_order_details.client = self.client_id
         order_payload = new_order_details.get_dict()
-        response = self._post('NewOrder', payload=order_payload)
+        response = self._post('NewOrder', payload=order_payload, deadline=deadline)
         return NewOrderResponse(status=response.get('status'), message=response.get('message'), data=NewOrderData(**response.get('data')))
     
-    def modify_order(self, modify_order_details: ModifyOrderRequest):
+    @timed_endpoint
+    def modify_order(self, modify_order_details: ModifyOrderRequest, deadline: float=None):
         """
         Modify an existing order.
         
@@ -403,7 +597,8 @@ class TradeXClient:
         
         Args:
             modify_order_details (ModifyOrderRequest): Modified order details.
-            
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             ModifyOrderResponse: Object containing status of the modification and
                 updated order details
@@ -412,12 +607,14 @@ class TradeXClient:
             TradeXAPIError: If the order modification fails
             TradeXInvalidResponseError: If the modification parameters are invalid
             TradeXDataFetchError: If the original order cannot be found
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         order_payload = modify_order_details.get_dict()
-        response = self._post('ModifyOrder', payload=order_payload)
+        response = self._post('ModifyOrder', payload=order_payload, deadline=deadline)
         return ModifyOrderResponse(status=response.get('status'), message=response.get('message'), data=ModifyOrderData(**response.get('data')))    
     
-    def cancel_order(self, cancel_order_details: CancelOrderRequest):
+    @timed_endpoint
+    def cancel_order(self, cancel_order_details: CancelOrderRequest, deadline: float=None):
         """
         Cancel an existing order.
         
@@ -427,7 +624,8 @@ class TradeXClient:
         
         Args:
             cancel_order_details (CancelOrderRequest): Details of the order to cancel.
-            
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             CancelOrderResponse: Object containing cancellation status and details
                 of the cancelled order
@@ -435,12 +633,14 @@ class TradeXClient:
         Raises:
             TradeXAPIError: If the cancellation request fails
             TradeXDataFetchError: If the specified order cannot be found
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         order_payload = cancel_order_details.get_dict()
-        response = self._post('CancelOrder', payload=order_payload)
+        response = self._post('CancelOrder', payload=order_payload, deadline=deadline)
         return CancelOrderResponse(status=response.get('status'), message=response.get('message'), data=CancelOrderData(**response.get('data')))
     
-    def cancel_all_orders(self, cancel_orders_detail: CancelAllOrderRequest):
+    @timed_endpoint
+    def cancel_all_orders(self, cancel_orders_detail: CancelAllOrderRequest, deadline: float=None):
         """
         Cancel all open orders for a specific exchange.
         
@@ -450,20 +650,23 @@ class TradeXClient:
         
         Args:
             cancel_orders_detail (CancelAllOrderRequest): Details for cancelling all orders.
-            
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             CancelAllOrderResponse: Object containing cancellation status with a status code
                 and message indicating success or failure
                 
         Raises:
             TradeXAPIError: If the cancellation request fails
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         order_payload = cancel_orders_detail.get_dict()
-        response = self._post('CancelAllOrders', payload=order_payload)
+        response = self._post('CancelAllOrders', payload=order_payload, deadline=deadline)
         
         return CancelAllOrderResponse(status=response.get('status'), message=response.get('message'))
     
-    def place_new_gtt_order(self, new_order_details: NewGttOrderRequest):
+    @timed_endpoint
+    def place_new_gtt_order(self, new_order_details: NewGttOrderRequest, deadline: float=None):
         """
         Place a new Good-Till-Triggered (GTT) order.
         
@@ -472,19 +675,22 @@ class TradeXClient:
         
         Args:
             new_order_details (NewGttOrderRequest): GTT order details.
-            
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             NewGttOrderResponse: Object containing GTT order status and the assigned GTT order number
                 
         Raises:
             TradeXAPIError: If the order placement fails
             TradeXInvalidResponseError: If the order parameters are invalid
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         order_payload = new_order_details.get_dict()
-        response = self._post('NewGTTOrder', payload=order_payload)
+        response = self._post('NewGTTOrder', payload=order_payload, deadline=deadline)
         return NewGttOrderResponse(status=response.get('status'), message=response.get('message'), data=NewGttOrderData(**response.get('data')))
     
-    def modify_gtt_order(self, modify_order_data: ModifyGTTOrderRequest):
+    @timed_endpoint
+    def modify_gtt_order(self, modify_order_data: ModifyGTTOrderRequest, deadline: float=None):
         """
         Modify an existing GTT order.
         
@@ -493,7 +699,8 @@ class TradeXClient:
         
         Args:
             modify_order_data (ModifyGTTOrderRequest): Modified GTT order details.
-            
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             ModifyGTTOrderResponse: Object containing status of the modification
                 and updated GTT order details
@@ -502,12 +709,14 @@ class TradeXClient:
             TradeXAPIError: If the order modification fails
             TradeXInvalidResponseError: If the modification parameters are invalid
             TradeXDataFetchError: If the original GTT order cannot be found
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         order_payload = modify_order_data.get_dict()
-        response = self._post('ModifyGTTOrder', payload=order_payload)
+        response = self._post('ModifyGTTOrder', payload=order_payload, deadline=deadline)
         return ModifyGTTOrderResponse(status=response.get('status'), message=response.get('message'), data=ModifyGTTOrderData(**response.get('data')))
     
-    def cancel_gtt_order(self, gtt_order_no: int):
+    @timed_endpoint
+    def cancel_gtt_order(self, gtt_order_no: int, deadline: float=None):
         """
         Cancel a GTT order.
         
@@ -516,7 +725,8 @@ class TradeXClient:
         
         Args:
             gtt_order_no (int): The GTT order number to cancel
-            
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             CancelGTTOrderResponse: Object containing cancellation status and details
                 of the cancelled GTT order
@@ -524,15 +734,17 @@ class TradeXClient:
         Raises:
             TradeXAPIError: If the cancellation request fails
             TradeXDataFetchError: If the specified GTT order cannot be found
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         params = {
             "ClientID": self.client_id,
             "GttOrderNo": gtt_order_no
         }
-        response = self._post('CancelGTTOrder', params=params)
+        response = self._post('CancelGTTOrder', params=params, deadline=deadline)
         return CancelGTTOrderResponse(data=CancelGTTOrderData(**response.get('data')), status=response.get('status'), message=response.get('message'))
     
-    def execute_basket_order(self, order_details: ExecuteBasketOrderRequest):
+    @timed_endpoint
+    def execute_basket_order(self, order_details: ExecuteBasketOrderRequest, deadline: float=None):
         """
         Execute a basket order (multiple orders at once).
         
@@ -543,7 +755,8 @@ class TradeXClient:
         Args:
             order_details (ExecuteBasketOrderRequest): Basket order details including
                 an array of individual order requests
-            
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             ExecuteBasketResponse: Object containing execution status for the entire
                 basket and status details for each individual order
@@ -551,9 +764,10 @@ class TradeXClient:
         Raises:
             TradeXAPIError: If the basket execution fails
             TradeXInvalidResponseError: If any order parameters are invalid
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         order_payload = self._get_dict(order_details)
-        response = self._post('ExecuteBasket', payload=order_payload)
+        response = self._post('ExecuteBasket', payload=order_payload, deadline=deadline)
         return ExecuteBasketResponse(data=ExecuteBasketData(**response.get('data')), status=response.get('status'), message=response.get('message'))
     
     
@@ -561,7 +775,7 @@ class TradeXClient:
     # BOOK ENDPOINTS
     # -------------------------------------------------------------------------
     
-    def get_order_book(self, filter_type: str = 'All'):
+    def get_order_book(self, filter_type: str = 'All', as_frame: bool=False, deadline: float=None):
         """
         Get the order book with filtering options.
         
@@ -578,28 +792,93 @@ class TradeXClient:
                 - "Rejected": Orders rejected by the exchange
                 - "Failed": Orders that failed to process
                 - "Executed": Orders that have been fully executed
+            as_frame (bool, optional): Return a columnar OrderBookFrame instead of a list of rows.
+                Requires numpy. Defaults to False.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+                
+        When the order store is enabled (see `enable_order_store`), the list form is
+        answered from the store without a request for "All" and the filters in
+        `order_store.order_book_filter_statuses`; other filters and `as_frame=True` always
+        ask the server.
                 
         Returns:
             OrderBookResponse: Object containing list of orders matching the filter criteria
+                or OrderBookFrame when as_frame is True
             
         Raises:
             ValueError: If an invalid filter_type is provided
             TradeXAPIError: If the order book data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
-        valid_filters = ["All", "Pending", "Unconfirmed", "Cancelled", "Rejected", "Failed", "Executed"]
-        if filter_type not in valid_filters:
-            list_filters = ', '.join(valid_filters)
+        order_store = self.order_store
+        if order_store is not None and not as_frame and order_store.answers(filter_type):
+            return order_store.get_order_book(filter_type)
+        return self._fetch_order_book(filter_type, as_frame=as_frame, deadline=deadline)
+    
+    @coalesced
+    @cached('OrderBook')
+    @timed_endpoint
+    def _fetch_order_book(self, filter_type: str='All', as_frame: bool=False, deadline: float=None):
+        """
+        Request the order book from the server, bypassing the order store.
+        """
+        if filter_type not in order_book_filters:
+            list_filters = ', '.join(order_book_filters)
             raise ValueError(f'Invalid filter type! Must be one of these: {list_filters}')
         
         params = {
             "ClientID": self.client_id,
             "Filter": filter_type
         }
-        response = self._post('OrderBook', params=params)
-        order_data_list = OrderBookData.parse_list(response)
+        response = self._post('OrderBook', params=params, deadline=deadline)
+        if as_frame:
+            return OrderBookFrame.from_response(response)
+        order_data_list = OrderBookData.parse_list(response, validation=self.validation)
         return OrderBookResponse(status=response.get('status'), message=response.get('message'), data=order_data_list)
     
-    def get_order_status(self, order_details: OrderStatusResponse):
+    def enable_order_store(self, deadline: float=None):
+        """
+        Keep a local order book current from WebSocket order events.
+        
+        The store is attached to the running WebSocket client first and then seeded with
+        `get_order_book('All')`, so no event is missed while the book downloads. From
+        then on `get_order_book` (without `as_frame`) is answered locally for the filters
+        the store can answer exactly (see `OrderStore.answers`); lookups by
+        order number, symbol and status are available on `order_store`.
+        
+        Args:
+            deadline (float, optional): Latency budget in seconds for the seeding request. Defaults to None.
+            
+        Returns:
+            OrderStore: The seeded store
+            
+        Raises:
+            TradeXAPIError: If the websocket is not running or the order book cannot be retrieved
+        """
+        if not self.websocket_running:
+            raise TradeXAPIError("Websocket client is not running. Please start the websocket first.")
+        self.disable_order_store()
+        store = OrderStore()
+        self.websocket_client.order_store = store
+        try:
+            with fresh_reads():
+                store.update_many(self._fetch_order_book('All', deadline=deadline).data)
+        except Exception:
+            self.websocket_client.order_store = None
+            raise
+        self.order_store = store
+        return store
+    
+    def disable_order_store(self):
+        """
+        Detach the order store; `get_order_book` asks the server again.
+        """
+        if self.websocket_client is not None:
+            self.websocket_client.order_store = None
+        self.order_store = None
+    
+    @timed_endpoint
+    def get_order_status(self, order_details: OrderStatusResponse, deadline: float=None):
         """
         Get the status of a specific order.
         
@@ -608,7 +887,8 @@ class TradeXClient:
         
         Args:
             order_details (OrderStatusResponse): Details of the order.s
-            
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             OrderStatusResponse: Object containing order status information with
                 detailed execution and status data
@@ -616,55 +896,76 @@ class TradeXClient:
         Raises:
             TradeXAPIError: If the status cannot be retrieved
             TradeXDataFetchError: If the specified order cannot be found
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         order_payload = self._get_dict(order_details)
-        response = self._post('OrderStatus', payload=order_payload)
-        order_data_list = OrderStatusData.parse_list(response)
+        response = self._post('OrderStatus', payload=order_payload, deadline=deadline)
+        order_data_list = OrderStatusData.parse_list(response, validation=self.validation)
         return OrderStatusResponse(status=response.get("status"), message=response.get("message"), data=order_data_list)
     
-    def get_gtt_order_book(self):
+    @coalesced
+    @cached('GttOrdersBook')
+    @timed_endpoint
+    def get_gtt_order_book(self, deadline: float=None):
         """
         Get the book of all GTT (Good-Till-Triggered) orders.
         
         This method retrieves a list of all active GTT orders for the client,
         including their trigger conditions, order parameters, and status.
         
+        Args:
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             GTTOrdersBookResponse: Object containing list of GTT orders with
                 detailed information about each order
                 
         Raises:
             TradeXAPIError: If the GTT order data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         params = {
             "ClientID": self.client_id
         }
-        response = self._post('GttOrdersBook', params=params)
-        order_data_list = GTTOrderBookData.parse_list(response)
+        response = self._post('GttOrdersBook', params=params, deadline=deadline)
+        order_data_list = GTTOrderBookData.parse_list(response, validation=self.validation)
         return GTTOrdersBookResponse(status=response.get("status"), message=response.get("message"), data=order_data_list)
     
-    def get_trades_book(self):
+    @coalesced
+    @cached('TradeBook')
+    @timed_endpoint
+    def get_trades_book(self, as_frame: bool=False, deadline: float=None):
         """
         Get the book of all executed trades.
         
         This method retrieves a list of all executed trades for the client,
         including details like symbol, quantity, price, trade time, etc.
         
+        Args:
+            as_frame (bool, optional): Return a columnar TradesFrame instead of a list of rows.
+                Requires numpy. Defaults to False.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             TradesBookResponse: Object containing list of trades with
                 detailed information about each executed trade
+                or TradesFrame when as_frame is True
                 
         Raises:
             TradeXAPIError: If the trade data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         params = {
             "ClientID": self.client_id
         }
-        response = self._post('TradeBook', params=params)
-        order_data_list = TradesBookData.parse_list(response)
+        response = self._post('TradeBook', params=params, deadline=deadline)
+        if as_frame:
+            return TradesFrame.from_response(response)
+        order_data_list = TradesBookData.parse_list(response, validation=self.validation)
         return TradesBookResponse(status=response.get("status"), message=response.get("message"), data=order_data_list)
     
-    def get_order_history(self, client_details: OrderHistoryRequest):
+    @timed_endpoint
+    def get_order_history(self, client_details: OrderHistoryRequest, deadline: float=None):
         """
         Get the history of orders.
         
@@ -673,17 +974,19 @@ class TradeXClient:
         
         Args:
             client_details (OrderHistoryRequest): Details for the order history.
-            
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             OrderHistoryResponse: Object containing order history with chronological
                 data about each order's lifecycle
                 
         Raises:
             TradeXAPIError: If the history data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         client_payload = self._get_dict(client_details)
-        response = self._post('OrderHistory', payload=client_payload)
-        order_data_list = OrderHistoryData.parse_list(response) 
+        response = self._post('OrderHistory', payload=client_payload, deadline=deadline)
+        order_data_list = OrderHistoryData.parse_list(response, validation=self.validation) 
         return OrderHistoryResponse(status=response.get("status"), message=response.get("message"), data=order_data_list)
     
     
@@ -691,28 +994,43 @@ class TradeXClient:
     # PORTFOLIO ENDPOINTS
     # -------------------------------------------------------------------------
     
-    def get_holdings(self):
+    @coalesced
+    @cached('Holdings')
+    @timed_endpoint
+    def get_holdings(self, as_frame: bool=False, deadline: float=None):
         """
         Get the current holdings in the portfolio.
         
         This method retrieves a list of securities currently held in the portfolio,
         including details such as quantity, average price, current value, and profit/loss.
         
+        Args:
+            as_frame (bool, optional): Return a columnar HoldingsFrame instead of a list of rows.
+                Requires numpy. Defaults to False.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             HoldingsResponse: Object containing holdings information with
                 detailed data for each holding
+                or HoldingsFrame when as_frame is True
                 
         Raises:
             TradeXAPIError: If the holdings data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         params = {
             "ClientID": self.client_id
         }
-        response = self._post('Holdings', params=params)
-        holdings_list = HoldingsData.parse_list(response)
+        response = self._post('Holdings', params=params, deadline=deadline)
+        if as_frame:
+            return HoldingsFrame.from_response(response)
+        holdings_list = HoldingsData.parse_list(response, validation=self.validation)
         return HoldingsResponse(status=response.get("status"), message=response.get("message"), data=holdings_list)
     
-    def get_positions(self, filter_type: str='All'):
+    @coalesced
+    @cached('NetPositions')
+    @timed_endpoint
+    def get_positions(self, filter_type: str='All', as_frame: bool=False, deadline: float=None):
         """
         Get the current positions (open and closed).
         
@@ -726,14 +1044,19 @@ class TradeXClient:
                 - 'All': All positions
                 - 'Todays': Only today's positions
                 - 'Opening': Only positions from previous days
+            as_frame (bool, optional): Return a columnar NetPositionFrame instead of a list of rows.
+                Requires numpy. Defaults to False.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
                 
         Returns:
             NetPositionResponse: Object containing positions information with
                 detailed data for each position
+                or NetPositionFrame when as_frame is True
                 
         Raises:
             ValueError: If an invalid filter_type is provided
             TradeXAPIError: If the positions data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         valid_filters = ['All', 'Todays', 'Opening']
         if filter_type not in valid_filters:
@@ -744,11 +1067,57 @@ class TradeXClient:
             "ClientID": self.client_id,  
             "Filter": filter_type
         }
-        response = self._post('NetPositions', params=params)
-        net_positions = NetPositionData.parse_list(response)
+        response = self._post('NetPositions', params=params, deadline=deadline)
+        if as_frame:
+            return NetPositionFrame.from_response(response)
+        net_positions = NetPositionData.parse_list(response, validation=self.validation)
         return NetPositionResponse(status=response.get("status"), message=response.get("message"), data=net_positions)
     
-    def convert_position(self, conversion_data: ConvertPositionRequest):
+    def enable_position_engine(self, reconcile_interval: float=60, deadline: float=None):
+        """
+        Keep net positions current from WebSocket trade events.
+        
+        The engine is attached to the running WebSocket client first and then seeded from
+        `get_positions('All')` (see `PositionEngine.seed`), so no trade is missed while the
+        positions download, and reconciled against it every `reconcile_interval` seconds. `position_engine.get(exchange, code, product)` returns the position
+        including fills received since the last request.
+        
+        Args:
+            reconcile_interval (float, optional): Seconds between reconciles. Defaults to 60.
+            deadline (float, optional): Latency budget in seconds for the seeding request. Defaults to None.
+            
+        Returns:
+            PositionEngine: The seeded engine
+            
+        Raises:
+            TradeXAPIError: If the websocket is not running or the positions cannot be retrieved
+        """
+        if not self.websocket_running:
+            raise TradeXAPIError("Websocket client is not running. Please start the websocket first.")
+        self.disable_position_engine()
+        engine = PositionEngine(self)
+        self.websocket_client.position_engine = engine
+        try:
+            engine.seed(deadline=deadline)
+        except Exception:
+            self.websocket_client.position_engine = None
+            raise
+        engine.start_reconcile(reconcile_interval)
+        self.position_engine = engine
+        return engine
+    
+    def disable_position_engine(self):
+        """
+        Detach the position engine and stop its reconciles.
+        """
+        engine, self.position_engine = self.position_engine, None
+        if self.websocket_client is not None:
+            self.websocket_client.position_engine = None
+        if engine is not None:
+            engine.stop_reconcile()
+    
+    @timed_endpoint
+    def convert_position(self, conversion_data: ConvertPositionRequest, deadline: float=None):
         """
         Convert position from one product type to another.
         
@@ -757,7 +1126,8 @@ class TradeXClient:
         
         Args:
             conversion_data (ConvertPositionRequest): Position conversion details
-            
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             ConvertPositionResponse: Object containing conversion status with
                 details about the converted position
@@ -765,34 +1135,92 @@ class TradeXClient:
         Raises:
             TradeXAPIError: If the position conversion fails
             TradeXInvalidResponseError: If the conversion parameters are invalid
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         conversion_payload = self._get_dict(conversion_data)
-        response = self._post('ModifyProduct', payload=conversion_payload)
+        response = self._post('ModifyProduct', payload=conversion_payload, deadline=deadline)
         return ConvertPositionResponse(status=response.get('status'), message=response.get('message'), data=ConvertPositionData(**response.get('data')))
     
     
+    def get_portfolio_snapshot(self, order_filter: str='All', position_filter: str='All', max_workers: int=5, deadline: float=None):
+        """
+        Get the order book, trades book, positions, holdings and funds report in one call.
+        
+        The five requests are issued concurrently on a bounded thread pool sharing the client's
+        HTTP session, so the snapshot takes roughly as long as the slowest request instead of
+        the sum of all five. A failing endpoint does not fail the snapshot; its error is
+        reported in `errors` and its field is left as None.
+        
+        Args:
+            order_filter (str, optional): Filter passed to `get_order_book`. Defaults to 'All'.
+            position_filter (str, optional): Filter passed to `get_positions`. Defaults to 'All'.
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 5.
+            deadline (float, optional): Latency budget in seconds for each request. Defaults to None.
+            
+        Returns:
+            PortfolioSnapshot: Object containing the response of each endpoint, per-endpoint
+                timings in seconds and the errors of endpoints that failed
+                
+        Raises:
+            ValueError: If an invalid order_filter or position_filter is provided
+        """
+        calls = {
+            'OrderBook': ('order_book', lambda: self.get_order_book(order_filter, deadline=deadline)),
+            'TradeBook': ('trades_book', lambda: self.get_trades_book(deadline=deadline)),
+            'NetPositions': ('positions', lambda: self.get_positions(position_filter, deadline=deadline)),
+            'Holdings': ('holdings', lambda: self.get_holdings(deadline=deadline)),
+            'FundsReport': ('funds_report', lambda: self.get_funds_report(deadline=deadline)),
+        }
+        
+        snapshot = PortfolioSnapshot()
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tradex-snapshot") as executor:
+            futures = {
+                executor.submit(self._timed_call, call): (endpoint, attribute)
+                for endpoint, (attribute, call) in calls.items()
+            }
+            for future in as_completed(futures):
+                endpoint, attribute = futures[future]
+                result, elapsed, error = future.result()
+                snapshot.timings[endpoint] = elapsed
+                if error is not None:
+                    snapshot.errors[endpoint] = error
+                else:
+                    setattr(snapshot, attribute, result)
+        
+        snapshot.elapsed = time.perf_counter() - start_time
+        return snapshot
+    
+    
     # -------------------------------------------------------------------------
     # FUNDS ENDPOINTS
     # -------------------------------------------------------------------------
     
-    def get_funds_report(self):
+    @coalesced
+    @cached('FundsReport')
+    @timed_endpoint
+    def get_funds_report(self, deadline: float=None):
         """
         Get the funds report.
         
         This method retrieves detailed information about available funds, margins,
         collateral values, and other financial aspects of the trading account.
         
+        Args:
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             FundsReportResponse: Object containing funds details
                 
         Raises:
             TradeXAPIError: If the funds data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         params = {
             "ClientID": self.client_id
         }
-        response = self._post('FundsReport', params=params)
-        funds_data = FundsReportData.parse_list(response)
+        response = self._post('FundsReport', params=params, deadline=deadline)
+        funds_data = FundsReportData.parse_list(response, validation=self.validation)
         return FundsReportResponse(status=response.get("status"), message=response.get("message"), data=funds_data)
     
     
@@ -800,25 +1228,32 @@ class TradeXClient:
     # OTHER ENDPOINTS
     # -------------------------------------------------------------------------
     
-    def get_exchange_status(self):
+    @coalesced
+    @cached('ExchangeStatus')
+    @timed_endpoint
+    def get_exchange_status(self, deadline: float=None):
         """
         Get the status of various exchanges.
         
         This method retrieves the current connectivity status and trading status
         for the exchanges supported by the trading platform.
         
+        Args:
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+        
         Returns:
             ExchangeStatusResponse: Object containing exchange connectivity status
                 with details for each exchange
                 
         Raises:
             TradeXAPIError: If the exchange status data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
         """
         params = {
             "ClientID": self.client_id
         }
-        response = self._post('ExchangeStatus', params=params)
-        exchange_data = ExchangeStatusData.parse_list(response)
+        response = self._post('ExchangeStatus', params=params, deadline=deadline)
+        exchange_data = ExchangeStatusData.parse_list(response, validation=self.validation)
         return ExchangeStatusResponse(status=response.get("status"), message=response.get("message"), data=exchange_data)
 
     
@@ -841,14 +1276,68 @@ class TradeXClient:
         """
         return asdict(data_class)
     
-    def _post(self, endpoint: str, payload: dict=None, params: dict=None):
+    def _timed_call(self, call):
+        """
+        Run an endpoint call and measure its duration.
+        
+        API and transport errors are returned instead of raised so that one failing
+        request does not abort a batch of concurrent requests.
+        
+        Args:
+            call (callable): Zero-argument function performing the request
+            
+        Returns:
+            tuple: (result, elapsed seconds, error), where exactly one of result and error is None
+        """
+        start_time = time.perf_counter()
+        try:
+            result = call()
+            return result, time.perf_counter() - start_time, None
+        except (TradeXAPIError, requests.exceptions.RequestException) as ex:
+            return None, time.perf_counter() - start_time, ex
+    
+    def _request_timeout(self, endpoint: str, deadline_at: float=None):
+        """
+        Resolve the timeout for a request, capped by the time left until its deadline.
+        
+        Args:
+            endpoint (str): API endpoint to call
+            deadline_at (float, optional): `time.monotonic()` value by which the call must finish.
+                Defaults to None.
+            
+        Returns:
+            float | tuple: Timeout in seconds, or a (connect, read) tuple
+            
+        Raises:
+            TradeXTimeoutError: If the deadline has already passed
+        """
+        timeout = self.endpoint_timeouts.get(endpoint, self.timeout)
+        if deadline_at is None:
+            return timeout
+        
+        remaining = deadline_at - time.monotonic()
+        if remaining <= 0:
+            raise TradeXTimeoutError(f"Deadline exceeded before request to endpoint: {endpoint}")
+        if isinstance(timeout, tuple):
+            return tuple(min(value, remaining) for value in timeout)
+        return min(timeout, remaining)
+    
+    def _post(self, endpoint: str, payload: dict=None, params: dict=None, deadline: float=None):
         """
         Make a POST request to the TradeX API.
         
+        The request uses the endpoint's timeout from `endpoint_timeouts`, falling back to
+        `timeout`. When a deadline is given, both are capped by the remaining budget, and
+        since those only bound each socket operation, the budget is checked again once the
+        response has been read: a response that arrives after the deadline raises
+        TradeXTimeoutError. For order endpoints a timeout means the outcome is unknown;
+        check the order book before retrying.
+        
         Args:
             endpoint (str): API endpoint to call
             payload (dict, optional): JSON payload for the request. Defaults to None.
             params (dict, optional): Query parameters for the request. Defaults to None.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
             
         Returns:
             dict: JSON response from the API
@@ -857,59 +1346,114 @@ class TradeXClient:
             TradeXAuthenticationError: For authentication failures (401)
             TradeXInvalidResponseError: For bad requests (400)
             TradeXDataFetchError: For no data found (404)
+            TradeXTimeoutError: If the request times out or the deadline is spent
+            TradeXRateLimitError: If the rate limiter is in non-blocking mode and the limit is reached
             TradeXAPIError: For other API errors
         """
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
         url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-        response = self.request_session.post(url, json=payload, params=params, headers=self.headers)
-        
-        if self.debug:
-            print(response.text)
+        timing = self.instrumentation.begin_request(endpoint) if self.instrumentation.enabled else None
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire(endpoint, request_exchanges(payload), deadline_at)
+            if timing:
+                timing.throttled()
+        timeout = self._request_timeout(endpoint, deadline_at)
+        # Serialized here rather than by requests so that serialization can be timed on its own
+        body = json.dumps(payload).encode() if payload is not None else None
+        if timing:
+            timing.serialized()
+        try:
+            response = self.request_session.post(url, data=body, params=params, headers=self.headers, timeout=timeout)
+        except requests.exceptions.Timeout as ex:
+            raise TradeXTimeoutError(f"Request timed out for endpoint: {endpoint}: {ex}")
+        finally:
+            # Also after a timeout, since the request may still have been carried out
+            if self.response_cache is not None:
+                self.response_cache.invalidate_after(endpoint)
+        if deadline_at is not None and time.monotonic() > deadline_at:
+            raise TradeXTimeoutError(f"Deadline exceeded waiting for response from endpoint: {endpoint}")
+        if timing:
+            timing.received()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response from %s (%s): %s", endpoint, response.status_code, response.text)
         
         try:
             response_json = response.json() if response.text else None
-
-            if response_json is None:
-                raise TradeXAPIError(f"Empty or invalid response from {endpoint}. Status Code: {response.status_code}")
-            if response.status_code == 200:
-                return response_json
-            elif response.status_code == 202 and endpoint == 'CancelAllOrders':
-                return response_json
-            elif response.status_code == 401:
-                raise TradeXAuthenticationError(
-                    f"Unauthorized for endpoint: {endpoint}",
-                    status_code=401, 
-                    response_message=response_json.get("message", "No message"), 
-                    response_data=response_json.get("data", {})
-                )
-            elif response.status_code == 500:
-                raise TradeXAPIError(
-                    f"Internal Server Error for endpoint: {endpoint}", 
-                    status_code=500, 
-                    response_message=response_json.get("message", "No message"), 
-                    response_data=response_json.get("data", {})
-                )
-            elif response.status_code == 400:
-                raise TradeXInvalidResponseError(
-                    f"Bad Request for endpoint: {endpoint}", 
-                    status_code=400, 
-                    response_message=response_json.get("message", "No message"), 
-                    response_data=response_json.get("data", {})
-                )
-            elif response.status_code == 404:
-                message = response_json.get("message", "")
-                raise TradeXDataFetchError(f"{message if message else ''} for endpoint: {endpoint}")
-
+            if timing:
+                timing.decoded()
+            return self._handle_response(endpoint, response.status_code, response_json)
         except requests.exceptions.JSONDecodeError:
             raise TradeXAPIError(f"Invalid JSON response from {endpoint}. Response: {response.text}")
         except Exception as ex:
             raise TradeXAPIError(f"An unknown error occurred for endpoint {endpoint}: {ex}")
 
-    def start_websocket(self, auto_reconnect=True):
+    def _handle_response(self, endpoint: str, status_code: int, response_json: dict):
+        """
+        Map a decoded TradeX API response to its payload or the matching exception.
+        
+        Shared by the blocking and asyncio transports so both raise the same errors
+        for the same status codes.
+        
+        Args:
+            endpoint (str): API endpoint that was called
+            status_code (int): HTTP status code of the response
+            response_json (dict): Decoded JSON body, or None if the body was empty
+            
+        Returns:
+            dict: JSON response from the API
+            
+        Raises:
+            TradeXAuthenticationError: For authentication failures (401)
+            TradeXInvalidResponseError: For bad requests (400)
+            TradeXDataFetchError: For no data found (404)
+            TradeXAPIError: For other API errors
+        """
+        if response_json is None:
+            raise TradeXAPIError(f"Empty or invalid response from {endpoint}. Status Code: {status_code}")
+        if status_code == 200:
+            return response_json
+        elif status_code == 202 and endpoint == 'CancelAllOrders':
+            return response_json
+        elif status_code == 401:
+            raise TradeXAuthenticationError(
+                f"Unauthorized for endpoint: {endpoint}",
+                status_code=401, 
+                response_message=response_json.get("message", "No message"), 
+                response_data=response_json.get("data", {})
+            )
+        elif status_code == 500:
+            raise TradeXAPIError(
+                f"Internal Server Error for endpoint: {endpoint}", 
+                status_code=500, 
+                response_message=response_json.get("message", "No message"), 
+                response_data=response_json.get("data", {})
+            )
+        elif status_code == 400:
+            raise TradeXInvalidResponseError(
+                f"Bad Request for endpoint: {endpoint}", 
+                status_code=400, 
+                response_message=response_json.get("message", "No message"), 
+                response_data=response_json.get("data", {})
+            )
+        elif status_code == 404:
+            message = response_json.get("message", "")
+            raise TradeXDataFetchError(f"{message if message else ''} for endpoint: {endpoint}")
+
+    def start_websocket(self, auto_reconnect=True, resync=False):
         """
         Start the websocket connection
         
+        With `resync`, the order and trades books are fetched once after connecting and
+        again after every reconnection; order and trade events missed while disconnected
+        are replayed through the registered callbacks, and events received twice are
+        dropped (see EventResync). It is off by default since it costs an OrderBook and a
+        TradeBook request on every connection.
+        
         Args:
             auto_reconnect (bool): Whether to automatically reconnect if connection drops
+            resync (bool): Whether to replay events missed while reconnecting. Defaults to False.
         
         Returns:
             bool: True if successfully started, False otherwise
@@ -918,14 +1462,17 @@ class TradeXClient:
             return True
             
         if self.token:
-            self.websocket_client = TradeXWebSocketClient(self.websocket_host, self.websocket_port, self.token, self.client_id, 3, 3)
+            self.websocket_client = TradeXWebSocketClient(self.websocket_host, self.websocket_port, self.token, self.client_id, 3, 3, validation=self.validation, instrumentation=self.instrumentation)
+            if resync:
+                self.websocket_client.resync = EventResync(self, self.websocket_client)
+            self.websocket_client.response_cache = self.response_cache
             if self.websocket_client.start():
                 self.websocket_running = True
                 return True
             else:
                 return False
         else:
-            print("Please Login First!")
+            logger.error("Please Login First!")
         return False
 
     def stop_websocket(self):
@@ -938,6 +1485,8 @@ class TradeXClient:
         if not self.websocket_running:
             return True
             
+        self.disable_order_store()
+        self.disable_position_engine()
         self.websocket_client.stop()
         self.websocket_running = False
         return True
@@ -953,4 +1502,43 @@ class TradeXClient:
         if self.websocket_client:
             self.websocket_client.register_callback(message_type, callback_function)
         else:
-            raise TradeXAPIError("Websocket client is not initialized. Please start the websocket first.")
\ No newline at end of file
+            raise TradeXAPIError("Websocket client is not initialized. Please start the websocket first.")
+    
+    def subscribe(self, message_type, callback_function, exchange=None, code=None, client=None, status=None, queue_size=None, overflow='drop_oldest'):
+        """
+        Add a subscriber for a message type, optionally filtered by exchange, code, client or status
+        
+        Unlike `register_callback`, any number of subscribers can receive the same message
+        type. See `TradeXWebSocketClient.subscribe`.
+        
+        Args:
+            message_type (str): The type of message to listen for
+            callback_function (function): The function to call when a matching message is received
+            exchange (str | collection, optional): Accepted exchanges
+            code (str | collection, optional): Accepted instrument codes
+            client (str | collection, optional): Accepted client IDs
+            status (str | collection, optional): Accepted order statuses
+            queue_size (int, optional): Size of the subscriber's own queue
+            overflow (str, optional): What a full subscriber queue does: "drop_oldest",
+                "conflate" (latest order event per exchange_order_no) or "block". "block" runs
+                the subscriber on the shared callback workers and holds up the receiver while
+                they are full. Defaults to "drop_oldest". Dropped events, fills included,
+                are lost to the subscriber; drops are logged as a warning.
+            
+        Returns:
+            Subscription: Handle to pass to `unsubscribe`
+        """
+        if self.websocket_client:
+            return self.websocket_client.subscribe(message_type, callback_function, exchange=exchange, code=code, client=client, status=status, queue_size=queue_size, overflow=overflow)
+        raise TradeXAPIError("Websocket client is not initialized. Please start the websocket first.")
+    
+    def unsubscribe(self, subscription):
+        """
+        Remove a subscriber added with `subscribe`
+        
+        Returns:
+            bool: True if the subscriber was removed, False if it was not subscribed
+        """
+        if self.websocket_client:
+            return self.websocket_client.unsubscribe(subscription)
+        return False
\ No newline at end of file
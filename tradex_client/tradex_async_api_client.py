@@ -0,0 +1,1073 @@
+import asyncio
+import json
+import logging
+import time
+
+aiohttp = None
+
+from tradex_client.models.cancel_all_orders import CancelAllOrderRequest, CancelAllOrderResponse
+from tradex_client.models.cancel_gtt_order import CancelGTTOrderData, CancelGTTOrderResponse
+from tradex_client.models.cancel_order import CancelOrderRequest, CancelOrderData, CancelOrderResponse
+from tradex_client.models.convert_position import ConvertPositionRequest, ConvertPositionData, ConvertPositionResponse
+from tradex_client.models.exchange_status import ExchangeStatusData, ExchangeStatusResponse
+from tradex_client.models.execute_basket_orders import ExecuteBasketOrderRequest, ExecuteBasketData, ExecuteBasketResponse
+from tradex_client.models.frames import OrderBookFrame, TradesFrame, NetPositionFrame, HoldingsFrame
+from tradex_client.models.funds_report import FundsReportData, FundsReportResponse
+from tradex_client.models.gtt_order_book import GTTOrderBookData, GTTOrdersBookResponse
+from tradex_client.models.holdings import HoldingsData, HoldingsResponse
+from tradex_client.models.login import LoginData, LoginResponse
+from tradex_client.models.modify_gtt_order import ModifyGTTOrderRequest, ModifyGTTOrderData, ModifyGTTOrderResponse
+from tradex_client.models.modify_order import ModifyOrderRequest, ModifyOrderData, ModifyOrderResponse
+from tradex_client.models.new_gtt_order import NewGttOrderRequest, NewGttOrderData, NewGttOrderResponse
+from tradex_client.models.new_order import NewOrderRequest, NewOrderData, NewOrderResponse
+from tradex_client.models.order_history import OrderHistoryRequest, OrderHistoryData, OrderHistoryResponse
+from tradex_client.models.order_status import OrderStatusRequest, OrderStatusData, OrderStatusResponse
+from tradex_client.models.orders_book import OrderBookResponse, OrderBookData
+from tradex_client.models.portfolio_snapshot import PortfolioSnapshot
+from tradex_client.models.positions import NetPositionData, NetPositionResponse
+from tradex_client.models.trades_book import TradesBookData, TradesBookResponse
+from tradex_client.models.user_profile import UserProfileData, UserProfileResponse
+
+from tradex_client.exceptions import TradeXAPIError, TradeXAuthenticationError, TradeXTimeoutError
+from tradex_client.instrumentation import timed_endpoint
+from tradex_client.order_gateway import AsyncOrderGateway
+from tradex_client.order_store import OrderStore, order_book_filters
+from tradex_client.position_engine import AsyncPositionEngine
+from tradex_client.rate_limiter import request_exchanges
+from tradex_client.response_cache import cached
+from tradex_client.singleflight import coalesced, fresh_reads
+from tradex_client.tradex_api_client import TradeXClient
+from tradex_client.tradex_async_websocket_client import AsyncTradeXWebSocketClient
+
+logger = logging.getLogger(__name__)
+
+def _import_aiohttp():
+    """
+    Import aiohttp on first use so that importing tradex_client does not pay for it.
+
+    Raises:
+        ImportError: If aiohttp is not installed
+    """
+    global aiohttp
+    if aiohttp is None:
+        try:
+            import aiohttp as aiohttp_module
+        except ImportError:
+            raise ImportError("AsyncTradeXClient requires aiohttp. Install it with: pip install aiohttp")
+        aiohttp = aiohttp_module
+
+class AsyncTradeXClient(TradeXClient):
+    """
+    asyncio client for the TradeX trading API.
+
+    Mirrors every endpoint of :class:`TradeXClient` as a coroutine so that many requests
+    can be in flight on a single event loop without a thread per request. Credential
+    handling, request/response models and exception mapping are shared with the blocking
+    client; only the transport differs.
+
+    All requests go through one ``aiohttp.ClientSession`` whose connector keeps a pool of
+    keep-alive connections to the API host. The session is created lazily on the running
+    loop and must be released with :meth:`close` (or by using the client as an async
+    context manager).
+
+    The order gateway, order store and position engine run on the event loop too:
+    their enable methods are coroutines, and the gateway and engine use tasks instead
+    of threads.
+
+    Attributes:
+        max_connections (int): Maximum number of pooled connections to the API host
+        keepalive_timeout (float): Seconds an idle pooled connection is kept open
+        aio_session (aiohttp.ClientSession): Session used for HTTP requests, created on first use
+        request_session (None): Unused; the blocking client's requests session is not created
+        websocket_client (AsyncTradeXWebSocketClient): asyncio websocket client, created by :meth:`start_websocket`
+
+    Raises:
+        ImportError: If aiohttp is not installed
+        ValueError: If required credentials are missing or invalid
+    """
+    def __init__(self, *args, max_connections: int=100, keepalive_timeout: float=30, **kwargs):
+        """
+        Initialize the AsyncTradeXClient.
+
+        Accepts the same arguments as :class:`TradeXClient` plus connection pool settings.
+
+        Args:
+            max_connections (int, optional): Maximum number of pooled connections. Requests beyond
+                this limit wait for a free connection. Defaults to 100.
+            keepalive_timeout (float, optional): Seconds to keep an idle connection open. Defaults to 30.
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        _import_aiohttp()
+        super().__init__(*args, **kwargs)
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.aio_session = None
+
+    def _create_request_session(self):
+        # Requests go through `aio_session`
+        return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Send any orders queued in the order gateway, then close the underlying HTTP
+        session and release all pooled connections.
+        """
+        await self.disable_order_gateway()
+        if self.aio_session is not None and not self.aio_session.closed:
+            await self.aio_session.close()
+        self.aio_session = None
+
+    async def enable_order_gateway(self, window: float=0.005, max_batch_size: int=50):
+        """
+        Route `place_new_order` calls through an order gateway that batches them.
+
+        See :meth:`TradeXClient.enable_order_gateway`. The gateway runs as a task on the
+        running event loop; `order_gateway.submit()` returns an asyncio Future.
+
+        Args:
+            window (float, optional): Seconds to wait for more orders after the first order
+                of a batch. Defaults to 0.005.
+            max_batch_size (int, optional): Maximum number of orders per basket. Defaults to 50.
+
+        Returns:
+            AsyncOrderGateway: The running gateway
+        """
+        await self.disable_order_gateway()
+        self.order_gateway = AsyncOrderGateway(self, window=window, max_batch_size=max_batch_size)
+        self.order_gateway.start()
+        return self.order_gateway
+
+    async def disable_order_gateway(self):
+        """
+        Send any queued orders and return `place_new_order` to one request per order.
+        """
+        if self.order_gateway is not None:
+            gateway, self.order_gateway = self.order_gateway, None
+            await gateway.stop()
+
+    # -------------------------------------------------------------------------
+    # USER ENDPOINTS
+    # -------------------------------------------------------------------------
+
+    @timed_endpoint
+    async def login(self, get_new_token: bool=False, deadline: float=None):
+        """
+        Authenticate with the TradeX API using API key and secret key.
+
+        See :meth:`TradeXClient.login`.
+
+        Args:
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Raises:
+            TradeXAuthenticationError: If login fails due to invalid credentials or if
+                the response is missing required fields
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        # The .env file is read and written on a worker thread so the event loop keeps running
+        if not get_new_token and await asyncio.to_thread(self._check_existing_token):
+            logger.debug("Using existing token from environment file")
+            return LoginResponse(status="OK", message="Using existing token", data=None)
+
+        login_payload = {
+            "user_id": f"{self.user_id}",
+            "app_key": f"{self.app_key}",
+            "secret_key": f"{self.secret_key}",
+            "source": "Test"
+        }
+
+        response = await self._post('Login', payload=login_payload, deadline=deadline)
+
+        if not response or "data" not in response:
+            raise TradeXAuthenticationError("Login failed. No valid response received.")
+
+        data = response["data"]
+        self.login_data = LoginData(**data)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Login data:\n%s", json.dumps(self.login_data.get_dict(), indent=2))
+
+        if "token" not in data or "user_id" not in data:
+            raise TradeXAuthenticationError("Login response is missing required fields.")
+
+        self.token = data["token"]
+        self.user_id = data["user_id"]
+        self.headers["Authorization"] = f"Bearer {self.token}"
+
+        await asyncio.to_thread(self._save_token_to_env, self.token)
+
+        return LoginResponse(status=response.get('status'), message=response.get('message'), data=self.login_data)
+
+    @timed_endpoint
+    async def logout(self, deadline: float=None):
+        """
+        Log out from the TradeX API.
+
+        See :meth:`TradeXClient.logout`. The HTTP session stays open so the client
+        can log in again; call :meth:`close` to release it.
+
+        Args:
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            dict: The API response containing logout status and message
+
+        Raises:
+            TradeXAPIError: If the logout request fails
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        params = {
+            "ClientID": self.user_id
+        }
+        response = await self._post('Logout', params=params, deadline=deadline)
+
+        await asyncio.to_thread(self._clear_token_in_env)
+
+        self.token = None
+        if 'Authorization' in self.headers:
+            del self.headers['Authorization']
+
+        if self.websocket_client:
+            await self.stop_websocket()
+
+        logger.debug("Logged out and removed token from environment file")
+
+        return response
+
+    @coalesced
+    @cached('UserProfile')
+    @timed_endpoint
+    async def get_user_profile(self, deadline: float=None):
+        """
+        Fetch the user profile information.
+
+        Args:
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            UserProfileResponse: Object containing user profile data
+
+        Raises:
+            TradeXAPIError: If the API request fails
+            TradeXDataFetchError: If the user profile data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        params = {
+            "ClientID": self.client_id
+        }
+        response = await self._post('UserProfile', params=params, deadline=deadline)
+        return UserProfileResponse(status=response.get('status'), message=response.get('message'), data=UserProfileData(**response.get('data')))
+
+
+    # -------------------------------------------------------------------------
+    # ORDERS ENDPOINTS
+    # -------------------------------------------------------------------------
+
+    async def place_new_order(self, new_order_details: NewOrderRequest, deadline: float=None):
+        """
+        Place a new trading order.
+
+        Args:
+            new_order_details (NewOrderRequest): Order details.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            NewOrderResponse: Object containing order status and confirmation details
+
+        Raises:
+            TradeXAPIError: If the order placement fails due to API errors
+            TradeXInvalidResponseError: If the order parameters are invalid
+            TradeXTimeoutError: If the request times out or the deadline is spent. Through the
+                order gateway, an order still waiting for its batch is withdrawn first; one
+                already being sent is not, and the error says so.
+        """
+        gateway = self.order_gateway
+        if gateway is not None:
+            future = gateway.submit(new_order_details, deadline=deadline)
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), deadline)
+            except asyncio.TimeoutError:
+                if gateway.withdraw(future):
+                    raise TradeXTimeoutError("Deadline exceeded waiting for order gateway batch for endpoint: NewOrder. The order was not sent.")
+                if future.done():
+                    return future.result()
+                raise TradeXTimeoutError(
+                    "Deadline exceeded waiting for order gateway batch for endpoint: NewOrder. The order was already sent "
+                    f"and may be live; check the order book for sender_order_no {new_order_details.sender_order_no} before placing it again.",
+                    response_data={"sender_order_no": new_order_details.sender_order_no}
+                )
+
+        return await self._send_new_order(new_order_details, deadline=deadline)
+
+    @timed_endpoint
+    async def _send_new_order(self, new_order_details: NewOrderRequest, deadline: float=None):
+        """
+        Send a single NewOrder request, bypassing the order gateway.
+
+        Args:
+            new_order_details (NewOrderRequest): Order details.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            NewOrderResponse: Object containing order status and confirmation details
+        """
+        new_order_details.client = self.client_id
+        order_payload = new_order_details.get_dict()
+        response = await self._post('NewOrder', payload=order_payload, deadline=deadline)
+        return NewOrderResponse(status=response.get('status'), message=response.get('message'), data=NewOrderData(**response.get('data')))
+
+    @timed_endpoint
+    async def modify_order(self, modify_order_details: ModifyOrderRequest, deadline: float=None):
+        """
+        Modify an existing order.
+
+        Args:
+            modify_order_details (ModifyOrderRequest): Modified order details.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            ModifyOrderResponse: Object containing status of the modification and
+                updated order details
+
+        Raises:
+            TradeXAPIError: If the order modification fails
+            TradeXInvalidResponseError: If the modification parameters are invalid
+            TradeXDataFetchError: If the original order cannot be found
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        order_payload = modify_order_details.get_dict()
+        response = await self._post('ModifyOrder', payload=order_payload, deadline=deadline)
+        return ModifyOrderResponse(status=response.get('status'), message=response.get('message'), data=ModifyOrderData(**response.get('data')))
+
+    @timed_endpoint
+    async def cancel_order(self, cancel_order_details: CancelOrderRequest, deadline: float=None):
+        """
+        Cancel an existing order.
+
+        Args:
+            cancel_order_details (CancelOrderRequest): Details of the order to cancel.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            CancelOrderResponse: Object containing cancellation status and details
+                of the cancelled order
+
+        Raises:
+            TradeXAPIError: If the cancellation request fails
+            TradeXDataFetchError: If the specified order cannot be found
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        order_payload = cancel_order_details.get_dict()
+        response = await self._post('CancelOrder', payload=order_payload, deadline=deadline)
+        return CancelOrderResponse(status=response.get('status'), message=response.get('message'), data=CancelOrderData(**response.get('data')))
+
+    @timed_endpoint
+    async def cancel_all_orders(self, cancel_orders_detail: CancelAllOrderRequest, deadline: float=None):
+        """
+        Cancel all open orders for a specific exchange.
+
+        Args:
+            cancel_orders_detail (CancelAllOrderRequest): Details for cancelling all orders.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            CancelAllOrderResponse: Object containing cancellation status
+
+        Raises:
+            TradeXAPIError: If the cancellation request fails
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        order_payload = cancel_orders_detail.get_dict()
+        response = await self._post('CancelAllOrders', payload=order_payload, deadline=deadline)
+
+        return CancelAllOrderResponse(status=response.get('status'), message=response.get('message'))
+
+    @timed_endpoint
+    async def place_new_gtt_order(self, new_order_details: NewGttOrderRequest, deadline: float=None):
+        """
+        Place a new Good-Till-Triggered (GTT) order.
+
+        Args:
+            new_order_details (NewGttOrderRequest): GTT order details.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            NewGttOrderResponse: Object containing GTT order status and the assigned GTT order number
+
+        Raises:
+            TradeXAPIError: If the order placement fails
+            TradeXInvalidResponseError: If the order parameters are invalid
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        order_payload = new_order_details.get_dict()
+        response = await self._post('NewGTTOrder', payload=order_payload, deadline=deadline)
+        return NewGttOrderResponse(status=response.get('status'), message=response.get('message'), data=NewGttOrderData(**response.get('data')))
+
+    @timed_endpoint
+    async def modify_gtt_order(self, modify_order_data: ModifyGTTOrderRequest, deadline: float=None):
+        """
+        Modify an existing GTT order.
+
+        Args:
+            modify_order_data (ModifyGTTOrderRequest): Modified GTT order details.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            ModifyGTTOrderResponse: Object containing status of the modification
+                and updated GTT order details
+
+        Raises:
+            TradeXAPIError: If the order modification fails
+            TradeXInvalidResponseError: If the modification parameters are invalid
+            TradeXDataFetchError: If the original GTT order cannot be found
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        order_payload = modify_order_data.get_dict()
+        response = await self._post('ModifyGTTOrder', payload=order_payload, deadline=deadline)
+        return ModifyGTTOrderResponse(status=response.get('status'), message=response.get('message'), data=ModifyGTTOrderData(**response.get('data')))
+
+    @timed_endpoint
+    async def cancel_gtt_order(self, gtt_order_no: int, deadline: float=None):
+        """
+        Cancel a GTT order.
+
+        Args:
+            gtt_order_no (int): The GTT order number to cancel
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            CancelGTTOrderResponse: Object containing cancellation status and details
+                of the cancelled GTT order
+
+        Raises:
+            TradeXAPIError: If the cancellation request fails
+            TradeXDataFetchError: If the specified GTT order cannot be found
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        params = {
+            "ClientID": self.client_id,
+            "GttOrderNo": gtt_order_no
+        }
+        response = await self._post('CancelGTTOrder', params=params, deadline=deadline)
+        return CancelGTTOrderResponse(data=CancelGTTOrderData(**response.get('data')), status=response.get('status'), message=response.get('message'))
+
+    @timed_endpoint
+    async def execute_basket_order(self, order_details: ExecuteBasketOrderRequest, deadline: float=None):
+        """
+        Execute a basket order (multiple orders at once).
+
+        Args:
+            order_details (ExecuteBasketOrderRequest): Basket order details including
+                an array of individual order requests
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            ExecuteBasketResponse: Object containing execution status for the basket
+
+        Raises:
+            TradeXAPIError: If the basket execution fails
+            TradeXInvalidResponseError: If any order parameters are invalid
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        order_payload = self._get_dict(order_details)
+        response = await self._post('ExecuteBasket', payload=order_payload, deadline=deadline)
+        return ExecuteBasketResponse(data=ExecuteBasketData(**response.get('data')), status=response.get('status'), message=response.get('message'))
+
+
+    # -------------------------------------------------------------------------
+    # BOOK ENDPOINTS
+    # -------------------------------------------------------------------------
+
+    async def get_order_book(self, filter_type: str = 'All', as_frame: bool=False, deadline: float=None):
+        """
+        Get the order book with filtering options.
+
+        Args:
+            filter_type (str, optional): Filter for order status. Defaults to 'All'.
+                See :meth:`TradeXClient.get_order_book` for valid options.
+            as_frame (bool, optional): Return a columnar OrderBookFrame instead of a list of rows.
+                Requires numpy. Defaults to False.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        When the order store is enabled (see `enable_order_store`), the filters it can
+        answer exactly are served from it, as for :meth:`TradeXClient.get_order_book`.
+
+        Returns:
+            OrderBookResponse: Object containing list of orders matching the filter criteria
+                or OrderBookFrame when as_frame is True
+
+        Raises:
+            ValueError: If an invalid filter_type is provided
+            TradeXAPIError: If the order book data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        order_store = self.order_store
+        if order_store is not None and not as_frame and order_store.answers(filter_type):
+            return order_store.get_order_book(filter_type)
+        return await self._fetch_order_book(filter_type, as_frame=as_frame, deadline=deadline)
+
+    @coalesced
+    @cached('OrderBook')
+    @timed_endpoint
+    async def _fetch_order_book(self, filter_type: str='All', as_frame: bool=False, deadline: float=None):
+        """
+        Request the order book from the server, bypassing the order store.
+        """
+        if filter_type not in order_book_filters:
+            list_filters = ', '.join(order_book_filters)
+            raise ValueError(f'Invalid filter type! Must be one of these: {list_filters}')
+
+        params = {
+            "ClientID": self.client_id,
+            "Filter": filter_type
+        }
+        response = await self._post('OrderBook', params=params, deadline=deadline)
+        if as_frame:
+            return OrderBookFrame.from_response(response)
+        order_data_list = OrderBookData.parse_list(response, validation=self.validation)
+        return OrderBookResponse(status=response.get('status'), message=response.get('message'), data=order_data_list)
+
+    async def enable_order_store(self, deadline: float=None):
+        """
+        Keep a local order book current from WebSocket order events.
+
+        See :meth:`TradeXClient.enable_order_store`.
+
+        Args:
+            deadline (float, optional): Latency budget in seconds for the seeding request. Defaults to None.
+
+        Returns:
+            OrderStore: The seeded store
+
+        Raises:
+            TradeXAPIError: If the websocket is not running or the order book cannot be retrieved
+        """
+        if not self.websocket_running:
+            raise TradeXAPIError("Websocket client is not running. Please start the websocket first.")
+        self.disable_order_store()
+        store = OrderStore()
+        self.websocket_client.order_store = store
+        try:
+            with fresh_reads():
+                store.update_many((await self._fetch_order_book('All', deadline=deadline)).data)
+        except BaseException:
+            self.websocket_client.order_store = None
+            raise
+        self.order_store = store
+        return store
+
+    @timed_endpoint
+    async def get_order_status(self, order_details: OrderStatusRequest, deadline: float=None):
+        """
+        Get the status of a specific order.
+
+        Args:
+            order_details (OrderStatusRequest): Details of the order.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            OrderStatusResponse: Object containing order status information
+
+        Raises:
+            TradeXAPIError: If the status cannot be retrieved
+            TradeXDataFetchError: If the specified order cannot be found
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        order_payload = self._get_dict(order_details)
+        response = await self._post('OrderStatus', payload=order_payload, deadline=deadline)
+        order_data_list = OrderStatusData.parse_list(response, validation=self.validation)
+        return OrderStatusResponse(status=response.get("status"), message=response.get("message"), data=order_data_list)
+
+    @coalesced
+    @cached('GttOrdersBook')
+    @timed_endpoint
+    async def get_gtt_order_book(self, deadline: float=None):
+        """
+        Get the book of all GTT (Good-Till-Triggered) orders.
+
+        Args:
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            GTTOrdersBookResponse: Object containing list of GTT orders
+
+        Raises:
+            TradeXAPIError: If the GTT order data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        params = {
+            "ClientID": self.client_id
+        }
+        response = await self._post('GttOrdersBook', params=params, deadline=deadline)
+        order_data_list = GTTOrderBookData.parse_list(response, validation=self.validation)
+        return GTTOrdersBookResponse(status=response.get("status"), message=response.get("message"), data=order_data_list)
+
+    @coalesced
+    @cached('TradeBook')
+    @timed_endpoint
+    async def get_trades_book(self, as_frame: bool=False, deadline: float=None):
+        """
+        Get the book of all executed trades.
+
+        Args:
+            as_frame (bool, optional): Return a columnar TradesFrame instead of a list of rows.
+                Requires numpy. Defaults to False.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            TradesBookResponse: Object containing list of trades
+                or TradesFrame when as_frame is True
+
+        Raises:
+            TradeXAPIError: If the trade data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        params = {
+            "ClientID": self.client_id
+        }
+        response = await self._post('TradeBook', params=params, deadline=deadline)
+        if as_frame:
+            return TradesFrame.from_response(response)
+        order_data_list = TradesBookData.parse_list(response, validation=self.validation)
+        return TradesBookResponse(status=response.get("status"), message=response.get("message"), data=order_data_list)
+
+    @timed_endpoint
+    async def get_order_history(self, client_details: OrderHistoryRequest, deadline: float=None):
+        """
+        Get the history of orders.
+
+        Args:
+            client_details (OrderHistoryRequest): Details for the order history.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            OrderHistoryResponse: Object containing order history
+
+        Raises:
+            TradeXAPIError: If the history data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        client_payload = self._get_dict(client_details)
+        response = await self._post('OrderHistory', payload=client_payload, deadline=deadline)
+        order_data_list = OrderHistoryData.parse_list(response, validation=self.validation)
+        return OrderHistoryResponse(status=response.get("status"), message=response.get("message"), data=order_data_list)
+
+
+    # -------------------------------------------------------------------------
+    # PORTFOLIO ENDPOINTS
+    # -------------------------------------------------------------------------
+
+    @coalesced
+    @cached('Holdings')
+    @timed_endpoint
+    async def get_holdings(self, as_frame: bool=False, deadline: float=None):
+        """
+        Get the current holdings in the portfolio.
+
+        Args:
+            as_frame (bool, optional): Return a columnar HoldingsFrame instead of a list of rows.
+                Requires numpy. Defaults to False.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            HoldingsResponse: Object containing holdings information
+                or HoldingsFrame when as_frame is True
+
+        Raises:
+            TradeXAPIError: If the holdings data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        params = {
+            "ClientID": self.client_id
+        }
+        response = await self._post('Holdings', params=params, deadline=deadline)
+        if as_frame:
+            return HoldingsFrame.from_response(response)
+        holdings_list = HoldingsData.parse_list(response, validation=self.validation)
+        return HoldingsResponse(status=response.get("status"), message=response.get("message"), data=holdings_list)
+
+    @coalesced
+    @cached('NetPositions')
+    @timed_endpoint
+    async def get_positions(self, filter_type: str='All', as_frame: bool=False, deadline: float=None):
+        """
+        Get the current positions (open and closed).
+
+        Args:
+            filter_type (str, optional): Filter for position type. Defaults to 'All'.
+                Valid options: 'All', 'Todays', 'Opening'
+            as_frame (bool, optional): Return a columnar NetPositionFrame instead of a list of rows.
+                Requires numpy. Defaults to False.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            NetPositionResponse: Object containing positions information
+                or NetPositionFrame when as_frame is True
+
+        Raises:
+            ValueError: If an invalid filter_type is provided
+            TradeXAPIError: If the positions data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        valid_filters = ['All', 'Todays', 'Opening']
+        if filter_type not in valid_filters:
+            list_filters = ', '.join(valid_filters)
+            raise ValueError(f'Invalid filter type! must be one of these : {list_filters}')
+
+        params = {
+            "ClientID": self.client_id,
+            "Filter": filter_type
+        }
+        response = await self._post('NetPositions', params=params, deadline=deadline)
+        if as_frame:
+            return NetPositionFrame.from_response(response)
+        net_positions = NetPositionData.parse_list(response, validation=self.validation)
+        return NetPositionResponse(status=response.get("status"), message=response.get("message"), data=net_positions)
+
+    async def enable_position_engine(self, reconcile_interval: float=60, deadline: float=None):
+        """
+        Keep net positions current from WebSocket trade events.
+
+        See :meth:`TradeXClient.enable_position_engine`. Reconciles run as a task on the
+        running event loop.
+
+        Args:
+            reconcile_interval (float, optional): Seconds between reconciles. Defaults to 60.
+            deadline (float, optional): Latency budget in seconds for each seeding request. Defaults to None.
+
+        Returns:
+            AsyncPositionEngine: The seeded engine
+
+        Raises:
+            TradeXAPIError: If the websocket is not running or the positions cannot be retrieved
+        """
+        if not self.websocket_running:
+            raise TradeXAPIError("Websocket client is not running. Please start the websocket first.")
+        self.disable_position_engine()
+        engine = AsyncPositionEngine(self)
+        self.websocket_client.position_engine = engine
+        try:
+            await engine.seed(deadline=deadline)
+        except BaseException:
+            self.websocket_client.position_engine = None
+            raise
+        engine.start_reconcile(reconcile_interval)
+        self.position_engine = engine
+        return engine
+
+    @timed_endpoint
+    async def convert_position(self, conversion_data: ConvertPositionRequest, deadline: float=None):
+        """
+        Convert position from one product type to another.
+
+        Args:
+            conversion_data (ConvertPositionRequest): Position conversion details
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            ConvertPositionResponse: Object containing conversion status
+
+        Raises:
+            TradeXAPIError: If the position conversion fails
+            TradeXInvalidResponseError: If the conversion parameters are invalid
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        conversion_payload = self._get_dict(conversion_data)
+        response = await self._post('ModifyProduct', payload=conversion_payload, deadline=deadline)
+        return ConvertPositionResponse(status=response.get('status'), message=response.get('message'), data=ConvertPositionData(**response.get('data')))
+
+
+    async def get_portfolio_snapshot(self, order_filter: str='All', position_filter: str='All', deadline: float=None):
+        """
+        Get the order book, trades book, positions, holdings and funds report in one call.
+
+        See :meth:`TradeXClient.get_portfolio_snapshot`. The requests run concurrently on
+        the event loop instead of a thread pool.
+
+        Args:
+            order_filter (str, optional): Filter passed to `get_order_book`. Defaults to 'All'.
+            position_filter (str, optional): Filter passed to `get_positions`. Defaults to 'All'.
+            deadline (float, optional): Latency budget in seconds for each request. Defaults to None.
+
+        Returns:
+            PortfolioSnapshot: Object containing the response of each endpoint, per-endpoint
+                timings in seconds and the errors of endpoints that failed
+
+        Raises:
+            ValueError: If an invalid order_filter or position_filter is provided
+        """
+        calls = {
+            'OrderBook': ('order_book', self.get_order_book(order_filter, deadline=deadline)),
+            'TradeBook': ('trades_book', self.get_trades_book(deadline=deadline)),
+            'NetPositions': ('positions', self.get_positions(position_filter, deadline=deadline)),
+            'Holdings': ('holdings', self.get_holdings(deadline=deadline)),
+            'FundsReport': ('funds_report', self.get_funds_report(deadline=deadline)),
+        }
+
+        snapshot = PortfolioSnapshot()
+        start_time = time.perf_counter()
+        results = await asyncio.gather(*(self._timed_call(call) for _, call in calls.values()))
+        for (endpoint, (attribute, _)), (result, elapsed, error) in zip(calls.items(), results):
+            snapshot.timings[endpoint] = elapsed
+            if error is not None:
+                snapshot.errors[endpoint] = error
+            else:
+                setattr(snapshot, attribute, result)
+
+        snapshot.elapsed = time.perf_counter() - start_time
+        return snapshot
+
+
+    # -------------------------------------------------------------------------
+    # FUNDS ENDPOINTS
+    # -------------------------------------------------------------------------
+
+    @coalesced
+    @cached('FundsReport')
+    @timed_endpoint
+    async def get_funds_report(self, deadline: float=None):
+        """
+        Get the funds report.
+
+        Args:
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            FundsReportResponse: Object containing funds details
+
+        Raises:
+            TradeXAPIError: If the funds data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        params = {
+            "ClientID": self.client_id
+        }
+        response = await self._post('FundsReport', params=params, deadline=deadline)
+        funds_data = FundsReportData.parse_list(response, validation=self.validation)
+        return FundsReportResponse(status=response.get("status"), message=response.get("message"), data=funds_data)
+
+
+    # -------------------------------------------------------------------------
+    # OTHER ENDPOINTS
+    # -------------------------------------------------------------------------
+
+    @coalesced
+    @cached('ExchangeStatus')
+    @timed_endpoint
+    async def get_exchange_status(self, deadline: float=None):
+        """
+        Get the status of various exchanges.
+
+        Args:
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            ExchangeStatusResponse: Object containing exchange connectivity status
+
+        Raises:
+            TradeXAPIError: If the exchange status data cannot be retrieved
+            TradeXTimeoutError: If the request times out or the deadline is spent
+        """
+        params = {
+            "ClientID": self.client_id
+        }
+        response = await self._post('ExchangeStatus', params=params, deadline=deadline)
+        exchange_data = ExchangeStatusData.parse_list(response, validation=self.validation)
+        return ExchangeStatusResponse(status=response.get("status"), message=response.get("message"), data=exchange_data)
+
+
+    # -------------------------------------------------------------------------
+    # HELPER METHODS
+    # -------------------------------------------------------------------------
+
+    def _get_session(self):
+        """
+        Return the shared HTTP session, creating it on the running loop if needed.
+
+        Returns:
+            aiohttp.ClientSession: Session backed by a keep-alive connection pool
+        """
+        if self.aio_session is None or self.aio_session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=self.keepalive_timeout)
+            self.aio_session = aiohttp.ClientSession(connector=connector)
+        return self.aio_session
+
+    async def _timed_call(self, call):
+        """
+        Await an endpoint call and measure its duration.
+
+        Args:
+            call (coroutine): Coroutine performing the request
+
+        Returns:
+            tuple: (result, elapsed seconds, error), where exactly one of result and error is None
+        """
+        start_time = time.perf_counter()
+        try:
+            result = await call
+            return result, time.perf_counter() - start_time, None
+        except (TradeXAPIError, aiohttp.ClientError) as ex:
+            return None, time.perf_counter() - start_time, ex
+
+    def _client_timeout(self, endpoint: str, deadline_at: float=None):
+        """
+        Build the aiohttp timeout for a request from the endpoint timeout and deadline.
+
+        Args:
+            endpoint (str): API endpoint to call
+            deadline_at (float, optional): `time.monotonic()` value by which the call must finish.
+                Defaults to None.
+
+        Returns:
+            aiohttp.ClientTimeout: Timeout for the request
+
+        Raises:
+            TradeXTimeoutError: If the deadline has already passed
+        """
+        timeout = self._request_timeout(endpoint, deadline_at)
+        total = deadline_at - time.monotonic() if deadline_at is not None else None
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return aiohttp.ClientTimeout(total=total, sock_connect=connect, sock_read=read)
+        return aiohttp.ClientTimeout(total=total if total is not None else timeout, sock_connect=timeout, sock_read=timeout)
+
+    async def _post(self, endpoint: str, payload: dict=None, params: dict=None, deadline: float=None):
+        """
+        Make a POST request to the TradeX API.
+
+        Uses the same endpoint timeouts as :meth:`TradeXClient._post`. When a deadline is
+        given, the whole request including connection setup must finish within it.
+
+        Args:
+            endpoint (str): API endpoint to call
+            payload (dict, optional): JSON payload for the request. Defaults to None.
+            params (dict, optional): Query parameters for the request. Defaults to None.
+            deadline (float, optional): Latency budget in seconds for this call. Defaults to None.
+
+        Returns:
+            dict: JSON response from the API
+
+        Raises:
+            TradeXAuthenticationError: For authentication failures (401)
+            TradeXInvalidResponseError: For bad requests (400)
+            TradeXDataFetchError: For no data found (404)
+            TradeXTimeoutError: If the request times out or the deadline is spent
+            TradeXRateLimitError: If the rate limiter is in non-blocking mode and the limit is reached
+            TradeXAPIError: For other API errors
+        """
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        timing = self.instrumentation.begin_request(endpoint) if self.instrumentation.enabled else None
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async(endpoint, request_exchanges(payload), deadline_at)
+            if timing:
+                timing.throttled()
+        timeout = self._client_timeout(endpoint, deadline_at)
+        session = self._get_session()
+        body = json.dumps(payload).encode() if payload is not None else None
+        if timing:
+            timing.serialized()
+        try:
+            async with session.post(url, data=body, params=params, headers=self.headers, timeout=timeout) as response:
+                response_text = await response.text()
+                status_code = response.status
+        except asyncio.TimeoutError as ex:
+            raise TradeXTimeoutError(f"Request timed out for endpoint: {endpoint}: {ex}")
+        finally:
+            # Also after a timeout, since the request may still have been carried out
+            if self.response_cache is not None:
+                self.response_cache.invalidate_after(endpoint)
+        if deadline_at is not None and time.monotonic() > deadline_at:
+            raise TradeXTimeoutError(f"Deadline exceeded waiting for response from endpoint: {endpoint}")
+        if timing:
+            timing.received()
+
+        logger.debug("Response from %s (%s): %s", endpoint, status_code, response_text)
+
+        try:
+            response_json = json.loads(response_text) if response_text else None
+            if timing:
+                timing.decoded()
+            return self._handle_response(endpoint, status_code, response_json)
+        except json.JSONDecodeError:
+            raise TradeXAPIError(f"Invalid JSON response from {endpoint}. Response: {response_text}")
+        except Exception as ex:
+            raise TradeXAPIError(f"An unknown error occurred for endpoint {endpoint}: {ex}")
+
+    async def start_websocket(self, auto_reconnect=True):
+        """
+        Start the asyncio websocket connection on the running event loop.
+
+        Events can then be consumed with ``async for event in client.websocket_client.events()``
+        or through :meth:`register_callback`, which accepts coroutine functions. Events missed
+        while reconnecting are not replayed; the asyncio client has no counterpart to the
+        opt-in `resync` of :meth:`TradeXClient.start_websocket`.
+
+        Args:
+            auto_reconnect (bool): Whether to automatically reconnect if connection drops
+
+        Returns:
+            bool: True if successfully started, False otherwise
+        """
+        if self.websocket_running:
+            return True
+
+        if self.token:
+            self.websocket_client = AsyncTradeXWebSocketClient(self.websocket_host, self.websocket_port, self.token, self.client_id, 3, 3, validation=self.validation, instrumentation=self.instrumentation)
+            self.websocket_client.response_cache = self.response_cache
+            if await self.websocket_client.start():
+                self.websocket_running = True
+                return True
+            else:
+                return False
+        else:
+            logger.error("Please Login First!")
+        return False
+
+    def subscribe(self, message_type, callback_function, exchange=None, code=None, client=None, status=None):
+        """
+        Add a subscriber for a message type, optionally filtered by exchange, code, client or status
+
+        See `AsyncTradeXWebSocketClient.subscribe`. Subscribers run one at a time on the
+        callback task, so the `queue_size` and `overflow` options of
+        :meth:`TradeXClient.subscribe` do not apply.
+
+        Args:
+            message_type (str): The type of message to listen for
+            callback_function (function): Function or coroutine function to call when a matching message is received
+            exchange (str | collection, optional): Accepted exchanges
+            code (str | collection, optional): Accepted instrument codes
+            client (str | collection, optional): Accepted client IDs
+            status (str | collection, optional): Accepted order statuses
+
+        Returns:
+            Subscription: Handle to pass to `unsubscribe`
+        """
+        if self.websocket_client:
+            return self.websocket_client.subscribe(message_type, callback_function, exchange=exchange, code=code, client=client, status=status)
+        raise TradeXAPIError("Websocket client is not initialized. Please start the websocket first.")
+
+    async def stop_websocket(self):
+        """
+        Stop the asyncio websocket connection
+
+        Returns:
+            bool: True if successfully stopped or not running, False otherwise
+        """
+        if not self.websocket_running:
+            return True
+
+        self.disable_order_store()
+        self.disable_position_engine()
+        await self.websocket_client.stop()
+        self.websocket_running = False
+        return True
@@ -0,0 +1,450 @@
+import asyncio
+import inspect
+import json
+import logging
+import ssl
+import time
+from typing import Any, NamedTuple, Optional
+
+from .instrumentation import Instrumentation, WEBSOCKET
+from .subscription_bus import SubscriptionBus
+from .tradex_websocket_client import build_event, event_fields
+from .websocket_protocol import WebSocketProtocol, HandshakeFailed, Message, Ping, Pong, Close
+
+logger = logging.getLogger(__name__)
+
+class WebSocketEvent(NamedTuple):
+    """
+    One event received from the WebSocket server.
+
+    Attributes:
+        event_type (str): Value of the message's `eventType`, e.g. "order" or "trade"
+        data: OrderBookData for "order" events, TradesBookData for "trade" events and the
+            decoded message dictionary otherwise
+    """
+    event_type: Optional[str]
+    data: Any
+
+class AsyncTradeXWebSocketClient:
+    """
+    asyncio-native WebSocket client for order and trade events.
+
+    Runs entirely on the event loop: the connection is opened with
+    `asyncio.open_connection` over TLS, and frames are read, events decoded and callbacks
+    run as tasks of the loop that called `start`. Events can be consumed with
+    `async for event in client.events()`, through callbacks registered with
+    `register_callback` or added with `subscribe`, or any mix of these. Callbacks may
+    be plain functions or coroutine functions; they run one at a time in the order the
+    events were received.
+
+    Lost connections are re-established like TradeXWebSocketClient does: up to
+    `reconnect_attempts` attempts with a delay starting at `reconnect_delay` seconds and
+    doubling up to 30 seconds.
+
+    Attributes:
+        is_running (bool): Whether the client is started
+        callbacks (dict): Callback per event type
+        bus (SubscriptionBus): Filtered subscribers added with `subscribe`
+        queue_size (int): Maximum number of events waiting per consumer
+        instrumentation (Instrumentation): Latency histograms for framing, decoding and callbacks
+        response_cache (ResponseCache): Cache whose entries order and trade events invalidate, or None
+        order_store (OrderStore): Store updated with every `order` event, or None
+        position_engine (AsyncPositionEngine): Engine updated with every `trade` event, or None
+    """
+    def __init__(self, host, port, token, client_id, reconnect_attempts=5, reconnect_delay=3, validation="strict", queue_size=1000, instrumentation=None):
+        self.websocket_host = host
+        self.websocket_port = port
+        self.token = token
+        self.client_id = client_id
+        self.reconnect_attempts = reconnect_attempts
+        self.reconnect_delay = reconnect_delay
+        self.validation = validation
+        self.queue_size = queue_size
+        self.instrumentation = instrumentation or Instrumentation()
+        self.response_cache = None
+        self.order_store = None
+        self.position_engine = None
+        self.ping_interval = 30
+        self.is_running = False
+        self.reader = None
+        self.writer = None
+        self.protocol = None
+        self.callbacks = {}
+        self.bus = SubscriptionBus()
+        self.event_queues = []
+        self.callback_queue = None
+        self.receiver_task = None
+        self.heartbeat_task = None
+        self.reconnect_task = None
+        self.callback_task = None
+        self.callback_stop_task = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    def register_callback(self, message_type, callback_function):
+        """
+        Register a callback function for a specific message type
+
+        Args:
+            message_type (str): Type of message to listen for
+            callback_function (callable): Function or coroutine function to call when message received
+        """
+        self.callbacks[message_type] = callback_function
+
+    def subscribe(self, message_type, callback_function, exchange=None, code=None, client=None, status=None):
+        """
+        Add a subscriber for a message type, optionally filtered by field values
+
+        Any number of subscribers can receive the same event. They run on the callback
+        task after the registered callback, in subscription order, and like it hold up
+        the receiver once `queue_size` events are waiting. Filters are checked on the
+        decoded JSON, as for TradeXWebSocketClient.subscribe.
+
+        Args:
+            message_type (str): Type of message to listen for
+            callback_function (callable): Function or coroutine function to call when a matching message is received
+            exchange (str | collection, optional): Accepted exchanges
+            code (str | collection, optional): Accepted instrument codes
+            client (str | collection, optional): Accepted client IDs
+            status (str | collection, optional): Accepted order statuses
+
+        Returns:
+            Subscription: Handle to pass to `unsubscribe`
+        """
+        return self.bus.subscribe(message_type, callback_function, exchange=exchange, code=code, client=client, status=status)
+
+    def unsubscribe(self, subscription):
+        """
+        Remove a subscriber added with `subscribe`
+
+        Returns:
+            bool: True if the subscriber was removed, False if it was not subscribed
+        """
+        return self.bus.unsubscribe(subscription)
+
+    async def start(self):
+        """
+        Connect to the server and start receiving events.
+
+        Returns:
+            bool: True if the connection was established, False otherwise
+        """
+        if self.is_running:
+            return True
+        self.is_running = True
+        self.callback_queue = asyncio.Queue(maxsize=self.queue_size)
+        self.callback_task = asyncio.ensure_future(self._callback_loop())
+        if not await self._connect_with_retry():
+            await self.stop()
+            return False
+        return True
+
+    async def stop(self):
+        """
+        Close the connection, end every `events()` iterator and wait for queued callbacks.
+        """
+        if not self.is_running:
+            return
+        self.is_running = False
+        current = asyncio.current_task()
+        for task in (self.heartbeat_task, self.receiver_task, self.reconnect_task):
+            if task and task is not current:
+                task.cancel()
+        await self._close_connection(send_close=True)
+        # A full queue is not waited on: its consumer is busy and ends once it has drained it
+        for events in self.event_queues:
+            if not events.full():
+                events.put_nowait(None)
+        if self.callback_task:
+            if self.callback_task is not current:
+                await self.callback_queue.put(None)
+                await self.callback_task
+            elif self.callback_queue.full():
+                # Stopped from a callback: the marker is queued once this callback returns and frees a slot
+                self.callback_stop_task = asyncio.ensure_future(self.callback_queue.put(None))
+            else:
+                self.callback_queue.put_nowait(None)
+        self.callback_task = None
+        self.reconnect_task = None
+        logger.info("WebSocket client stopped.")
+
+    async def events(self):
+        """
+        Iterate over the events received from now until the client stops.
+
+        Each call gets its own queue of at most `queue_size` events; while it is full the
+        receiver waits for the consumer.
+
+        Yields:
+            WebSocketEvent: The next event
+        """
+        events = asyncio.Queue(maxsize=self.queue_size)
+        self.event_queues.append(events)
+        try:
+            while self.is_running or not events.empty():
+                event = await events.get()
+                if event is None:
+                    return
+                yield event
+        finally:
+            self.event_queues.remove(events)
+
+    async def send_message(self, message):
+        if not self.writer:
+            logger.error("Not connected. Cannot send message.")
+            return False
+        try:
+            self.writer.write(self.protocol.text(message))
+            await self.writer.drain()
+            logger.debug("Sent message: %s", message)
+            return True
+        except Exception as e:
+            logger.error("Error sending message: %s", e)
+            self._handle_connection_failure()
+            return False
+
+    async def _connect_with_retry(self):
+        attempt = 0
+        connected = False
+
+        # Exponential backoff for reconnection
+        delay = self.reconnect_delay
+
+        while self.is_running and attempt < self.reconnect_attempts and not connected:
+            if attempt > 0:
+                logger.info("Reconnection attempt %d/%d in %s seconds...", attempt, self.reconnect_attempts, delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30)
+
+            try:
+                connected = await self._connect_websocket()
+            except Exception as e:
+                logger.error("Connection attempt failed: %s", e)
+            attempt += 1
+
+        if connected and self.response_cache is not None:
+            # Events missed while disconnected did not invalidate anything
+            self.response_cache.invalidate_events()
+        if not connected and self.is_running:
+            # The caller stops the client, which also ends the iterators and callbacks
+            logger.error("Failed to connect after multiple attempts. Giving up.")
+        return connected
+
+    async def _connect_websocket(self):
+        protocol = WebSocketProtocol(self.websocket_host, self.websocket_port, f"/?token={self.token}&clientID={self.client_id}")
+        try:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    self.websocket_host,
+                    self.websocket_port,
+                    ssl=ssl.create_default_context(),
+                    server_hostname=self.websocket_host
+                ),
+                timeout=30
+            )
+            logger.info("Connected to WebSocket server %s:%s", self.websocket_host, self.websocket_port)
+        except Exception as e:
+            logger.error("Failed to connect: %s", e)
+            return False
+
+        self.protocol = protocol
+        if not await self._perform_handshake(protocol):
+            await self._close_connection()
+            return False
+
+        self.heartbeat_task = asyncio.ensure_future(self._heartbeat_loop())
+        self.receiver_task = asyncio.ensure_future(self._receive_messages(self.reader, protocol))
+        return True
+
+    async def _perform_handshake(self, protocol):
+        self.writer.write(protocol.handshake_request())
+        await self.writer.drain()
+
+        # Frames the server sends right behind the headers stay buffered in the protocol
+        async def read_response():
+            events = []
+            while not events:
+                data = await self.reader.read(65536)
+                if not data:
+                    return []
+                events = protocol.feed(data)
+            return events
+
+        try:
+            events = await asyncio.wait_for(read_response(), timeout=10)
+        except (asyncio.TimeoutError, ConnectionError, OSError):
+            events = []
+        if not events:
+            logger.error("No handshake response received.")
+            return False
+
+        if isinstance(events[0], HandshakeFailed):
+            logger.error("WebSocket handshake failed. Server response:\n%s", events[0].response)
+            return False
+
+        logger.info("WebSocket connection established.")
+        return True
+
+    async def _heartbeat_loop(self):
+        """Send periodic pings to keep the connection alive"""
+        while self.is_running:
+            await asyncio.sleep(self.ping_interval)
+            try:
+                self.writer.write(self.protocol.ping())
+                await self.writer.drain()
+                logger.debug("Sent ping to server")
+            except Exception as e:
+                logger.error("Failed to send ping: %s", e)
+                self._handle_connection_failure()
+                return
+
+    async def _receive_messages(self, reader, protocol):
+        try:
+            # Frames that arrived together with the handshake are already buffered
+            events = protocol.next_events()
+            while self.is_running and self.reader is reader:
+                for event in events:
+                    if isinstance(event, Message):
+                        if event.data:
+                            await self._handle_message(event.data)
+                    elif isinstance(event, Ping):
+                        self.writer.write(protocol.pong(event.payload))
+                    elif isinstance(event, Pong):
+                        logger.debug("Received pong from server")
+                    elif isinstance(event, Close):
+                        logger.info("WebSocket connection closed by server.")
+                        self._handle_connection_failure()
+                        return
+                data = await reader.read(65536)
+                if not data:
+                    raise ConnectionResetError("Connection closed by server")
+                instrumentation = self.instrumentation
+                started = time.perf_counter_ns() if instrumentation.enabled else 0
+                events = protocol.feed(data)
+                if started:
+                    instrumentation.record(WEBSOCKET, "frame", "read", time.perf_counter_ns() - started)
+        except asyncio.CancelledError:
+            raise
+        except (ConnectionError, OSError) as e:
+            if self.is_running and self.reader is reader:
+                logger.warning("Connection problem: %s", e)
+                self._handle_connection_failure()
+        logger.debug("Receiver task terminated.")
+
+    async def _handle_message(self, message):
+        instrumentation = self.instrumentation
+        try:
+            started = time.perf_counter_ns() if instrumentation.enabled else 0
+            json_data = json.loads(message.decode("utf-8", errors="replace"))
+            message_type = json_data.get("eventType")
+            if started:
+                instrumentation.record(WEBSOCKET, str(message_type), "decode", time.perf_counter_ns() - started)
+            if self.response_cache is not None:
+                self.response_cache.invalidate_event(message_type)
+            # Subscriber filters run on the decoded JSON, so events nobody wants are never built
+            subscriptions = self.bus.match(message_type, event_fields(message_type, json_data))
+            if not subscriptions and not self._is_wanted(message_type):
+                if not self.bus.has_subscribers(message_type):
+                    logger.debug("No callback registered for event type: %s", message_type)
+                return
+            started = time.perf_counter_ns() if instrumentation.enabled else 0
+            data = build_event(message_type, json_data, self.validation)
+            if started:
+                instrumentation.record(WEBSOCKET, str(message_type), "model", time.perf_counter_ns() - started)
+            # Applied on the receiver task so the store and engine see events in arrival order
+            order_store = self.order_store
+            if order_store is not None and message_type == "order":
+                order_store.update(data)
+            position_engine = self.position_engine
+            if position_engine is not None and message_type == "trade":
+                position_engine.apply_trade(data)
+            await self._publish(message_type, data, subscriptions)
+        except json.JSONDecodeError:
+            logger.warning("Received non-JSON message: %r...", message[:100])
+        except Exception as e:
+            logger.warning("Error processing message: %s", e, exc_info=True)
+
+    def _is_wanted(self, message_type):
+        """Whether anything other than a subscriber needs events of this type"""
+        if self.event_queues or message_type in self.callbacks:
+            return True
+        if message_type == "order":
+            return self.order_store is not None
+        if message_type == "trade":
+            return self.position_engine is not None
+        return False
+
+    async def _publish(self, message_type, data, subscriptions=()):
+        logger.debug("Received %s event", message_type)
+        event = WebSocketEvent(message_type, data)
+        for events in list(self.event_queues):
+            await events.put(event)
+        callback = self.callbacks.get(message_type)
+        callbacks = tuple(subscription.callback for subscription in subscriptions)
+        if callback is not None:
+            callbacks = (callback,) + callbacks
+        if callbacks:
+            await self.callback_queue.put((event, callbacks))
+        elif not self.event_queues:
+            logger.debug("No callback registered for event type: %s", message_type)
+
+    async def _callback_loop(self):
+        while True:
+            item = await self.callback_queue.get()
+            if item is None:
+                return
+            event, callbacks = item
+            for callback in callbacks:
+                instrumentation = self.instrumentation
+                started = time.perf_counter_ns() if instrumentation.enabled else 0
+                try:
+                    result = callback(event.data)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    logger.error("Callback execution failed for %s: %s", event.event_type, e, exc_info=True)
+                if started:
+                    instrumentation.record(WEBSOCKET, str(event.event_type), "callback", time.perf_counter_ns() - started)
+
+    def _handle_connection_failure(self):
+        if not self.is_running or self.reader is None:
+            return
+        logger.warning("Connection lost. Attempting to reconnect...")
+        if self.heartbeat_task:
+            self.heartbeat_task.cancel()
+        writer = self.writer
+        self.reader = None
+        self.writer = None
+        if writer:
+            writer.close()
+        self.reconnect_task = asyncio.ensure_future(self._reconnect())
+
+    async def _reconnect(self):
+        try:
+            reconnected = await self._connect_with_retry()
+        except Exception as e:
+            logger.error("Reconnection failed: %s", e, exc_info=True)
+            reconnected = False
+        if not reconnected:
+            await self.stop()
+
+    async def _close_connection(self, send_close=False):
+        writer = self.writer
+        protocol = self.protocol
+        self.reader = None
+        self.writer = None
+        if writer is None:
+            return
+        try:
+            if send_close:
+                writer.write(protocol.close())
+                await writer.drain()
+            writer.close()
+            await asyncio.wait_for(writer.wait_closed(), timeout=5)
+        except Exception:
+            pass
@@ -1,58 +1,181 @@
-import os
 import time
-import random
-import string
 import socket
 import ssl
 import json
-import struct
+import logging
 import threading
-import base64
-import hashlib
+import selectors
 
+from .callback_dispatcher import CallbackDispatcher
+from .instrumentation import Instrumentation, WEBSOCKET
+from .subscription_bus import SubscriptionBus
+from .subscriber_queue import SubscriberQueue, BLOCK, DROP_OLDEST
 from .models import OrderBookData, TradesBookData
+from .models.validation import validation_policy
+from .websocket_protocol import WebSocketProtocol, HandshakeFailed, Message, Ping, Pong, Close
+
+logger = logging.getLogger(__name__)
+
+def decode_event(message, validation="strict"):
+    """
+    Decode a complete WebSocket text message into its event type and payload.
+
+    `order` and `trade` events are built into OrderBookData and TradesBookData under the
+    given validation policy; other events keep the decoded message dictionary.
+
+    Args:
+        message: UTF-8 encoded JSON message
+        validation (str, optional): Validation policy for the built models. Defaults to "strict".
+
+    Returns:
+        tuple: (event type or None, payload)
+
+    Raises:
+        json.JSONDecodeError: If the message is not JSON
+    """
+    json_data = json.loads(message.decode("utf-8", errors="replace"))
+    message_type = json_data.get("eventType")
+    return message_type, build_event(message_type, json_data, validation)
+
+def event_fields(message_type, json_data):
+    """
+    Return the dictionary an event's fields are read from before any model is built:
+    the `data` object of order and trade events, the whole message otherwise.
+    """
+    if message_type == "order" or message_type == "trade":
+        return json_data.get("data", {})
+    return json_data
+
+def build_event(message_type, json_data, validation="strict"):
+    """
+    Build the payload of a decoded message: OrderBookData or TradesBookData for `order`
+    and `trade` events, the message dictionary itself otherwise.
+    """
+    with validation_policy(validation):
+        if message_type == "order":
+            return OrderBookData.from_dict(json_data.get("data", {}))
+        elif message_type == "trade":
+            return TradesBookData.from_dict(json_data.get("data", {}))
+    return json_data
 
 class TradeXWebSocketClient:
-    def __init__(self, host, port, token, client_id, reconnect_attempts=5, reconnect_delay=3):
+    def __init__(self, host, port, token, client_id, reconnect_attempts=5, reconnect_delay=3, validation="strict", callback_workers=4, callback_queue_size=1000, instrumentation=None):
         self.websocket_host = host
         self.websocket_port = port
         self.token = token
         self.client_id = client_id
-        self.websocket_magic_string = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
         self.is_running = False
         self.client_socket = None
+        self.protocol = None
+        self.receiver_wakeup = None
         self.reconnect_attempts = reconnect_attempts
         self.reconnect_delay = reconnect_delay
         self.connection_lock = threading.Lock()
         self.receiver_thread = None
         self.reconnecting = False
         self.callbacks = {}
+        self.callback_subscriptions = {}
+        self.bus = SubscriptionBus()
         self.last_ping_time = 0
         self.ping_interval = 30
-        
-        print(self.token)
+        self.validation = validation
+        self.instrumentation = instrumentation or Instrumentation()
+        self.dispatcher = CallbackDispatcher(callback_workers, callback_queue_size)
+        self.dispatcher.instrumentation = self.instrumentation
+        self.order_store = None
+        self.position_engine = None
+        self.resync = None
+        self.response_cache = None
+        self.has_connected = False
 
     def start(self):
         self.is_running = True
+        self.dispatcher.start()
+        for subscription in self.bus.get_subscriptions():
+            if subscription.queue is not None:
+                subscription.queue.start()
         return self._connect_with_retry()
 
     def register_callback(self, message_type, callback_function):
         """
         Register a callback function for a specific message type
         
+        Callbacks run on the dispatcher's worker threads. Events for the same
+        `exchange_order_no` are delivered one at a time in the order received.
+        A second callback for the same type replaces the first; use `subscribe` to
+        add several.
+        
         Args:
             message_type (str): Type of message to listen for 
             callback_function (callable): Function to call when message received
         """
+        previous = self.callback_subscriptions.get(message_type)
+        self.callback_subscriptions[message_type] = self.bus.subscribe(message_type, callback_function)
         self.callbacks[message_type] = callback_function
+        if previous is not None:
+            self.bus.unsubscribe(previous)
+
+    def subscribe(self, message_type, callback_function, exchange=None, code=None, client=None, status=None, queue_size=None, overflow=DROP_OLDEST):
+        """
+        Add a subscriber for a message type, optionally filtered by field values
+        
+        Any number of subscribers can receive the same event. Filters are checked on
+        the decoded JSON before the event's model is built, so events no subscriber
+        wants are not built at all.
+        
+        Each subscriber gets its own bounded queue and delivery thread (see
+        SubscriberQueue). "drop_oldest" drops the oldest waiting event and "conflate"
+        keeps only the latest waiting `order` event per `exchange_order_no`, so a slow
+        subscriber never holds up the receiver. Events dropped this way, including
+        `order` and `trade` fills, are never delivered to the subscriber; drops are
+        logged as a rate-limited warning and `subscription.queue.get_metrics()` reports
+        the dropped and conflated counts. Subscribers that must see every fill should
+        pass a `queue_size` large enough for their bursts or use "block".
+        
+        With "block" and no `queue_size`, the subscriber is instead called on the
+        dispatcher's worker threads like a registered callback, and a subscriber that
+        falls behind holds up the receiver once its worker's queue is full.
+        
+        Args:
+            message_type (str): Type of message to listen for
+            callback_function (callable): Function to call when a matching message is received
+            exchange (str | collection, optional): Accepted exchanges
+            code (str | collection, optional): Accepted instrument codes
+            client (str | collection, optional): Accepted client IDs
+            status (str | collection, optional): Accepted order statuses
+            queue_size (int, optional): Size of the subscriber's own queue. Defaults to
+                `callback_queue_size`.
+            overflow (str, optional): "drop_oldest", "conflate" or "block". Defaults to "drop_oldest".
+            
+        Returns:
+            Subscription: Handle to pass to `unsubscribe`
+        """
+        subscriber_queue = None
+        if queue_size is not None or overflow != BLOCK:
+            subscriber_queue = SubscriberQueue(callback_function, queue_size or self.dispatcher.queue_size, overflow, name=f"tradex-subscriber-{message_type}")
+            subscriber_queue.instrumentation = self.instrumentation
+            if self.is_running:
+                subscriber_queue.start()
+        return self.bus.subscribe(message_type, callback_function, exchange=exchange, code=code, client=client, status=status, queue=subscriber_queue)
+
+    def unsubscribe(self, subscription):
+        """
+        Remove a subscriber added with `subscribe`
+        
+        Returns:
+            bool: True if the subscriber was removed, False if it was not subscribed
+        """
+        removed = self.bus.unsubscribe(subscription)
+        if removed and subscription.queue is not None:
+            subscription.queue.stop()
+        return removed
 
     def stop(self):
         self.is_running = False
         with self.connection_lock:
             if self.client_socket:
                 try:
-                    close_frame = struct.pack("B", 0x88) + struct.pack("B", 0)
-                    self.client_socket.send(close_frame)
+                    self.client_socket.sendall(self.protocol.close())
                 except:
                     pass
                 finally:
@@ -62,7 +185,12 @@ class TradeXWebSocketClient:
                         pass
                     self.client_socket.close()
                     self.client_socket = None
-        print("[STOPPED] WebSocket client stopped.")
+            self._wake_receiver()
+        self.dispatcher.stop()
+        for subscription in self.bus.get_subscriptions():
+            if subscription.queue is not None:
+                subscription.queue.stop()
+        logger.info("WebSocket client stopped.")
 
     def _connect_with_retry(self):
         attempt = 0
@@ -74,7 +202,7 @@ class TradeXWebSocketClient:
         
         while self.is_running and attempt < self.reconnect_attempts and not connected:
             if attempt > 0:
-                print(f"[RECONNECTING] Reconnection attempt {attempt}/{self.reconnect_attempts} in {delay} seconds...")
+                logger.info("Reconnection attempt %d/%d in %s seconds...", attempt, self.reconnect_attempts, delay)
                 time.sleep(delay)
                 # Increase delay for next attempt (exponential backoff)
                 delay = min(delay * 2, 30)  # Cap at 30 seconds
@@ -82,17 +210,24 @@ class TradeXWebSocketClient:
             try:
                 connected = self._connect_websocket()
             except Exception as e:
-                print(f"[ERROR] Connection attempt failed: {e}")
+                logger.error("Connection attempt failed: %s", e)
             attempt += 1
             
         self.reconnecting = False
+        if connected and self.response_cache is not None:
+            # Events missed while disconnected did not invalidate anything
+            self.response_cache.invalidate_events()
+        if connected and self.resync is not None:
+            # The first connection records a baseline; later ones replay what was missed
+            self.resync.schedule(replay=self.has_connected)
+        self.has_connected = self.has_connected or connected
         if not connected and self.is_running:
-            print("[ERROR] Failed to connect after multiple attempts. Giving up.")
+            logger.error("Failed to connect after multiple attempts. Giving up.")
             self.is_running = False
         return connected
 
     def _connect_websocket(self):
-        websocket_key = self._generate_websocket_key()
+        protocol = WebSocketProtocol(self.websocket_host, self.websocket_port, f"/?token={self.token}&clientID={self.client_id}")
         raw_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         raw_socket.settimeout(30)  # More reasonable timeout
         
@@ -101,16 +236,16 @@ class TradeXWebSocketClient:
         
         try:
             client_socket.connect((self.websocket_host, self.websocket_port))
-            print("[SUCCESS] Connected to WebSocket server!")
+            logger.info("Connected to WebSocket server %s:%s", self.websocket_host, self.websocket_port)
         except Exception as e:
-            print(f"[ERROR] Failed to connect: {e}")
+            logger.error("Failed to connect: %s", e)
             try:
                 client_socket.close()
             except:
                 pass
             return False
             
-        if not self._perform_handshake(client_socket, websocket_key):
+        if not self._perform_handshake(client_socket, protocol):
             try:
                 client_socket.shutdown(socket.SHUT_RDWR)
             except:
@@ -118,73 +253,53 @@ class TradeXWebSocketClient:
             client_socket.close()
             return False
             
+        # Closing the sending end of this pair wakes the receiver when the connection is dropped
+        wakeup_receiver, wakeup_sender = socket.socketpair()
         with self.connection_lock:
             self.client_socket = client_socket
+            self.protocol = protocol
+            self.receiver_wakeup = wakeup_sender
             
         # Start heartbeat thread
         self.heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
         self.heartbeat_thread.start()
         
         # Start receiver thread
-        self.receiver_thread = threading.Thread(target=self._receive_messages, daemon=True)
+        self.receiver_thread = threading.Thread(
+            target=self._receive_messages,
+            args=(client_socket, protocol, wakeup_receiver),
+            daemon=True
+        )
         self.receiver_thread.start()
         
         return True
 
-    def _perform_handshake(self, client_socket, websocket_key):
-        handshake_request = (
-            f"GET /?token={self.token}&clientID={self.client_id} HTTP/1.1\r\n"
-            f"Host: {self.websocket_host}:{self.websocket_port}\r\n"
-            f"Upgrade: websocket\r\n"
-            f"Connection: Upgrade\r\n"
-            f"Sec-WebSocket-Key: {websocket_key}\r\n"
-            f"Sec-WebSocket-Version: 13\r\n"
-            f"Origin: http://{self.websocket_host}\r\n"
-            f"\r\n"
-        )
-        
-        client_socket.send(handshake_request.encode())
+    def _perform_handshake(self, client_socket, protocol):
+        client_socket.sendall(protocol.handshake_request())
         
-        # Improved handshake response handling
-        response_buffer = bytearray()
+        # Frames the server sends right behind the headers stay buffered in the protocol
+        events = []
         start_time = time.time()
-        while time.time() - start_time < 10:  # 10 second timeout for handshake
+        while not events and time.time() - start_time < 10:  # 10 second timeout for handshake
             try:
-                chunk = client_socket.recv(4096)
-                if not chunk:
-                    break
-                response_buffer.extend(chunk)
-                
-                # Check if we've received the end of the headers
-                if b"\r\n\r\n" in response_buffer:
+                received = client_socket.recv_into(protocol.get_buffer())
+                if not received:
                     break
+                events = protocol.buffer_updated(received)
             except socket.timeout:
                 continue
                 
-        if not response_buffer:
-            print("[ERROR] No handshake response received.")
+        if not events:
+            logger.error("No handshake response received.")
             return False
             
-        response = response_buffer.decode(errors="ignore")
-        expected_accept_key = self._generate_accept_key(websocket_key)
-        
-        # Check for HTTP 101 status and accept key
-        if "HTTP/1.1 101" not in response or expected_accept_key.lower() not in response.lower():
-            print("[ERROR] WebSocket handshake failed.")
-            print("[SERVER] Server Response:\n", response)
+        if isinstance(events[0], HandshakeFailed):
+            logger.error("WebSocket handshake failed. Server response:\n%s", events[0].response)
             return False
             
-        print("[SUCCESS] WebSocket connection established successfully!")
+        logger.info("WebSocket connection established.")
         return True
 
-    def _generate_websocket_key(self):
-        key = "".join(random.choices(string.ascii_letters + string.digits, k=16))
-        return base64.b64encode(key.encode()).decode()
-
-    def _generate_accept_key(self, key):
-        hash_value = hashlib.sha1((key + self.websocket_magic_string).encode()).digest()
-        return base64.b64encode(hash_value).decode()
-
     def _heartbeat_loop(self):
         """Send periodic pings to keep the connection alive"""
         while self.is_running:
@@ -199,84 +314,79 @@ class TradeXWebSocketClient:
         with self.connection_lock:
             if self.client_socket:
                 try:
-                    ping_frame = struct.pack("B", 0x89) + struct.pack("B", 0)
-                    self.client_socket.send(ping_frame)
-                    print("[PING] Sent ping to server")
+                    self.client_socket.sendall(self.protocol.ping())
+                    logger.debug("Sent ping to server")
                 except Exception as e:
-                    print(f"[ERROR] Failed to send ping: {e}")
+                    logger.error("Failed to send ping: %s", e)
                     self._handle_connection_failure()
 
     def send_message(self, message):
         with self.connection_lock:
             if not self.client_socket:
-                print("[ERROR] Not connected. Cannot send message.")
+                logger.error("Not connected. Cannot send message.")
                 return False
             try:
-                self._send_websocket_message(self.client_socket, message)
-                print(f"[SENT] Sent message: {message}")
+                self.client_socket.sendall(self.protocol.text(message))
+                logger.debug("Sent message: %s", message)
                 return True
             except Exception as e:
-                print(f"[ERROR] Error sending message: {e}")
+                logger.error("Error sending message: %s", e)
                 self._handle_connection_failure()
                 return False
 
-    def _send_websocket_message(self, client_socket, message):
-        message_bytes = message.encode("utf-8", errors="replace")
-        message_length = len(message_bytes)
-        masking_key = os.urandom(4)
-        masked_message = bytearray(b ^ masking_key[i % 4] for i, b in enumerate(message_bytes))
+    def _receive_messages(self, client_socket, protocol, wakeup):
+        """Wait in the kernel until the socket is readable, then handle every event the bytes complete"""
+        selector = selectors.DefaultSelector()
+        selector.register(client_socket, selectors.EVENT_READ)
+        selector.register(wakeup, selectors.EVENT_READ)
         
-        if message_length < 126:
-            frame = struct.pack("B", 0x81) + struct.pack("B", 0x80 | message_length) + masking_key
-        elif message_length < 65536:
-            frame = struct.pack("B", 0x81) + struct.pack("B", 0x80 | 126) + struct.pack(">H", message_length) + masking_key
-        else:
-            frame = struct.pack("B", 0x81) + struct.pack("B", 0x80 | 127) + struct.pack(">Q", message_length) + masking_key
-            
-        client_socket.send(frame + masked_message)
-
-    def _receive_messages(self):
-        connection_error = False
-        
-        while self.is_running:
-            with self.connection_lock:
-                if not self.client_socket:
-                    time.sleep(0.1)
-                    continue
-                socket_ref = self.client_socket
-                
-            try:
-                if connection_error:
-                    # If we had a connection error before, check socket health
-                    socket_ref.settimeout(1)
-                    socket_ref.send(struct.pack("B", 0x89) + struct.pack("B", 0))  # Send ping
-                    connection_error = False
-                    socket_ref.settimeout(1)  # Short timeout for active reading
+        try:
+            # Frames that arrived together with the handshake are already buffered
+            self._handle_events(client_socket, protocol, protocol.next_events())
+            while self.is_running and self.client_socket is client_socket:
+                # TLS may hold already decrypted bytes that the selector cannot see
+                if not client_socket.pending():
+                    ready = selector.select()
+                    if any(key.fileobj is wakeup for key, _ in ready):
+                        break
                 
-                self._process_messages(socket_ref)
-            except socket.timeout:
-                # Timeout is expected, just continue
-                pass
-            except (ConnectionResetError, BrokenPipeError, OSError) as e:
-                print(f"[WARNING] Connection problem: {e}")
-                connection_error = True
-                if self.is_running:
-                    self._handle_connection_failure()
-            except Exception as e:
-                print(f"[WARNING] Receiver error: {e}")
-                connection_error = True
-                if self.is_running:
-                    self._handle_connection_failure()
-                    
-            time.sleep(0.01)  # Small sleep to prevent CPU spike
+                instrumentation = self.instrumentation
+                read_started = time.perf_counter_ns() if instrumentation.enabled else 0
+                try:
+                    received = client_socket.recv_into(protocol.get_buffer())
+                except socket.timeout:
+                    continue
+                if not received:
+                    raise ConnectionResetError("Connection closed by server")
+                events = protocol.buffer_updated(received)
+                if read_started:
+                    instrumentation.record(WEBSOCKET, "frame", "read", time.perf_counter_ns() - read_started)
+                self._handle_events(client_socket, protocol, events)
+        except (ConnectionResetError, BrokenPipeError, OSError) as e:
+            if self.is_running and self.client_socket is client_socket:
+                logger.warning("Connection problem: %s", e)
+                self._handle_connection_failure()
+        except Exception as e:
+            if self.is_running and self.client_socket is client_socket:
+                logger.warning("Receiver error: %s", e, exc_info=True)
+                self._handle_connection_failure()
+        finally:
+            selector.close()
+            wakeup.close()
             
-        print("[INFO] Receiver thread terminated.")
+        logger.debug("Receiver thread terminated.")
+
+    def _wake_receiver(self):
+        """Wake the receiver thread of the current connection. Called with connection_lock held."""
+        if self.receiver_wakeup:
+            self.receiver_wakeup.close()
+            self.receiver_wakeup = None
 
     def _handle_connection_failure(self):
         if self.reconnecting:
             return
             
-        print("[INFO] Connection lost. Attempting to reconnect...")
+        logger.warning("Connection lost. Attempting to reconnect...")
         
         with self.connection_lock:
             if self.client_socket:
@@ -289,180 +399,96 @@ class TradeXWebSocketClient:
                 except:
                     pass
                 self.client_socket = None
+            self._wake_receiver()
                 
         if self.is_running:
             # Use a separate thread for reconnection to avoid blocking
             reconnect_thread = threading.Thread(target=self._connect_with_retry, daemon=True)
             reconnect_thread.start()
 
-    def _process_messages(self, client_socket):
-        """Process incoming WebSocket messages"""
-        buffer = bytearray()
-        frame_buffer = bytearray()
-        is_fragmented = False
-        
-        # Set socket to non-blocking with a reasonable timeout
-        client_socket.settimeout(1)
-        
-        # Process messages until timeout or error
-        while self.is_running:
+    def _handle_events(self, client_socket, protocol, events):
+        """Act on the protocol events decoded from the received bytes"""
+        for event in events:
             try:
-                # Read header (2 bytes minimum)
-                header = self._read_exactly(client_socket, 2)
-                if not header or len(header) < 2:
-                    # Could be a timeout, which is normal
-                    return
-                
-                first_byte, second_byte = header[0], header[1]
-                fin = (first_byte & 0x80) >> 7
-                opcode = first_byte & 0x0F
-                masked = (second_byte & 0x80) >> 7
-                payload_length = second_byte & 0x7F
-                
-                # Handle control frames immediately
-                if opcode == 8:  # Close frame
-                    print("[INFO] WebSocket connection closed by server.")
+                if isinstance(event, Message):
+                    if event.data:
+                        self._handle_message(event.data)
+                elif isinstance(event, Ping):
+                    # Respond with pong
+                    client_socket.sendall(protocol.pong(event.payload))
+                elif isinstance(event, Pong):
+                    logger.debug("Received pong from server")
+                elif isinstance(event, Close):
+                    logger.info("WebSocket connection closed by server.")
                     self._handle_connection_failure()
                     return
-                elif opcode == 9:  # Ping
-                    # Respond with pong
-                    pong_frame = struct.pack("B", 0x8A) + struct.pack("B", 0)
-                    client_socket.send(pong_frame)
-                    continue
-                elif opcode == 10:  # Pong
-                    print("[PONG] Received pong from server")
-                    continue
-                
-                # Read extended payload length if needed
-                if payload_length == 126:
-                    ext_length = self._read_exactly(client_socket, 2)
-                    if not ext_length or len(ext_length) < 2:
-                        return
-                    payload_length = struct.unpack(">H", ext_length)[0]
-                elif payload_length == 127:
-                    ext_length = self._read_exactly(client_socket, 8)
-                    if not ext_length or len(ext_length) < 8:
-                        return
-                    payload_length = struct.unpack(">Q", ext_length)[0]
-                
-                # Read masking key if present
-                mask = None
-                if masked:
-                    mask = self._read_exactly(client_socket, 4)
-                    if not mask or len(mask) < 4:
-                        return
-                
-                # Read payload data
-                if payload_length > 0:
-                    payload_data = self._read_exactly(client_socket, payload_length)
-                    if not payload_data or len(payload_data) != payload_length:
-                        print(f"[ERROR] Incomplete message received. Got {len(payload_data) if payload_data else 0}, expected {payload_length}")
-                        return
-                    
-                    # Unmask data if needed
-                    if masked and mask:
-                        payload_data = bytearray(payload_data[i] ^ mask[i % 4] for i in range(payload_length))
-                    
-                    # Continuation frame or new message
-                    if opcode == 0:  # Continuation frame
-                        frame_buffer.extend(payload_data)
-                    elif opcode == 1:  # Text frame
-                        if is_fragmented:
-                            print("[WARNING] Received new text frame while processing fragmented message")
-                            frame_buffer.clear()
-                        frame_buffer.extend(payload_data)
-                        is_fragmented = not fin
-                    elif opcode == 2:  # Binary frame
-                        if is_fragmented:
-                            print("[WARNING] Received new binary frame while processing fragmented message")
-                            frame_buffer.clear()
-                        frame_buffer.extend(payload_data)
-                        is_fragmented = not fin
-                
-                # Process complete message if FIN bit is set
-                if fin and frame_buffer:
-                    try:
-                        decoded_message = frame_buffer.decode("utf-8", errors="replace")
-                        try:
-                            json_data = json.loads(decoded_message)
-                            
-                            # Extract the message type from the top level
-                            message_type = json_data.get("eventType")
-                            print(f"[RECEIVED] Event type: {message_type}")
-                            
-                            data = json_data
-                            
-                            if message_type == "order":
-                                data = OrderBookData(**json_data.get("data", {}))
-                            elif message_type == "trade":
-                                data = TradesBookData(**json_data.get("data", {}))
-                            
-                            # Process callbacks in a separate thread to avoid blocking the receiver
-                            if message_type and message_type in self.callbacks:
-                                callback_thread = threading.Thread(
-                                    target=self._execute_callback,
-                                    args=(message_type, data),
-                                    daemon=True
-                                )
-                                callback_thread.start()
-                            else:
-                                print(f"[INFO] No callback registered for event type: {message_type}")
-                                
-                        except json.JSONDecodeError:
-                            print(f"[RECEIVED] Received non-JSON message: {decoded_message[:100]}...")
-                    except UnicodeDecodeError:
-                        print("[WARNING] Received binary data, not displaying")
-                    finally:
-                        frame_buffer.clear()
-                        is_fragmented = False
-                        
-            except socket.timeout:
-                # Timeout is normal for non-blocking operation
-                return
+            except ConnectionError:
+                raise
             except Exception as e:
-                print(f"[WARNING] Error processing message: {e}")
-                return
+                # The frame has been consumed, so carry on with the next one
+                logger.warning("Error processing message: %s", e, exc_info=True)
 
-    def _execute_callback(self, message_type, data):
-        """Execute callback in a separate thread"""
+    def _handle_message(self, message):
+        instrumentation = self.instrumentation
+        started = time.perf_counter_ns() if instrumentation.enabled else 0
         try:
-            self.callbacks[message_type](data)
-        except Exception as e:
-            print(f"[ERROR] Callback execution failed for {message_type}: {e}")
-
-    def _read_exactly(self, sock, n):
-        """Read exactly n bytes from the socket"""
-        if n <= 0:
-            return bytearray()
-        
-        data = bytearray()
-        remaining = n
+            json_data = json.loads(message.decode("utf-8", errors="replace"))
+        except json.JSONDecodeError:
+            logger.warning("Received non-JSON message: %r...", message[:100])
+            return
+        message_type = json_data.get("eventType")
+        if started:
+            instrumentation.record(WEBSOCKET, str(message_type), "decode", time.perf_counter_ns() - started)
+        logger.debug("Received %s event", message_type)
         
-        # Use the socket's current timeout
-        start_time = time.time()
-        timeout = sock.gettimeout() or 30
+        # Subscriber filters and the resync check run on the decoded JSON, before any model is built
+        fields = event_fields(message_type, json_data)
+        subscriptions = self.bus.match(message_type, fields)
+        resync = self.resync
+        if resync is not None and not resync.observe(message_type, fields):
+            logger.debug("Dropped duplicate %s event", message_type)
+            return
+        response_cache = self.response_cache
+        if response_cache is not None:
+            response_cache.invalidate_event(message_type)
+        if not subscriptions and not self._is_tracked(message_type):
+            if not self.bus.has_subscribers(message_type):
+                logger.debug("No callback registered for event type: %s", message_type)
+            return
+        started = time.perf_counter_ns() if instrumentation.enabled else 0
+        data = build_event(message_type, json_data, self.validation)
+        if started:
+            instrumentation.record(WEBSOCKET, str(message_type), "model", time.perf_counter_ns() - started)
+        self._dispatch_event(message_type, data, subscriptions)
+
+    def _is_tracked(self, message_type):
+        """Whether the order store or position engine needs events of this type"""
+        if message_type == "order":
+            return self.order_store is not None
+        if message_type == "trade":
+            return self.position_engine is not None
+        return False
+
+    def _dispatch_event(self, message_type, data, subscriptions=None):
+        """Apply a built event, received or replayed, to the store, engine and subscribers"""
+        # The store and engine are updated on the receiver thread so they see events in arrival order
+        order_store = self.order_store
+        if order_store is not None and message_type == "order":
+            order_store.update(data)
+        position_engine = self.position_engine
+        if position_engine is not None and message_type == "trade":
+            position_engine.apply_trade(data)
         
-        while remaining > 0 and (time.time() - start_time) < timeout:
-            try:
-                chunk = sock.recv(remaining)
-                if not chunk:  # Connection closed
-                    return None
-                data.extend(chunk)
-                remaining -= len(chunk)
-                
-                if remaining == 0:
-                    return data
-                    
-            except socket.timeout:
-                # Check if we should continue waiting
-                if not self.is_running:
-                    return None
-                # Raise timeout if we've exceeded our limit
-                if (time.time() - start_time) >= timeout:
-                    raise socket.timeout("Timed out waiting for data")
-            
-        # If we got here without returning, we didn't get all the data
-        if remaining > 0:
-            return None
-            
-        return data
\ No newline at end of file
+        if subscriptions is None:
+            subscriptions = self.bus.match(message_type, self._filter_fields(data))
+        # Run callbacks on the dispatcher workers to avoid blocking the receiver
+        for subscription in subscriptions:
+            if subscription.queue is not None:
+                subscription.queue.put(message_type, data)
+            else:
+                self.dispatcher.dispatch(message_type, subscription.callback, data)
+
+    def _filter_fields(self, data):
+        if isinstance(data, dict):
+            return data
+        return {name: getattr(data, name, None) for name in ("exchange", "code", "client", "status", "order_status")}
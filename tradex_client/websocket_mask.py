@@ -0,0 +1,50 @@
+np = None
+_numpy_checked = False
+
+# Below this size the big-integer XOR is faster than setting up NumPy arrays.
+NUMPY_THRESHOLD = 4096
+
+def _import_numpy():
+    """
+    Import NumPy on first use if it is installed. Masking falls back to plain Python without it.
+    """
+    global np, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy as numpy_module
+            np = numpy_module
+        except ImportError:
+            np = None
+        _numpy_checked = True
+    return np
+
+def mask_payload(payload, mask: bytes):
+    """
+    XOR a WebSocket payload with its 4-byte masking key.
+
+    Masking and unmasking are the same operation. The payload is XORed as whole words
+    instead of byte by byte: as one big integer for small payloads, and as 8-byte lanes
+    with NumPy for large payloads when NumPy is installed.
+
+    Args:
+        payload: Bytes-like payload (bytes, bytearray or memoryview)
+        mask (bytes): 4-byte masking key
+
+    Returns:
+        bytes: The masked or unmasked payload
+    """
+    length = len(payload)
+    if not length:
+        return b""
+
+    if length >= NUMPY_THRESHOLD and _import_numpy() is not None:
+        data = np.frombuffer(payload, dtype=np.uint8)
+        result = np.empty(length, dtype=np.uint8)
+        lanes = length // 8 * 8
+        key = mask * 2
+        result[:lanes].view(np.uint64)[:] = data[:lanes].view(np.uint64) ^ np.frombuffer(key, dtype=np.uint64)[0]
+        result[lanes:] = data[lanes:] ^ np.frombuffer(key, dtype=np.uint8)[:length - lanes]
+        return result.tobytes()
+
+    key = (mask * (length // 4 + 1))[:length]
+    return (int.from_bytes(payload, "little") ^ int.from_bytes(key, "little")).to_bytes(length, "little")
@@ -0,0 +1,292 @@
+import base64
+import hashlib
+import os
+import random
+import string
+import struct
+from typing import NamedTuple, Optional
+
+from .websocket_mask import mask_payload
+
+WEBSOCKET_MAGIC_STRING = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# Larger handshake responses are rejected instead of buffered without limit.
+MAX_HANDSHAKE_SIZE = 65536
+
+CONNECTING = "connecting"
+OPEN = "open"
+CLOSED = "closed"
+
+class HandshakeComplete(NamedTuple):
+    """The server accepted the upgrade; frames follow."""
+
+class HandshakeFailed(NamedTuple):
+    """The server rejected the upgrade or answered with something else."""
+    response: str
+
+class Message(NamedTuple):
+    """A complete, unmasked and reassembled text (opcode 1) or binary (opcode 2) message."""
+    opcode: int
+    data: bytes
+
+class Ping(NamedTuple):
+    payload: bytes
+
+class Pong(NamedTuple):
+    payload: bytes
+
+class Close(NamedTuple):
+    code: Optional[int]
+    reason: str
+
+class WebSocketProtocol:
+    """
+    Client side of the WebSocket protocol, without any I/O.
+
+    Transports hand received bytes to the protocol and get protocol events back; they
+    also ask it for the bytes to send. The protocol covers the opening handshake,
+    framing, masking of outgoing frames, reassembly of fragmented messages and control
+    frames. Frames may be split across reads in any way.
+
+    Received bytes are either copied in with `feed(data)`, or received straight into the
+    protocol's buffer: `sock.recv_into(protocol.get_buffer())` followed by
+    `protocol.buffer_updated(n)`. Both return the list of events completed by the new
+    bytes. The call that completes the handshake returns only HandshakeComplete or
+    HandshakeFailed; frames that arrived behind the handshake are returned by the next
+    call, or by `next_events()`. After that the events are Message, Ping, Pong and
+    Close. After a Close or a failed handshake the protocol is closed and ignores
+    further bytes.
+
+    Attributes:
+        host (str): Server host, sent in the Host and Origin headers
+        port (int): Server port
+        resource (str): Request target of the upgrade request, e.g. "/?token=..."
+        state (str): CONNECTING, OPEN or CLOSED
+    """
+    def __init__(self, host: str, port: int, resource: str="/", buffer_size: int=65536):
+        self.host = host
+        self.port = port
+        self.resource = resource
+        self.state = CONNECTING
+        self.key = base64.b64encode("".join(random.choices(string.ascii_letters + string.digits, k=16)).encode()).decode()
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.start = 0
+        self.end = 0
+        self.needed = 2
+        self.fragments = bytearray()
+        self.fragment_opcode = None
+
+    # -------------------------------------------------------------------------
+    # OUTGOING
+    # -------------------------------------------------------------------------
+
+    def handshake_request(self):
+        """
+        Return the HTTP upgrade request that opens the connection.
+        """
+        return (
+            f"GET {self.resource} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Upgrade: websocket\r\n"
+            f"Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {self.key}\r\n"
+            f"Sec-WebSocket-Version: 13\r\n"
+            f"Origin: http://{self.host}\r\n"
+            f"\r\n"
+        ).encode()
+
+    def text(self, message: str):
+        """
+        Return a masked text frame carrying `message`.
+        """
+        return self.frame(0x1, message.encode("utf-8", errors="replace"))
+
+    def ping(self, payload: bytes=b""):
+        return self.frame(0x9, payload)
+
+    def pong(self, payload: bytes=b""):
+        return self.frame(0xA, payload)
+
+    def close(self, code: int=None):
+        """
+        Return a masked close frame and mark the protocol closed.
+        """
+        self.state = CLOSED
+        return self.frame(0x8, struct.pack(">H", code) if code is not None else b"")
+
+    def frame(self, opcode: int, payload: bytes):
+        """
+        Return a single masked frame, as every frame sent by a client must be.
+        """
+        masking_key = os.urandom(4)
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, 0x80 | length)
+        elif length < 65536:
+            header = struct.pack("!BBH", 0x80 | opcode, 0x80 | 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 0x80 | 127, length)
+        return header + masking_key + mask_payload(payload, masking_key)
+
+    # -------------------------------------------------------------------------
+    # INCOMING
+    # -------------------------------------------------------------------------
+
+    def feed(self, data):
+        """
+        Add received bytes and return the events they complete.
+
+        Args:
+            data: Bytes-like chunk of the stream
+
+        Returns:
+            list: Protocol events
+        """
+        length = len(data)
+        if self.end + length > len(self.buffer):
+            self._make_room(self.end - self.start + length)
+        self.buffer[self.end:self.end + length] = data
+        self.end += length
+        return self.next_events()
+
+    def get_buffer(self):
+        """
+        Return a writable view of the free end of the receive buffer, for `recv_into`.
+
+        The buffer is compacted or grown first so that the frame being received fits.
+        Call `buffer_updated` with the number of bytes written.
+        """
+        if self.end == len(self.buffer) or self.start + self.needed > len(self.buffer):
+            self._make_room(max(self.needed, self.end - self.start + 1))
+        return self.view[self.end:]
+
+    def buffer_updated(self, nbytes: int):
+        """
+        Account for `nbytes` written into the view from `get_buffer` and return the events they complete.
+        """
+        self.end += nbytes
+        return self.next_events()
+
+    def next_events(self):
+        """
+        Return the events completed by the bytes already buffered.
+        """
+        events = []
+        if self.state == CONNECTING:
+            # The handshake result is returned on its own so the transport can finish setting up first
+            self._parse_handshake(events)
+            return events
+        while self.state == OPEN:
+            frame = self._next_frame()
+            if frame is None:
+                break
+            self._handle_frame(frame, events)
+        if self.start == self.end:
+            self.start = self.end = 0
+        return events
+
+    def _parse_handshake(self, events):
+        header_end = self.buffer.find(b"\r\n\r\n", self.start, self.end)
+        if header_end < 0:
+            if self.end - self.start > MAX_HANDSHAKE_SIZE:
+                self.state = CLOSED
+                events.append(HandshakeFailed(bytes(self.view[self.start:self.end]).decode(errors="ignore")))
+            return
+
+        response = bytes(self.view[self.start:header_end + 4]).decode(errors="ignore")
+        self.start = header_end + 4
+        expected_accept_key = base64.b64encode(hashlib.sha1((self.key + WEBSOCKET_MAGIC_STRING).encode()).digest()).decode()
+        if "HTTP/1.1 101" not in response or expected_accept_key.lower() not in response.lower():
+            self.state = CLOSED
+            events.append(HandshakeFailed(response))
+            return
+        self.state = OPEN
+        events.append(HandshakeComplete())
+
+    def _next_frame(self):
+        """
+        Return (fin, opcode, payload) for the next frame complete in the buffer, or None.
+
+        The payload is unmasked; it is a memoryview of the buffer when it was not masked.
+        """
+        available = self.end - self.start
+        if available < 2:
+            self.needed = 2
+            return None
+        first_byte = self.buffer[self.start]
+        second_byte = self.buffer[self.start + 1]
+        payload_length = second_byte & 0x7F
+        masked = second_byte & 0x80
+
+        header_length = 2
+        if payload_length == 126:
+            header_length = 4
+        elif payload_length == 127:
+            header_length = 10
+        if masked:
+            header_length += 4
+        if available < header_length:
+            self.needed = header_length
+            return None
+
+        if payload_length == 126:
+            payload_length = struct.unpack_from(">H", self.buffer, self.start + 2)[0]
+        elif payload_length == 127:
+            payload_length = struct.unpack_from(">Q", self.buffer, self.start + 2)[0]
+        if available < header_length + payload_length:
+            self.needed = header_length + payload_length
+            return None
+
+        payload_start = self.start + header_length
+        payload = self.view[payload_start:payload_start + payload_length]
+        if masked:
+            payload = mask_payload(payload, bytes(self.view[payload_start - 4:payload_start]))
+        self.start = payload_start + payload_length
+        self.needed = 2
+        return first_byte & 0x80, first_byte & 0x0F, payload
+
+    def _handle_frame(self, frame, events):
+        fin, opcode, payload = frame
+        if opcode == 0x1 or opcode == 0x2:
+            if self.fragment_opcode is not None:
+                # A new data frame while a fragmented message is open drops the unfinished message
+                self.fragments.clear()
+                self.fragment_opcode = None
+            if fin:
+                events.append(Message(opcode, bytes(payload)))
+            else:
+                self.fragment_opcode = opcode
+                self.fragments.extend(payload)
+        elif opcode == 0x0:
+            if self.fragment_opcode is None:
+                return
+            self.fragments.extend(payload)
+            if fin:
+                events.append(Message(self.fragment_opcode, bytes(self.fragments)))
+                self.fragments.clear()
+                self.fragment_opcode = None
+        elif opcode == 0x8:
+            self.state = CLOSED
+            code = struct.unpack(">H", payload[:2])[0] if len(payload) >= 2 else None
+            events.append(Close(code, bytes(payload[2:]).decode("utf-8", errors="replace")))
+        elif opcode == 0x9:
+            events.append(Ping(bytes(payload)))
+        elif opcode == 0xA:
+            events.append(Pong(bytes(payload)))
+
+    def _make_room(self, needed):
+        """
+        Move the unconsumed bytes to the front of the buffer, growing it if `needed` bytes do not fit.
+        """
+        pending = self.end - self.start
+        if needed > len(self.buffer):
+            buffer = bytearray(max(needed, len(self.buffer) * 2))
+            buffer[:pending] = self.view[self.start:self.end]
+            self.buffer = buffer
+            self.view = memoryview(buffer)
+        else:
+            # The ranges can overlap, so the pending bytes (less than one frame) are copied out first.
+            self.buffer[:pending] = bytes(self.view[self.start:self.end])
+        self.start = 0
+        self.end = pending